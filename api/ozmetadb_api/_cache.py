@@ -0,0 +1,20 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Tuple
+from . import storage
+
+_entries: Dict[str, Tuple[int, Any]] = {}
+
+def cached_json(path: Path | str) -> Any:
+    """Parse a static JSON file once; reload only when its mtime changes.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    key = str(path)
+    mtime = Path(key).stat().st_mtime_ns
+    hit = _entries.get(key)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    obj = storage.read_json(Path(key))
+    _entries[key] = (mtime, obj)
+    return obj
@@ -1,29 +1,75 @@
 from __future__ import annotations
-import copy, json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple
-from jsonschema import validate
+from functools import lru_cache
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from jsonschema.exceptions import ValidationError
+from jsonschema.validators import validator_for
+try:
+    import jsonschema_rs  # type: ignore
+    JSONSCHEMA_RS_AVAILABLE = True
+    _VALIDATION_ERRORS: Tuple[type, ...] = (ValidationError, jsonschema_rs.ValidationError)
+except ImportError:
+    JSONSCHEMA_RS_AVAILABLE = False
+    _VALIDATION_ERRORS = (ValidationError,)
 from .config import settings
 from . import storage
+from ._cache import cached_json
 
 def _now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 def load_schema() -> Dict[str, Any]:
-    from pathlib import Path
-    return json.loads(Path(settings.schema_path).read_text(encoding="utf-8"))
+    return cached_json(settings.schema_path)
 
-def validate_snapshot(snapshot: Dict[str, Any]) -> Tuple[bool, List[str]]:
-    schema = load_schema()
+def _partial_schema(schema: Dict[str, Any], objects_keys: FrozenSet[str]) -> Dict[str, Any]:
+    # envelope rules stay as-is; under "objects" only the given sections are
+    # checked (definitions are kept so their $refs still resolve). Untouched
+    # sections accept anything but stay declared, so additionalProperties and
+    # required (narrowed to the given sections) still apply
+    objects = schema["properties"]["objects"]
+    sub = dict(objects)
+    sub["properties"] = {k: (v if k in objects_keys else True) for k, v in objects.get("properties", {}).items()}
+    if "required" in objects:
+        sub["required"] = [k for k in objects["required"] if k in objects_keys]
+    props = dict(schema["properties"])
+    props["objects"] = sub
+    return {**schema, "properties": props}
+
+@lru_cache(maxsize=16)
+def _build_validator(schema_path: str, mtime_ns: int, objects_keys: Optional[FrozenSet[str]] = None):
+    # mtime_ns is part of the cache key only, so editing the schema file reloads it
+    schema = cached_json(schema_path)
+    if objects_keys is not None:
+        schema = _partial_schema(schema, objects_keys)
+    if JSONSCHEMA_RS_AVAILABLE:
+        return jsonschema_rs.validator_for(schema)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+def _get_validator(objects_keys: Optional[FrozenSet[str]] = None):
+    path = settings.schema_path
+    return _build_validator(path, Path(path).stat().st_mtime_ns, objects_keys)
+
+def validate_snapshot(snapshot: Dict[str, Any], objects_keys: Optional[Iterable[str]] = None) -> Tuple[bool, List[str]]:
+    """Validate against the snapshot schema.
+
+    With objects_keys, only the envelope and those objects.* sections are
+    checked; the rest of the snapshot is assumed to be unchanged and valid.
+    """
+    validator = _get_validator(frozenset(objects_keys) if objects_keys is not None else None)
     try:
-        validate(instance=snapshot, schema=schema)
+        validator.validate(snapshot)
         return True, []
-    except ValidationError as e:
+    except _VALIDATION_ERRORS as e:
         return False, [str(e)]
 
 def _ensure_envelope(snapshot: Dict[str, Any], project: Dict[str, Any]) -> Dict[str, Any]:
-    s = copy.deepcopy(snapshot) if snapshot else {}
+    # shallow copy: callers pass a freshly loaded snapshot they own, and only
+    # top-level defaults are added here
+    s = dict(snapshot) if snapshot else {}
     s.setdefault("snapshotVersion", 1)
     s.setdefault("generatedAtUTC", _now())
     s.setdefault("clientCode", project.get("clientCode", "UNK"))
@@ -32,66 +78,140 @@ def _ensure_envelope(snapshot: Dict[str, Any], project: Dict[str, Any]) -> Dict[
     s.setdefault("source", {"exporter":"control-plane"})
     return s
 
+class _ApplyContext:
+    """Mutable state shared by the action handlers during one apply."""
+
+    def __init__(self, objects: Dict[str, Any]):
+        self.objects = objects
+        model = objects.setdefault("model", {"tables": []})
+        self.tables = model.setdefault("tables", [])
+        self.tables_idx: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        for t in self.tables:
+            self.tables_idx.setdefault((t.get("schema"), t.get("code")), t)
+        self.fields_idx: Dict[int, Dict[Any, Dict[str, Any]]] = {}
+        self.enum_codes: Optional[set] = None
+        self.workflow_codes: Optional[set] = None
+        self.touched = {"model"}
+
+    def find_table(self, schema: str, code: str) -> Optional[Dict[str, Any]]:
+        return self.tables_idx.get((schema, code))
+
+    def add_table(self, tb: Dict[str, Any]) -> None:
+        self.tables.append(tb)
+        self.tables_idx[(tb["schema"], tb["code"])] = tb
+
+    def table_fields(self, tb: Dict[str, Any]) -> Dict[Any, Dict[str, Any]]:
+        idx = self.fields_idx.get(id(tb))
+        if idx is None:
+            idx = {}
+            for f in tb.get("fields", []):
+                idx.setdefault(f.get("code"), f)
+            self.fields_idx[id(tb)] = idx
+        return idx
+
+def _do_create_table(ctx: _ApplyContext, batch: Iterable[Dict[str, Any]]) -> None:
+    for a in batch:
+        payload = a.get("payload", {})
+        schema = payload.get("schema","dp")
+        code = payload["code"]
+        if not ctx.find_table(schema, code):
+            ctx.add_table({"schema": schema, "code": code, "fields": payload.get("fields", [])})
+
+def _do_create_field(ctx: _ApplyContext, batch: Iterable[Dict[str, Any]]) -> None:
+    for a in batch:
+        target = a.get("target", {})
+        field = a.get("payload", {})
+        schema = target.get("schema","dp")
+        table = target.get("tableCode")
+        tb = ctx.find_table(schema, table)
+        if tb is None:
+            tb = {"schema": schema, "code": table, "fields": []}
+            ctx.add_table(tb)
+        fidx = ctx.table_fields(tb)
+        code = field.get("code")
+        if code not in fidx:
+            tb.setdefault("fields", []).append(field)
+            fidx[code] = field
+
+def _do_update_field(ctx: _ApplyContext, batch: Iterable[Dict[str, Any]]) -> None:
+    for a in batch:
+        target = a.get("target", {})
+        field_code = target.get("fieldCode")
+        tb = ctx.find_table(target.get("schema","dp"), target.get("tableCode"))
+        if tb:
+            fidx = ctx.table_fields(tb)
+            f = fidx.get(field_code)
+            if f is not None:
+                f.update(a.get("payload", {}))
+                if f.get("code") != field_code:
+                    del fidx[field_code]
+                    fidx.setdefault(f.get("code"), f)
+
+def _do_create_enum(ctx: _ApplyContext, batch: Iterable[Dict[str, Any]]) -> None:
+    enums = ctx.objects.setdefault("enums", {"enums": [], "values": []})
+    ctx.touched.add("enums")
+    enum_list = enums["enums"]
+    if ctx.enum_codes is None:
+        ctx.enum_codes = {e.get("code") for e in enum_list}
+    for a in batch:
+        payload = a.get("payload", {})
+        code = payload.get("code")
+        if code not in ctx.enum_codes:
+            enum_list.append(payload)
+            ctx.enum_codes.add(code)
+
+def _do_create_workflow(ctx: _ApplyContext, batch: Iterable[Dict[str, Any]]) -> None:
+    wfs = ctx.objects.setdefault("workflows", {"workflows": [], "states": [], "transitions": []})
+    ctx.touched.add("workflows")
+    wf_list = wfs["workflows"]
+    if ctx.workflow_codes is None:
+        ctx.workflow_codes = {w.get("code") for w in wf_list}
+    for a in batch:
+        payload = a.get("payload", {})
+        code = payload.get("code")
+        if code not in ctx.workflow_codes:
+            wf_list.append(payload)
+            ctx.workflow_codes.add(code)
+
+# v1: other action types are accepted but no-op
+_HANDLERS = {
+    "CreateTable": _do_create_table,
+    "CreateField": _do_create_field,
+    "UpdateField": _do_update_field,
+    "CreateEnum": _do_create_enum,
+    "CreateWorkflow": _do_create_workflow,
+}
+
 def apply_change_request(project_id: str, cr: Dict[str, Any]) -> Dict[str, Any]:
     project = storage.get_project(project_id)
     if not project:
         raise ValueError("project not found")
-    base = storage.get_snapshot(project_id) or {}
+    base = storage.get_snapshot(project_id, private=True) or {}
     snap = _ensure_envelope(base, project)
 
     current_version = int(snap.get("snapshotVersion", 1))
     new_version = current_version + 1
 
-    objects = snap.setdefault("objects", {})
-    model = objects.setdefault("model", {"tables": []})
-    tables = model.setdefault("tables", [])
-
-    def find_table(schema: str, code: str):
-        for t in tables:
-            if t.get("schema")==schema and t.get("code")==code:
-                return t
-        return None
+    ctx = _ApplyContext(snap.setdefault("objects", {}))
 
-    actions = sorted(cr.get("actions", []), key=lambda a: (int(a.get("order",0)), a.get("actionId","")))
-    for a in actions:
-        t = a.get("type")
-        target = a.get("target", {})
-        payload = a.get("payload", {})
-        if t == "CreateTable":
-            schema = payload.get("schema","dp")
-            code = payload["code"]
-            if not find_table(schema, code):
-                tables.append({"schema": schema, "code": code, "fields": payload.get("fields", [])})
-        elif t == "CreateField":
-            schema = target.get("schema","dp")
-            table = target.get("tableCode")
-            field = payload
-            tb = find_table(schema, table) or {"schema": schema, "code": table, "fields": []}
-            if tb not in tables: tables.append(tb)
-            if not any(f.get("code")==field.get("code") for f in tb.get("fields", [])):
-                tb.setdefault("fields", []).append(field)
-        elif t == "UpdateField":
-            schema = target.get("schema","dp")
-            table = target.get("tableCode")
-            field_code = target.get("fieldCode")
-            tb = find_table(schema, table)
-            if tb:
-                for f in tb.get("fields", []):
-                    if f.get("code")==field_code:
-                        f.update(payload)
-        elif t == "CreateEnum":
-            enums = objects.setdefault("enums", {"enums": [], "values": []})
-            if not any(e.get("code")==payload.get("code") for e in enums.get("enums", [])):
-                enums["enums"].append(payload)
-        elif t == "CreateWorkflow":
-            wfs = objects.setdefault("workflows", {"workflows": [], "states": [], "transitions": []})
-            if not any(w.get("code")==payload.get("code") for w in wfs.get("workflows", [])):
-                wfs["workflows"].append(payload)
-        # v1: accept other action types but no-op
+    # decorate once and sort through a C-level key; the CR's action dicts are
+    # persisted after apply, so no sort keys are stored on them
+    raw_actions = cr.get("actions", [])
+    sort_keys = [(int(a.get("order",0)), a.get("actionId","")) for a in raw_actions]
+    actions = [raw_actions[i] for i in sorted(range(len(raw_actions)), key=sort_keys.__getitem__)]
+    # consecutive actions of the same type are handled as one batch so per-type
+    # setup runs once per run; batching never reorders actions across types
+    for t, batch in groupby(actions, key=lambda a: a.get("type")):
+        h = _HANDLERS.get(t)
+        if h:
+            h(ctx, batch)
 
     snap["snapshotVersion"] = new_version
     snap["generatedAtUTC"] = _now()
-    ok, errs = validate_snapshot(snap)
+    # a stored snapshot was validated when it was saved, so only the sections
+    # this CR touched need checking; a brand-new snapshot is checked in full
+    full = settings.full_validate or not base
+    ok, errs = validate_snapshot(snap, None if full else ctx.touched)
     if not ok:
         raise ValueError("snapshot validation failed: " + "; ".join(errs))
     storage.save_snapshot(project_id, snap)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Any, Dict, List
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Dict
+import orjson
 import uuid
 from datetime import datetime, timezone
 from . import storage
@@ -9,7 +11,12 @@ from .apply_engine import apply_change_request
 from .compiler_trigger import compile_project
 from .wizard_runtime import start_wizard, answer as wiz_answer, preview_change_request
 
-app = FastAPI(title="OZMetaDB Control Plane API", version="0.1")
+class OrjsonResponse(JSONResponse):
+    # local equivalent of fastapi.responses.ORJSONResponse, which newer FastAPI deprecates
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(title="OZMetaDB Control Plane API", version="0.1", default_response_class=OrjsonResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,31 +34,33 @@ def _startup():
     if not storage.list_projects():
         pj = {"projectId": str(uuid.uuid4()), "clientCode":"SFO", "projectCode":"CaseMgmt", "createdAtUTC": _now()}
         storage.save_project(pj)
-        import pathlib, json
+        import pathlib
         sample = pathlib.Path("../exports/samples/sample.snapshot.json")
-        storage.save_snapshot(pj["projectId"], json.loads(sample.read_text(encoding="utf-8")))
+        storage.save_snapshot(pj["projectId"], storage.read_json(sample))
+
+# Hot GETs return stored JSON as-is, bypassing response-model validation and jsonable_encoder.
 
-@app.get("/v1/projects")
-def projects() -> List[Dict[str, Any]]:
-    return storage.list_projects()
+@app.get("/v1/projects", response_model=None)
+def projects() -> Response:
+    return OrjsonResponse(storage.list_projects())
 
-@app.get("/v1/projects/{projectId}/snapshot")
-def project_snapshot(projectId: str) -> Dict[str, Any]:
-    s = storage.get_snapshot(projectId)
-    if not s:
+@app.get("/v1/projects/{projectId}/snapshot", response_model=None)
+def project_snapshot(projectId: str) -> Response:
+    raw = storage.get_snapshot_bytes(projectId)
+    if not raw:
         raise HTTPException(404, "snapshot not found")
-    return s
+    return Response(content=raw, media_type="application/json")
 
-@app.get("/v1/change-requests")
-def change_requests(projectId: str | None = None) -> List[Dict[str, Any]]:
-    return storage.list_change_requests(projectId)
+@app.get("/v1/change-requests", response_model=None)
+def change_requests(projectId: str | None = None) -> Response:
+    return OrjsonResponse(storage.list_change_requests(projectId))
 
-@app.get("/v1/change-requests/{crId}")
-def get_cr(crId: str) -> Dict[str, Any]:
-    cr = storage.get_change_request(crId)
-    if not cr:
+@app.get("/v1/change-requests/{crId}", response_model=None)
+def get_cr(crId: str) -> Response:
+    raw = storage.get_change_request_bytes(crId)
+    if not raw:
         raise HTTPException(404, "change request not found")
-    return cr
+    return Response(content=raw, media_type="application/json")
 
 @app.post("/v1/change-requests")
 def create_cr(body: Dict[str, Any]) -> Dict[str, Any]:
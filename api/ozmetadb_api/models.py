@@ -1,5 +1,5 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field
+import msgspec
 from typing import Any, Literal, Optional, List, Dict
 
 ActionType = Literal[
@@ -10,15 +10,15 @@ ActionType = Literal[
     "SetPolicy","SetUiTheme","SetUiPage"
 ]
 
-class CRAction(BaseModel):
+class CRAction(msgspec.Struct, kw_only=True):
     actionId: str
     type: ActionType
-    target: Dict[str, Any] = Field(default_factory=dict)
-    payload: Dict[str, Any] = Field(default_factory=dict)
+    target: Dict[str, Any] = msgspec.field(default_factory=dict)
+    payload: Dict[str, Any] = msgspec.field(default_factory=dict)
     order: int = 0
     idempotencyKey: Optional[str] = None
 
-class ChangeRequest(BaseModel):
+class ChangeRequest(msgspec.Struct, kw_only=True):
     crId: str
     projectId: str
     title: str
@@ -31,5 +31,5 @@ class ChangeRequest(BaseModel):
     appliedAtUTC: Optional[str] = None
     appliedBy: Optional[str] = None
     baseSnapshotVersion: Optional[int] = None
-    actions: List[CRAction] = Field(default_factory=list)
-    validation: Dict[str, Any] = Field(default_factory=dict)
+    actions: List[CRAction] = msgspec.field(default_factory=list)
+    validation: Dict[str, Any] = msgspec.field(default_factory=dict)
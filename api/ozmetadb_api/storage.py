@@ -1,12 +1,39 @@
 from __future__ import annotations
-import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import msgspec
+import orjson
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from .config import settings
 
+# shared pool for the list_* endpoints: they read many small files and the
+# reads release the GIL; only reads go through it, writes stay serial
+_READ_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="oz-storage-read")
+
 def _p(*parts: str) -> Path:
     return Path(settings.data_dir, *parts)
 
+def read_json(f: Path) -> Any:
+    return orjson.loads(f.read_bytes())
+
+def write_json(f: Path, obj: Any) -> bytes:
+    """Write obj as indented JSON atomically and return the bytes written."""
+    # write-then-rename so readers never observe a partially written file;
+    # the temp name is unique so concurrent writers never share one
+    raw = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    with tempfile.NamedTemporaryFile(dir=f.parent, prefix=f.name + ".", suffix=".tmp", delete=False) as tmp:
+        tmp.write(raw)
+    try:
+        os.replace(tmp.name, f)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    return raw
+
 def ensure_dirs() -> None:
     _p().mkdir(parents=True, exist_ok=True)
     _p("projects").mkdir(parents=True, exist_ok=True)
@@ -15,46 +42,139 @@ def ensure_dirs() -> None:
 
 def list_projects() -> List[Dict[str, Any]]:
     ensure_dirs()
-    out=[]
-    for pj in _p("projects").glob("*.json"):
-        out.append(json.loads(pj.read_text(encoding="utf-8")))
+    files=[pj for pj in _p("projects").iterdir() if pj.suffix == ".json"]
+    out=[orjson.loads(b) for b in _READ_POOL.map(Path.read_bytes, files)]
     return sorted(out, key=lambda x: x.get("projectCode",""))
 
 def get_project(project_id: str) -> Optional[Dict[str, Any]]:
     ensure_dirs()
     f=_p("projects", f"{project_id}.json")
-    return json.loads(f.read_text(encoding="utf-8")) if f.exists() else None
+    return read_json(f) if f.exists() else None
 
 def save_project(project: Dict[str, Any]) -> None:
     ensure_dirs()
-    _p("projects", f"{project['projectId']}.json").write_text(json.dumps(project, indent=2), encoding="utf-8")
+    write_json(_p("projects", f"{project['projectId']}.json"), project)
 
-def get_snapshot(project_id: str) -> Optional[Dict[str, Any]]:
-    ensure_dirs()
+# path -> [mtime_ns, raw bytes, parsed snapshot or None], least recently used first
+_SNAP_CACHE: "OrderedDict[str, list]" = OrderedDict()
+_SNAP_CACHE_SIZE = 128
+_SNAP_LOCK = threading.Lock()
+
+def _snap_cache_put(key: str, entry: list) -> None:
+    with _SNAP_LOCK:
+        _SNAP_CACHE[key]=entry
+        _SNAP_CACHE.move_to_end(key)
+        while len(_SNAP_CACHE) > _SNAP_CACHE_SIZE:
+            _SNAP_CACHE.popitem(last=False)
+
+def _snapshot_entry(project_id: str) -> Optional[list]:
     f=_p("projects", project_id, "snapshot.json")
-    return json.loads(f.read_text(encoding="utf-8")) if f.exists() else None
+    key=str(f)
+    try:
+        mtime=f.stat().st_mtime_ns
+    except FileNotFoundError:
+        with _SNAP_LOCK:
+            _SNAP_CACHE.pop(key, None)
+        return None
+    with _SNAP_LOCK:
+        entry=_SNAP_CACHE.get(key)
+        if entry and entry[0]==mtime:
+            _SNAP_CACHE.move_to_end(key)
+            return entry
+    entry=[mtime, f.read_bytes(), None]
+    _snap_cache_put(key, entry)
+    return entry
+
+def get_snapshot(project_id: str, private: bool=False) -> Optional[Dict[str, Any]]:
+    """Parsed snapshot, served from an mtime-checked in-memory cache.
+
+    The default result is shared with other readers and must not be mutated;
+    pass private=True for a fresh copy that the caller may modify.
+    """
+    ensure_dirs()
+    entry=_snapshot_entry(project_id)
+    if entry is None:
+        return None
+    if private:
+        return orjson.loads(entry[1])
+    if entry[2] is None:
+        entry[2]=orjson.loads(entry[1])
+    return entry[2]
+
+def get_snapshot_bytes(project_id: str) -> Optional[bytes]:
+    ensure_dirs()
+    entry=_snapshot_entry(project_id)
+    return entry[1] if entry else None
 
 def save_snapshot(project_id: str, snapshot: Dict[str, Any]) -> None:
     ensure_dirs()
     d=_p("projects", project_id)
     d.mkdir(parents=True, exist_ok=True)
-    (d/"snapshot.json").write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+    f=d/"snapshot.json"
+    raw=write_json(f, snapshot)
+    # the saved dict is cached as-is, so callers must not mutate it afterwards
+    _snap_cache_put(str(f), [f.stat().st_mtime_ns, raw, snapshot])
+
+CR_INDEX = "_index.json"
+# serializes read-modify-write of the CR index (sync endpoints run in a threadpool)
+_CR_INDEX_LOCK = threading.RLock()
+# one decoder reused for every CR file (untyped: CRs stay plain dicts)
+_CR_DECODER = msgspec.json.Decoder()
+
+def _read_cr(f: Path) -> Dict[str, Any]:
+    return _CR_DECODER.decode(f.read_bytes())
+
+def _load_cr_index() -> Dict[str, Optional[str]]:
+    """crId -> projectId map; rebuilt from the CR files when missing."""
+    f=_p("change-requests", CR_INDEX)
+    if f.exists():
+        return read_json(f)
+    with _CR_INDEX_LOCK:
+        if f.exists():
+            return read_json(f)
+        idx={}
+        for cf in _p("change-requests").iterdir():
+            if cf.suffix != ".json" or cf.name == CR_INDEX:
+                continue
+            cr=_read_cr(cf)
+            idx[cr["crId"]]=cr.get("projectId")
+        write_json(f, idx)
+        return idx
 
 def list_change_requests(project_id: Optional[str]=None) -> List[Dict[str, Any]]:
     ensure_dirs()
-    items=[]
-    for f in _p("change-requests").glob("*.json"):
-        cr=json.loads(f.read_text(encoding="utf-8"))
-        if project_id and cr.get("projectId")!=project_id: 
+    files=[]
+    for cr_id, pid in _load_cr_index().items():
+        if project_id and pid!=project_id:
             continue
-        items.append(cr)
+        f=_p("change-requests", f"{cr_id}.json")
+        if f.exists():
+            files.append(f)
+    items=[_CR_DECODER.decode(b) for b in _READ_POOL.map(Path.read_bytes, files)]
     return sorted(items, key=lambda x: x.get("createdAtUTC",""))
 
 def get_change_request(cr_id: str) -> Optional[Dict[str, Any]]:
     ensure_dirs()
     f=_p("change-requests", f"{cr_id}.json")
-    return json.loads(f.read_text(encoding="utf-8")) if f.exists() else None
+    return _read_cr(f) if f.exists() else None
+
+def get_change_request_bytes(cr_id: str) -> Optional[bytes]:
+    ensure_dirs()
+    f=_p("change-requests", f"{cr_id}.json")
+    return f.read_bytes() if f.exists() else None
 
 def save_change_request(cr: Dict[str, Any]) -> None:
     ensure_dirs()
-    _p("change-requests", f"{cr['crId']}.json").write_text(json.dumps(cr, indent=2), encoding="utf-8")
+    write_json(_p("change-requests", f"{cr['crId']}.json"), cr)
+    with _CR_INDEX_LOCK:
+        idx=_load_cr_index()
+        if cr["crId"] not in idx or idx[cr["crId"]]!=cr.get("projectId"):
+            idx[cr["crId"]]=cr.get("projectId")
+            write_json(_p("change-requests", CR_INDEX), idx)
+
+def get_wizard_run(run_id: str) -> Dict[str, Any]:
+    return read_json(_p("wizard-runs", f"{run_id}.json"))
+
+def save_wizard_run(run: Dict[str, Any]) -> None:
+    ensure_dirs()
+    write_json(_p("wizard-runs", f"{run['wizardRunId']}.json"), run)
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import json, uuid
+import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict
 from . import storage
+from ._cache import cached_json
 
 def _now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -11,24 +12,20 @@ def load_wizard_pack(code: str) -> Dict[str, Any]:
     from pathlib import Path
     here = Path(__file__).resolve()
     pack = here.parents[2] / "wizard" / "packs" / f"{code}.wizard.json"
-    return json.loads(pack.read_text(encoding="utf-8"))
+    return cached_json(pack)
 
 def start_wizard(code: str, project_id: str) -> Dict[str, Any]:
     w = load_wizard_pack(code)
     run_id = str(uuid.uuid4())
     run = {"wizardRunId": run_id, "wizardCode": code, "projectId": project_id, "startedAtUTC": _now(), "answers": {}, "status":"InProgress"}
-    storage.ensure_dirs()
-    p = storage._p("wizard-runs", f"{run_id}.json")
-    p.write_text(json.dumps(run, indent=2), encoding="utf-8")
+    storage.save_wizard_run(run)
     return {"wizardRunId": run_id, "wizard": w, "run": run}
 
 def get_run(run_id: str) -> Dict[str, Any]:
-    p = storage._p("wizard-runs", f"{run_id}.json")
-    return json.loads(p.read_text(encoding="utf-8"))
+    return storage.get_wizard_run(run_id)
 
 def save_run(run: Dict[str, Any]) -> None:
-    p = storage._p("wizard-runs", f"{run['wizardRunId']}.json")
-    p.write_text(json.dumps(run, indent=2), encoding="utf-8")
+    storage.save_wizard_run(run)
 
 def answer(run_id: str, key: str, value: Any) -> Dict[str, Any]:
     run = get_run(run_id)
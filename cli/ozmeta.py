@@ -13,15 +13,54 @@ Commands:
   console     Launch interactive console (TUI)
 """
 from __future__ import annotations
-import argparse, subprocess, sys, json
+import argparse, importlib, importlib.util, os, subprocess, sys, json
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 def run(cmd, cwd=None):
     return subprocess.run(cmd, text=True, cwd=cwd).returncode
 
 
+def _load_script(path: Path):
+    """Import a standalone script (not in a package) as a module, once."""
+    name = f"_ozmeta_{path.stem}"
+    mod = sys.modules.get(name)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[name] = mod  # dataclasses resolve annotations via sys.modules
+        spec.loader.exec_module(mod)
+    return mod
+
+
+def call_main(entry, argv, isolate=False) -> int:
+    """Run another tool's main() with argv, in-process unless isolate is set.
+
+    entry is a module name (run as `python -m` from the repo root, so relative
+    paths resolve against ROOT in both modes) or a script Path (run from the
+    caller's cwd).
+    """
+    cwd = None if isinstance(entry, Path) else str(ROOT)
+    if isolate:
+        if isinstance(entry, Path):
+            return run([sys.executable, str(entry), *argv])
+        return run([sys.executable, "-m", entry, *argv], cwd=cwd)
+    mod = _load_script(entry) if isinstance(entry, Path) else importlib.import_module(entry)
+    prog = entry.name if isinstance(entry, Path) else entry
+    old_argv, old_cwd = sys.argv, os.getcwd()
+    sys.argv = [prog, *argv]
+    try:
+        if cwd:
+            os.chdir(cwd)
+        return mod.main()
+    finally:
+        os.chdir(old_cwd)
+        sys.argv = old_argv
+
+
 def cmd_metrics(args) -> int:
     """Compile metrics to target platform expressions."""
     snap = json.loads(Path(args.snapshot).read_text())
@@ -187,6 +226,87 @@ def cmd_console(args) -> int:
         return 1
 
 
+def _forward(entry, *dests, positional=False):
+    """Handler that runs another tool's main() with the given args forwarded.
+
+    Options are forwarded as --<dest> <value>; positional forwards bare values.
+    """
+    def handler(args) -> int:
+        if positional:
+            argv = [getattr(args, d) for d in dests]
+        else:
+            argv = [x for d in dests for x in (f"--{d}", getattr(args, d))]
+        return call_main(entry, argv, args.isolate)
+    return handler
+
+
+_SNAPSHOT = (("--snapshot",), {"required": True, "help": "Path to snapshot JSON"})
+
+# name -> (help, [(flags, add_argument kwargs)], handler)
+SUBCOMMANDS = {
+    "validate": ("Validate metadata snapshot", [
+        _SNAPSHOT,
+    ], _forward(ROOT/"scripts"/"validate_snapshot.py", "snapshot", positional=True)),
+    "generate": ("Generate artifacts from snapshot", [
+        _SNAPSHOT,
+        (("--out",), {"required": True, "help": "Output directory"}),
+        (("--scheduler",), {"default": "airflow", "help": "Job scheduler target"}),
+    ], _forward(ROOT/"generator"/"src"/"generate_from_snapshot.py", "snapshot", "out", "scheduler")),
+    "export": ("Export metadata from database", [
+        (("--out",), {"required": True, "help": "Output file path"}),
+        (("--client",), {"default": "SFO", "help": "Client code"}),
+        (("--project",), {"default": "CaseMgmt", "help": "Project code"}),
+        (("--provider",), {"default": "stub", "help": "DB provider"}),
+        (("--connection",), {"default": "", "help": "Connection string"}),
+    ], _forward(ROOT/"generator"/"src"/"export_from_db.py",
+                "out", "client", "project", "provider", "connection")),
+    "compile": ("Compile DDL for target platform", [
+        _SNAPSHOT,
+        (("--target",), {"required": True,
+                         "help": "Target platform (postgres, bigquery, redshift, snowflake, spark); "
+                                 "comma-separate to emit several in one pass"}),
+        (("--out",), {"required": True, "help": "Output directory"}),
+        (("--options",), {"default": "{}", "help": "JSON options"}),
+    ], _forward("compiler.compile", "snapshot", "target", "out", "options")),
+    "metrics": ("Compile metrics/KPIs", [
+        _SNAPSHOT,
+        (("--target",), {"default": "tsql", "choices": ["tsql", "dax", "spark", "python"],
+                         "help": "Target expression language"}),
+        (("--out",), {"required": True, "help": "Output file path"}),
+    ], cmd_metrics),
+    "jobs": ("Compile jobs for scheduler", [
+        _SNAPSHOT,
+        (("--scheduler",), {"default": "airflow",
+                            "choices": ["airflow", "prefect", "dagster", "cron", "adf",
+                                        "databricks", "step_functions", "fabric"],
+                            "help": "Target scheduler"}),
+        (("--out",), {"required": True, "help": "Output file path"}),
+    ], cmd_jobs),
+    "lineage": ("Query and visualize lineage", [
+        _SNAPSHOT,
+        (("--action",), {"default": "stats",
+                         "choices": ["stats", "export", "upstream", "downstream", "impact"],
+                         "help": "Lineage action"}),
+        (("--node",), {"help": "Node ID for queries"}),
+        (("--format",), {"choices": ["json", "mermaid", "dot", "d3"], "help": "Export format"}),
+        (("--out",), {"help": "Output file for export"}),
+        (("--change-type",), {"dest": "change_type",
+                              "choices": ["modify", "delete", "rename", "type_change"],
+                              "help": "Change type for impact analysis"}),
+    ], cmd_lineage),
+    "migrate": ("Run database migrations", [
+        (("action",), {"choices": ["plan", "run", "status", "rollback"], "help": "Migration action"}),
+        (("--plan",), {"help": "Migration plan file"}),
+        (("--target",), {"help": "Target platform"}),
+        (("--connection",), {"help": "Connection string"}),
+        (("--checkpoint",), {"help": "Checkpoint ID"}),
+    ], cmd_migrate),
+    "console": ("Launch interactive TUI console", [
+        (("--snapshot",), {"help": "Path to snapshot JSON"}),
+    ], cmd_console),
+}
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(
         prog="ozmeta",
@@ -204,118 +324,17 @@ Examples:
   ozmeta console --snapshot meta.json
 """
     )
+    ap.add_argument("--isolate", action="store_true",
+                    help="Run validate/generate/export/compile in a child Python process")
     sub = ap.add_subparsers(dest="cmd", required=True)
-
-    # validate
-    v = sub.add_parser("validate", help="Validate metadata snapshot")
-    v.add_argument("--snapshot", required=True, help="Path to snapshot JSON")
-
-    # generate
-    g = sub.add_parser("generate", help="Generate artifacts from snapshot")
-    g.add_argument("--snapshot", required=True, help="Path to snapshot JSON")
-    g.add_argument("--out", required=True, help="Output directory")
-    g.add_argument("--scheduler", default="airflow", help="Job scheduler target")
-
-    # export
-    e = sub.add_parser("export", help="Export metadata from database")
-    e.add_argument("--out", required=True, help="Output file path")
-    e.add_argument("--client", default="SFO", help="Client code")
-    e.add_argument("--project", default="CaseMgmt", help="Project code")
-    e.add_argument("--provider", default="stub", help="DB provider")
-    e.add_argument("--connection", default="", help="Connection string")
-
-    # compile
-    c = sub.add_parser("compile", help="Compile DDL for target platform")
-    c.add_argument("--snapshot", required=True, help="Path to snapshot JSON")
-    c.add_argument("--target", required=True,
-                   choices=["postgres", "bigquery", "redshift", "snowflake", "spark"],
-                   help="Target platform")
-    c.add_argument("--out", required=True, help="Output directory")
-    c.add_argument("--options", default="{}", help="JSON options")
-
-    # metrics
-    m = sub.add_parser("metrics", help="Compile metrics/KPIs")
-    m.add_argument("--snapshot", required=True, help="Path to snapshot JSON")
-    m.add_argument("--target", default="tsql",
-                   choices=["tsql", "dax", "spark", "python"],
-                   help="Target expression language")
-    m.add_argument("--out", required=True, help="Output file path")
-
-    # jobs
-    j = sub.add_parser("jobs", help="Compile jobs for scheduler")
-    j.add_argument("--snapshot", required=True, help="Path to snapshot JSON")
-    j.add_argument("--scheduler", default="airflow",
-                   choices=["airflow", "prefect", "dagster", "cron", "adf",
-                           "databricks", "step_functions", "fabric"],
-                   help="Target scheduler")
-    j.add_argument("--out", required=True, help="Output file path")
-
-    # lineage
-    l = sub.add_parser("lineage", help="Query and visualize lineage")
-    l.add_argument("--snapshot", required=True, help="Path to snapshot JSON")
-    l.add_argument("--action", default="stats",
-                   choices=["stats", "export", "upstream", "downstream", "impact"],
-                   help="Lineage action")
-    l.add_argument("--node", help="Node ID for queries")
-    l.add_argument("--format", choices=["json", "mermaid", "dot", "d3"],
-                   help="Export format")
-    l.add_argument("--out", help="Output file for export")
-    l.add_argument("--change-type", dest="change_type",
-                   choices=["modify", "delete", "rename", "type_change"],
-                   help="Change type for impact analysis")
-
-    # migrate
-    mg = sub.add_parser("migrate", help="Run database migrations")
-    mg.add_argument("action", choices=["plan", "run", "status", "rollback"],
-                    help="Migration action")
-    mg.add_argument("--plan", help="Migration plan file")
-    mg.add_argument("--target", help="Target platform")
-    mg.add_argument("--connection", help="Connection string")
-    mg.add_argument("--checkpoint", help="Checkpoint ID")
-
-    # console
-    con = sub.add_parser("console", help="Launch interactive TUI console")
-    con.add_argument("--snapshot", help="Path to snapshot JSON")
+    for name, (help_text, arguments, handler) in SUBCOMMANDS.items():
+        p = sub.add_parser(name, help=help_text)
+        for flags, kwargs in arguments:
+            p.add_argument(*flags, **kwargs)
+        p.set_defaults(handler=handler)
 
     args = ap.parse_args()
-
-    if args.cmd == "validate":
-        return run([sys.executable, str(ROOT/"scripts"/"validate_snapshot.py"), args.snapshot])
-
-    if args.cmd == "generate":
-        cmd_args = [sys.executable, str(ROOT/"generator"/"src"/"generate_from_snapshot.py"),
-                    "--snapshot", args.snapshot, "--out", args.out,
-                    "--scheduler", args.scheduler]
-        return run(cmd_args)
-
-    if args.cmd == "export":
-        return run([sys.executable, str(ROOT/"generator"/"src"/"export_from_db.py"),
-                    "--out", args.out, "--client", args.client,
-                    "--project", args.project, "--provider", args.provider,
-                    "--connection", args.connection])
-
-    if args.cmd == "compile":
-        return run([sys.executable, "-m", "compiler.compile",
-                    "--snapshot", args.snapshot, "--target", args.target,
-                    "--out", args.out, "--options", args.options],
-                   cwd=str(ROOT))
-
-    if args.cmd == "metrics":
-        return cmd_metrics(args)
-
-    if args.cmd == "jobs":
-        return cmd_jobs(args)
-
-    if args.cmd == "lineage":
-        return cmd_lineage(args)
-
-    if args.cmd == "migrate":
-        return cmd_migrate(args)
-
-    if args.cmd == "console":
-        return cmd_console(args)
-
-    return 2
+    return args.handler(args)
 
 
 if __name__ == "__main__":
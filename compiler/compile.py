@@ -1,11 +1,12 @@
 """Multi-platform DDL compiler.
 
 Steps:
-  1.1 Load snapshot JSON
+  1.1 Load snapshot and options JSON (orjson when installed; very large
+      snapshots are streamed table-by-table with ijson when installed)
   1.2 Build intermediate representation (IR)
-  2.1 Select target emitter
+  2.1 Select target emitter (several targets share one pass over the IR)
   2.2 Emit DDL files
-  3.1 Write output files
+  3.1 Write output files (concurrently when there are several)
 
 Supported targets:
   - postgres   : PostgreSQL
@@ -17,41 +18,110 @@ Supported targets:
 
 from __future__ import annotations
 import argparse
+import importlib
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from .ir import build_ir
-from .emitters.postgres import PostgresEmitter
-from .emitters.bigquery import BigQueryEmitter
-from .emitters.redshift import RedshiftEmitter
-from .emitters.snowflake import SnowflakeEmitter
-from .emitters.spark import SparkEmitter
+from typing import Any, Dict, Tuple
+from .ir import ProjectIR, build_ir, build_ir_from_tables
 
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+    _loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads = json.loads
+
+try:
+    import ijson  # type: ignore
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Snapshots above this size are streamed instead of parsed whole
+STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Target -> "module:Class"; only the selected emitter is imported
 EMITTERS = {
-    "postgres": PostgresEmitter(),
-    "bigquery": BigQueryEmitter(),
-    "redshift": RedshiftEmitter(),
-    "snowflake": SnowflakeEmitter(),
-    "spark": SparkEmitter(),
+    "postgres": ".emitters.postgres:PostgresEmitter",
+    "bigquery": ".emitters.bigquery:BigQueryEmitter",
+    "redshift": ".emitters.redshift:RedshiftEmitter",
+    "snowflake": ".emitters.snowflake:SnowflakeEmitter",
+    "spark": ".emitters.spark:SparkEmitter",
 }
 
+def get_emitter(target: str) -> Any:
+    """Import and instantiate the emitter registered for target."""
+    module, _, cls = EMITTERS[target].partition(":")
+    return getattr(importlib.import_module(module, __package__), cls)()
+
+# (resolved path, mtime_ns, size) -> IR of that file; only IRs are kept, not snapshots
+_IR_CACHE: "OrderedDict[Tuple[str, int, int], ProjectIR]" = OrderedDict()
+_IR_CACHE_SIZE = 8
+
+def load_ir(path: Path) -> ProjectIR:
+    """Load a snapshot file and build its IR.
+
+    Steps:
+      1.1 Return the cached IR while the file's mtime and size are unchanged
+      1.2 Stream objects.model.tables for very large files (ijson)
+      1.3 Otherwise parse the raw bytes in one go (orjson, else json)
+    """
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    ir = _IR_CACHE.get(key)
+    if ir is not None:
+        _IR_CACHE.move_to_end(key)
+        return ir
+    if IJSON_AVAILABLE and st.st_size > STREAM_THRESHOLD_BYTES:
+        with path.open("rb") as fh:
+            ir = build_ir_from_tables(ijson.items(fh, "objects.model.tables.item"))
+    else:
+        ir = build_ir(_loads(path.read_bytes()))
+    _IR_CACHE[key] = ir
+    if len(_IR_CACHE) > _IR_CACHE_SIZE:
+        _IR_CACHE.popitem(last=False)
+    return ir
+
+def write_files(out: Path, files: Dict[str, str]) -> None:
+    """Write emitted files under out; several files are written concurrently."""
+    out.mkdir(parents=True, exist_ok=True)
+    def _write(item: Tuple[str, str]) -> None:
+        rel, content = item
+        p=out/rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(content.encode("utf-8"))
+    if len(files) <= 1:
+        for item in files.items():
+            _write(item)
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+        list(ex.map(_write, files.items()))
+
 def main() -> int:
     ap=argparse.ArgumentParser()
     ap.add_argument("--snapshot", required=True)
-    ap.add_argument("--target", required=True, choices=sorted(EMITTERS.keys()))
+    ap.add_argument("--target", required=True,
+                    help=f"Target, or comma-separated targets emitted in one pass: {', '.join(sorted(EMITTERS))}")
     ap.add_argument("--out", required=True)
     ap.add_argument("--options", default="{}")
     args=ap.parse_args()
+    targets=[t.strip() for t in args.target.split(",") if t.strip()]
+    unknown=[t for t in targets if t not in EMITTERS]
+    if unknown or not targets:
+        ap.error(f"invalid --target {args.target!r} (choose from {', '.join(sorted(EMITTERS))})")
 
-    snap=json.loads(Path(args.snapshot).read_text(encoding="utf-8"))
-    ir=build_ir(snap)
-    opts=json.loads(args.options)
-    files=EMITTERS[args.target].emit(ir, opts)
-    out=Path(args.out)
-    out.mkdir(parents=True, exist_ok=True)
-    for rel, content in files.items():
-        p=out/rel
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content, encoding="utf-8")
+    ir=load_ir(Path(args.snapshot))
+    opts={} if args.options == "{}" else _loads(args.options)
+    if len(targets) == 1:
+        emitter=get_emitter(targets[0])
+    else:
+        from .emitters.base import MultiDialectEmitter
+        emitter=MultiDialectEmitter(get_emitter(t) for t in dict.fromkeys(targets))
+    files=emitter.emit(ir, opts)
+    write_files(Path(args.out), files)
     return 0
 
 if __name__=="__main__":
@@ -6,14 +6,20 @@ Steps:
   2.1 Emit to target (TSQL, Postgres, Python)
 """
 
-from .compiler import compile_dsl, compile_guard_to_sql, DSLCompiler
-from .parser import parse_expr, parse_dsl, Literal, Ref, Op, Expr
+from .compiler import compile_dsl, compile_guard_to_sql, compiler_for, DSLCompiler
+from .parser import parse_expr, parse_expr_cached, parse_dsl, Literal, Ref, Op, Expr
+from .python_emitter import compile_guard_to_python, CompiledGuard, PythonEmitter
 
 __all__ = [
     "compile_dsl",
     "compile_guard_to_sql",
     "DSLCompiler",
+    "compiler_for",
+    "compile_guard_to_python",
+    "CompiledGuard",
+    "PythonEmitter",
     "parse_expr",
+    "parse_expr_cached",
     "parse_dsl",
     "Literal",
     "Ref",
@@ -8,8 +8,171 @@ Steps:
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Callable
-from .parser import Expr, Literal, Ref, Op, parse_expr, parse_dsl
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Callable, Tuple
+from .parser import Expr, Literal, Ref, Op, parse_expr_cached, parse_dsl, _FALSE
+
+
+def _dialect(id_quote: str, id_quote_end: str, true_lit: str, false_lit: str,
+             concat_op: str, current_timestamp: str) -> Mapping[str, str]:
+    return MappingProxyType({
+        "id_quote": id_quote,
+        "id_quote_end": id_quote_end,
+        "str_quote": "'",
+        "true_lit": true_lit,
+        "false_lit": false_lit,
+        "null_lit": "NULL",
+        "concat_op": concat_op,
+        "current_timestamp": current_timestamp,
+    })
+
+
+_TSQL = _dialect("[", "]", "1", "0", "+", "GETUTCDATE()")
+_BACKTICK = _dialect("`", "`", "TRUE", "FALSE", "||", "CURRENT_TIMESTAMP()")
+
+# Dialect settings, resolved once per target instead of per compiler instance
+DIALECT_SETTINGS: Dict[str, Mapping[str, str]] = {
+    "tsql": _TSQL,
+    "sqlserver": _TSQL,
+    "postgres": _dialect('"', '"', "TRUE", "FALSE", "||", "NOW()"),
+    "snowflake": _dialect('"', '"', "TRUE", "FALSE", "||", "CURRENT_TIMESTAMP()"),
+    "spark": _BACKTICK,
+    "databricks": _BACKTICK,
+    "bigquery": _BACKTICK,
+}
+
+# Default to ANSI SQL
+_ANSI = _dialect('"', '"', "TRUE", "FALSE", "||", "CURRENT_TIMESTAMP")
+
+
+def _dialect_settings(target: str) -> Mapping[str, str]:
+    return DIALECT_SETTINGS.get(target, _ANSI)
+
+
+# Dialect-specific SQL fragments; targets not listed use the "*" entry
+_CONTAINS_FORMATS = {
+    "tsql": "(CHARINDEX({v}, {f}) > 0)",
+    "sqlserver": "(CHARINDEX({v}, {f}) > 0)",
+    "*": "({f} LIKE '%' {c} {v} {c} '%')",
+}
+_REGEX_FORMATS = {
+    # SQL Server doesn't have native regex - use LIKE approximation
+    "tsql": "({f} LIKE {p})",
+    "sqlserver": "({f} LIKE {p})",
+    "postgres": "({f} ~ {p})",
+    "snowflake": "(REGEXP_LIKE({f}, {p}))",
+    "spark": "({f} RLIKE {p})",
+    "databricks": "({f} RLIKE {p})",
+    "*": "(REGEXP_LIKE({f}, {p}))",
+}
+_DATEADD_FORMATS = {
+    "postgres": "({d} + INTERVAL '{n} {u}')",
+    "spark": "({d} + INTERVAL {n} {u})",
+    "databricks": "({d} + INTERVAL {n} {u})",
+    "*": "DATEADD({u}, {n}, {d})",
+}
+_DATEADD_DAY_FORMATS = {
+    "spark": "DATE_ADD({d}, {n})",
+    "databricks": "DATE_ADD({d}, {n})",
+}
+_DATEDIFF_MINUTES_FORMATS = {
+    "postgres": "EXTRACT(EPOCH FROM ({b} - {a})) / 60",
+    "spark": "(UNIX_TIMESTAMP({b}) - UNIX_TIMESTAMP({a})) / 60",
+    "databricks": "(UNIX_TIMESTAMP({b}) - UNIX_TIMESTAMP({a})) / 60",
+    "*": "DATEDIFF(MINUTE, {a}, {b})",
+}
+_CONTEXT_TENANT_ID = {
+    "tsql": "SESSION_CONTEXT(N'TenantId')",
+    "sqlserver": "SESSION_CONTEXT(N'TenantId')",
+    "postgres": "current_setting('app.tenant_id')",
+    "snowflake": "CURRENT_SESSION()::VARIANT:tenant_id",
+    "spark": "current_user()",  # Unity Catalog uses user identity
+    "databricks": "current_user()",
+    "*": "@TenantId",
+}
+_CONTEXT_USER_ID = {
+    "tsql": "SESSION_CONTEXT(N'UserId')",
+    "sqlserver": "SESSION_CONTEXT(N'UserId')",
+    "postgres": "current_setting('app.user_id')",
+    "snowflake": "CURRENT_USER()",
+    "spark": "current_user()",
+    "databricks": "current_user()",
+    "*": "@UserId",
+}
+_USER_ROLE = {
+    "tsql": "SESSION_CONTEXT(N'UserRole')",
+    "sqlserver": "SESSION_CONTEXT(N'UserRole')",
+    "*": "@UserRole",
+}
+_USER_ROLES = {
+    "tsql": "SESSION_CONTEXT(N'UserRoles')",
+    "sqlserver": "SESSION_CONTEXT(N'UserRoles')",
+    "*": "@UserRoles",
+}
+
+# DSL cast type -> SQL type
+_CAST_TYPES_TSQL = MappingProxyType({
+    "int": "INT", "integer": "INT", "string": "VARCHAR(MAX)", "boolean": "BIT", "datetime": "DATETIME2",
+})
+_CAST_TYPES_ANSI = MappingProxyType({
+    "int": "INT", "integer": "INT", "string": "TEXT", "boolean": "BOOLEAN", "datetime": "TIMESTAMP",
+})
+
+# Compiled dateadd unit argument -> bare upper-case unit; bounded, since the
+# argument may be any compiled expression rather than a unit literal
+@lru_cache(maxsize=64)
+def _date_unit(unit: str) -> str:
+    return unit.strip("'\"").upper()
+
+
+def _for_target(table: Mapping[str, str], target: str) -> str:
+    return table.get(target, table["*"])
+
+
+# Operators that compile to a fixed template over their compiled arguments
+_UNARY_OPS = {
+    "not": "(NOT {})",
+    "isnull": "({} IS NULL)",
+    "isnotnull": "({} IS NOT NULL)",
+    "exists": "EXISTS ({})",
+}
+_BINARY_OPS = {
+    "eq": "({} = {})",
+    "ne": "({} <> {})",
+    "gt": "({} > {})",
+    "gte": "({} >= {})",
+    "lt": "({} < {})",
+    "lte": "({} <= {})",
+    "add": "({} + {})",
+    "sub": "({} - {})",
+    "mul": "({} * {})",
+    "div": "({} / {})",
+}
+
+
+class _Frag(str):
+    """A fixed SQL fragment on the compile stack (as opposed to a node)."""
+    __slots__ = ()
+
+
+class _Combine:
+    """Compile-stack step: assemble a handler operator from its compiled args."""
+    __slots__ = ("op", "op_name", "n")
+
+    def __init__(self, op: Op, op_name: str, n: int):
+        self.op = op
+        self.op_name = op_name
+        self.n = n
+
+
+_MARK = object()
+_PAREN = _Frag("(")
+_COMMA = _Frag(", ")
+_IN_OPEN = _Frag(" IN (")
+_IN_CLOSE = _Frag("))")
 
 
 class DSLCompiler:
@@ -24,71 +187,37 @@ class DSLCompiler:
         """
         self.target = target.lower()
         self._setup_dialect()
+        self._op_table = self._build_op_table()
+        self._emit_table = self._build_emit_table()
 
     def _setup_dialect(self) -> None:
         """Configure dialect-specific settings.
 
         Steps:
-          1.1 Set quote character for identifiers
-          1.2 Set string quote character
-          1.3 Set boolean literals
-          1.4 Set null handling
+          1.1 Look up the dialect's settings (identifier/string quotes,
+              boolean and null literals, concat operator, current timestamp)
+          1.2 Bind them as attributes
+          1.3 Resolve dialect-specific SQL fragments once
         """
-        if self.target in ("tsql", "sqlserver"):
-            self.id_quote = "["
-            self.id_quote_end = "]"
-            self.str_quote = "'"
-            self.true_lit = "1"
-            self.false_lit = "0"
-            self.null_lit = "NULL"
-            self.concat_op = "+"
-            self.current_timestamp = "GETUTCDATE()"
-        elif self.target == "postgres":
-            self.id_quote = '"'
-            self.id_quote_end = '"'
-            self.str_quote = "'"
-            self.true_lit = "TRUE"
-            self.false_lit = "FALSE"
-            self.null_lit = "NULL"
-            self.concat_op = "||"
-            self.current_timestamp = "NOW()"
-        elif self.target == "snowflake":
-            self.id_quote = '"'
-            self.id_quote_end = '"'
-            self.str_quote = "'"
-            self.true_lit = "TRUE"
-            self.false_lit = "FALSE"
-            self.null_lit = "NULL"
-            self.concat_op = "||"
-            self.current_timestamp = "CURRENT_TIMESTAMP()"
-        elif self.target in ("spark", "databricks"):
-            self.id_quote = "`"
-            self.id_quote_end = "`"
-            self.str_quote = "'"
-            self.true_lit = "TRUE"
-            self.false_lit = "FALSE"
-            self.null_lit = "NULL"
-            self.concat_op = "||"
-            self.current_timestamp = "CURRENT_TIMESTAMP()"
-        elif self.target == "bigquery":
-            self.id_quote = "`"
-            self.id_quote_end = "`"
-            self.str_quote = "'"
-            self.true_lit = "TRUE"
-            self.false_lit = "FALSE"
-            self.null_lit = "NULL"
-            self.concat_op = "||"
-            self.current_timestamp = "CURRENT_TIMESTAMP()"
-        else:
-            # Default to ANSI SQL
-            self.id_quote = '"'
-            self.id_quote_end = '"'
-            self.str_quote = "'"
-            self.true_lit = "TRUE"
-            self.false_lit = "FALSE"
-            self.null_lit = "NULL"
-            self.concat_op = "||"
-            self.current_timestamp = "CURRENT_TIMESTAMP"
+        t = self.target
+        self.__dict__.update(_dialect_settings(t))
+        self._id_sep = f"{self.id_quote_end}.{self.id_quote}"
+        self._str_quote_escaped = self.str_quote * 2
+        self._cast_types = _CAST_TYPES_TSQL if t in ("tsql", "sqlserver") else _CAST_TYPES_ANSI
+        c = self.concat_op
+        self._contains_fmt = _for_target(_CONTAINS_FORMATS, t).replace("{c}", c)
+        self._startswith_fmt = f"({{f}} LIKE {{v}} {c} '%')"
+        self._endswith_fmt = f"({{f}} LIKE '%' {c} {{v}})"
+        self._regex_fmt = _for_target(_REGEX_FORMATS, t)
+        self._dateadd_fmt = _for_target(_DATEADD_FORMATS, t)
+        self._dateadd_day_fmt = _DATEADD_DAY_FORMATS.get(t)
+        self._datediff_minutes_fmt = _for_target(_DATEDIFF_MINUTES_FORMATS, t)
+        self._tenant_id_sql = _for_target(_CONTEXT_TENANT_ID, t)
+        self._user_id_sql = _for_target(_CONTEXT_USER_ID, t)
+        self._user_field_sql = {
+            "role": _for_target(_USER_ROLE, t),
+            "roles": _for_target(_USER_ROLES, t),
+        }
 
     def quote_identifier(self, name: str) -> str:
         """Quote an identifier for the target dialect.
@@ -97,18 +226,19 @@ class DSLCompiler:
           1.1 Handle dot-separated paths
           1.2 Quote each segment
         """
-        parts = name.split(".")
-        return ".".join(f"{self.id_quote}{p}{self.id_quote_end}" for p in parts)
+        return self.id_quote + self._id_sep.join(name.split(".")) + self.id_quote_end
 
     def quote_string(self, value: str) -> str:
         """Quote a string literal.
 
         Steps:
-          1.1 Escape internal quotes
+          1.1 Escape internal quotes (skipped when there are none)
           1.2 Wrap in quotes
         """
-        escaped = value.replace(self.str_quote, self.str_quote * 2)
-        return f"{self.str_quote}{escaped}{self.str_quote}"
+        q = self.str_quote
+        if q in value:
+            value = value.replace(q, self._str_quote_escaped)
+        return q + value + q
 
     def compile_literal(self, lit: Literal) -> str:
         """Compile a literal value to SQL.
@@ -172,168 +302,88 @@ class DSLCompiler:
 
     def _context_tenant_id(self) -> str:
         """Get tenant ID from context based on dialect."""
-        if self.target in ("tsql", "sqlserver"):
-            return "SESSION_CONTEXT(N'TenantId')"
-        if self.target == "postgres":
-            return "current_setting('app.tenant_id')"
-        if self.target == "snowflake":
-            return "CURRENT_SESSION()::VARIANT:tenant_id"
-        if self.target in ("spark", "databricks"):
-            return "current_user()"  # Unity Catalog uses user identity
-        return "@TenantId"
+        return self._tenant_id_sql
 
     def _context_user_id(self) -> str:
         """Get user ID from context based on dialect."""
-        if self.target in ("tsql", "sqlserver"):
-            return "SESSION_CONTEXT(N'UserId')"
-        if self.target == "postgres":
-            return "current_setting('app.user_id')"
-        if self.target == "snowflake":
-            return "CURRENT_USER()"
-        if self.target in ("spark", "databricks"):
-            return "current_user()"
-        return "@UserId"
+        return self._user_id_sql
 
     def _user_ref(self, field: str) -> str:
         """Compile user field reference."""
-        if field == "role":
-            if self.target in ("tsql", "sqlserver"):
-                return "SESSION_CONTEXT(N'UserRole')"
-            return "@UserRole"
-        if field == "roles":
-            if self.target in ("tsql", "sqlserver"):
-                return "SESSION_CONTEXT(N'UserRoles')"
-            return "@UserRoles"
-        return f"@User_{field}"
+        sql = self._user_field_sql.get(field)
+        return sql if sql is not None else f"@User_{field}"
 
     def _apply_cast(self, expr: str, cast_type: str) -> str:
         """Apply type cast to expression."""
-        type_map = {
-            "int": "INT",
-            "integer": "INT",
-            "string": "VARCHAR(MAX)" if self.target in ("tsql", "sqlserver") else "TEXT",
-            "boolean": "BIT" if self.target in ("tsql", "sqlserver") else "BOOLEAN",
-            "datetime": "DATETIME2" if self.target in ("tsql", "sqlserver") else "TIMESTAMP",
-        }
-        sql_type = type_map.get(cast_type.lower(), cast_type.upper())
+        sql_type = self._cast_types.get(cast_type.lower()) or cast_type.upper()
         return f"CAST({expr} AS {sql_type})"
 
-    def compile_op(self, op: Op, context: Optional[Dict[str, str]] = None) -> str:
-        """Compile an operation to SQL.
+    def _build_op_table(self) -> Dict[str, Callable[[List[str], Op, Optional[Dict[str, str]]], str]]:
+        """Build the operator name -> handler table for operators that need compiled args.
+
+        Handlers take (compiled args, op node, context).
+
+        Steps:
+          1.1 String, date and special operators (dialect-aware methods)
+        """
+        return {
+            # 1.1 String operators
+            "contains": lambda args, op, context: self._compile_contains(args[0], args[1]),
+            "startswith": lambda args, op, context: self._compile_startswith(args[0], args[1]),
+            "endswith": lambda args, op, context: self._compile_endswith(args[0], args[1]),
+            "regex": lambda args, op, context: self._compile_regex(args[0], args[1]),
+            # 1.1 Date operators
+            "dateadd": lambda args, op, context: self._compile_dateadd(args),
+            "datediffminutes": lambda args, op, context: self._compile_datediff_minutes(args[0], args[1]),
+            # 1.1 Special operators
+            "case": lambda args, op, context: self._compile_case_args(args),
+        }
+
+    def _build_emit_table(self) -> Dict[str, Tuple[str, str, str, Optional[int]]]:
+        """Build the operator name -> (open, separator, close, arity) table.
+
+        These operators are pure infix/prefix wrappers, so _emit streams their
+        arguments straight into the output list. Arity None joins every arg.
 
         Steps:
-          1.1 Handle logical operators
-          1.2 Handle comparison operators
-          1.3 Handle arithmetic operators
-          1.4 Handle string operators
-          1.5 Handle date operators
-          1.6 Handle special operators
+          1.1 Logical, concat and coalesce operators (variadic)
+          1.2 Comparison, null-check and arithmetic operators (from format templates)
         """
-        op_name = op.op.lower()
-        args = [self.compile_expr(a, context) for a in op.args]
-
-        # 1.1 Logical operators
-        if op_name == "and":
-            return f"({' AND '.join(args)})"
-        if op_name == "or":
-            return f"({' OR '.join(args)})"
-        if op_name == "not":
-            return f"(NOT {args[0]})"
-
-        # 1.2 Comparison operators
-        if op_name == "eq":
-            return f"({args[0]} = {args[1]})"
-        if op_name == "ne":
-            return f"({args[0]} <> {args[1]})"
-        if op_name == "gt":
-            return f"({args[0]} > {args[1]})"
-        if op_name == "gte":
-            return f"({args[0]} >= {args[1]})"
-        if op_name == "lt":
-            return f"({args[0]} < {args[1]})"
-        if op_name == "lte":
-            return f"({args[0]} <= {args[1]})"
-
-        # IN operator
-        if op_name == "in":
-            values = ", ".join(args[1:])
-            return f"({args[0]} IN ({values}))"
-
-        # Null checks
-        if op_name == "isnull":
-            return f"({args[0]} IS NULL)"
-        if op_name == "isnotnull":
-            return f"({args[0]} IS NOT NULL)"
-
-        # 1.3 Arithmetic operators
-        if op_name == "add":
-            return f"({args[0]} + {args[1]})"
-        if op_name == "sub":
-            return f"({args[0]} - {args[1]})"
-        if op_name == "mul":
-            return f"({args[0]} * {args[1]})"
-        if op_name == "div":
-            return f"({args[0]} / {args[1]})"
-
-        # 1.4 String operators
-        if op_name == "contains":
-            return self._compile_contains(args[0], args[1])
-        if op_name == "startswith":
-            return self._compile_startswith(args[0], args[1])
-        if op_name == "endswith":
-            return self._compile_endswith(args[0], args[1])
-        if op_name == "concat":
-            return f"({f' {self.concat_op} '.join(args)})"
-        if op_name == "regex":
-            return self._compile_regex(args[0], args[1])
-
-        # 1.5 Date operators
-        if op_name == "dateadd":
-            return self._compile_dateadd(args)
-        if op_name == "datediffminutes":
-            return self._compile_datediff_minutes(args[0], args[1])
-
-        # 1.6 Special operators
-        if op_name == "coalesce":
-            return f"COALESCE({', '.join(args)})"
-        if op_name == "case":
-            return self._compile_case(op.args, context)
-        if op_name == "exists":
-            return f"EXISTS ({args[0]})"
-
-        # Unknown operator - emit as function call
-        return f"{op_name.upper()}({', '.join(args)})"
+        table: Dict[str, Tuple[str, str, str, Optional[int]]] = {
+            # 1.1 Variadic operators
+            "and": ("(", " AND ", ")", None),
+            "or": ("(", " OR ", ")", None),
+            "concat": ("(", f" {self.concat_op} ", ")", None),
+            "coalesce": ("COALESCE(", ", ", ")", None),
+        }
+        # 1.2 Template-driven operators
+        for name, fmt in _UNARY_OPS.items():
+            open_, close = fmt.split("{}")
+            table[name] = (open_, "", close, 1)
+        for name, fmt in _BINARY_OPS.items():
+            open_, sep, close = fmt.split("{}")
+            table[name] = (open_, sep, close, 2)
+        return {name: (_Frag(o), _Frag(sep), _Frag(c), n) for name, (o, sep, c, n) in table.items()}
+
+    def compile_op(self, op: Op, context: Optional[Dict[str, str]] = None) -> str:
+        """Compile an operation to SQL."""
+        return self.compile_expr(op, context)
 
     def _compile_contains(self, field: str, value: str) -> str:
         """Compile CONTAINS check."""
-        if self.target in ("tsql", "sqlserver"):
-            return f"(CHARINDEX({value}, {field}) > 0)"
-        return f"({field} LIKE '%' {self.concat_op} {value} {self.concat_op} '%')"
+        return self._contains_fmt.format(f=field, v=value)
 
     def _compile_startswith(self, field: str, value: str) -> str:
         """Compile STARTSWITH check."""
-        if self.target in ("tsql", "sqlserver"):
-            return f"({field} LIKE {value} + '%')"
-        return f"({field} LIKE {value} {self.concat_op} '%')"
+        return self._startswith_fmt.format(f=field, v=value)
 
     def _compile_endswith(self, field: str, value: str) -> str:
         """Compile ENDSWITH check."""
-        if self.target in ("tsql", "sqlserver"):
-            return f"({field} LIKE '%' + {value})"
-        return f"({field} LIKE '%' {self.concat_op} {value})"
+        return self._endswith_fmt.format(f=field, v=value)
 
     def _compile_regex(self, field: str, pattern: str) -> str:
         """Compile REGEX match."""
-        if self.target in ("tsql", "sqlserver"):
-            # SQL Server doesn't have native regex - use LIKE approximation
-            return f"({field} LIKE {pattern})"
-        if self.target == "postgres":
-            return f"({field} ~ {pattern})"
-        if self.target == "snowflake":
-            return f"(REGEXP_LIKE({field}, {pattern}))"
-        if self.target in ("spark", "databricks"):
-            return f"({field} RLIKE {pattern})"
-        return f"(REGEXP_LIKE({field}, {pattern}))"
+        return self._regex_fmt.format(f=field, p=pattern)
 
     def _compile_dateadd(self, args: List[str]) -> str:
         """Compile DATEADD operation."""
@@ -342,47 +392,32 @@ class DSLCompiler:
             return "NULL"
         unit, amount, date = args[0], args[1], args[2]
         # Remove quotes from unit if present
-        unit_clean = unit.strip("'\"").upper()
-
-        if self.target in ("tsql", "sqlserver"):
-            return f"DATEADD({unit_clean}, {amount}, {date})"
-        if self.target == "postgres":
-            return f"({date} + INTERVAL '{amount} {unit_clean}')"
-        if self.target == "snowflake":
-            return f"DATEADD({unit_clean}, {amount}, {date})"
-        if self.target in ("spark", "databricks"):
-            if unit_clean in ("DAY", "DAYS"):
-                return f"DATE_ADD({date}, {amount})"
-            return f"({date} + INTERVAL {amount} {unit_clean})"
-        return f"DATEADD({unit_clean}, {amount}, {date})"
+        unit_clean = _date_unit(unit)
+
+        if self._dateadd_day_fmt and unit_clean in ("DAY", "DAYS"):
+            return self._dateadd_day_fmt.format(d=date, n=amount)
+        return self._dateadd_fmt.format(u=unit_clean, n=amount, d=date)
 
     def _compile_datediff_minutes(self, date1: str, date2: str) -> str:
         """Compile DATEDIFF in minutes."""
-        if self.target in ("tsql", "sqlserver"):
-            return f"DATEDIFF(MINUTE, {date1}, {date2})"
-        if self.target == "postgres":
-            return f"EXTRACT(EPOCH FROM ({date2} - {date1})) / 60"
-        if self.target == "snowflake":
-            return f"DATEDIFF(MINUTE, {date1}, {date2})"
-        if self.target in ("spark", "databricks"):
-            return f"(UNIX_TIMESTAMP({date2}) - UNIX_TIMESTAMP({date1})) / 60"
-        return f"DATEDIFF(MINUTE, {date1}, {date2})"
+        return self._datediff_minutes_fmt.format(a=date1, b=date2)
 
     def _compile_case(self, args: List[Expr], context: Optional[Dict[str, str]] = None) -> str:
         """Compile CASE expression.
 
         Args format: [condition1, result1, condition2, result2, ..., else_result]
         """
+        return self._compile_case_args([self.compile_expr(a, context) for a in args])
+
+    def _compile_case_args(self, args: List[str]) -> str:
+        """Assemble CASE from already-compiled arguments."""
         parts = ["CASE"]
         i = 0
         while i < len(args) - 1:
-            cond = self.compile_expr(args[i], context)
-            result = self.compile_expr(args[i + 1], context)
-            parts.append(f"WHEN {cond} THEN {result}")
+            parts.append(f"WHEN {args[i]} THEN {args[i + 1]}")
             i += 2
         if i < len(args):
-            else_result = self.compile_expr(args[i], context)
-            parts.append(f"ELSE {else_result}")
+            parts.append(f"ELSE {args[i]}")
         parts.append("END")
         return " ".join(parts)
 
@@ -390,16 +425,99 @@ class DSLCompiler:
         """Compile any expression to SQL.
 
         Steps:
-          1.1 Dispatch to appropriate compiler
+          1.1 Emit fragments into a single buffer
+          1.2 Join once
         """
-        if isinstance(expr, Literal):
-            return self.compile_literal(expr)
-        if isinstance(expr, Ref):
-            return self.compile_ref(expr, context)
-        if isinstance(expr, Op):
-            return self.compile_op(expr, context)
-        # Unknown expression type
-        return "NULL"
+        out: List[str] = []
+        self._emit(expr, out, context)
+        return "".join(out)
+
+    def _emit(self, expr: Expr, out: List[str], context: Optional[Dict[str, str]]) -> None:
+        """Append the SQL fragments of any expression to out.
+
+        Walks the tree with an explicit stack instead of recursion. Stack items
+        are nodes still to compile, fixed fragments (_Frag), marks recording
+        where an argument starts in out, and combine steps for handler operators.
+
+        Steps:
+          1.1 Fragments, references and literals - append directly
+          1.2 Wrapper operators - push fragments and args in reverse order
+          1.3 IN - push first arg, then the candidate list
+          1.4 Handler/unknown operators - push a combine step, then marked args
+          1.5 Combine - collect the compiled args from out and dispatch
+        """
+        stack: List[Any] = [expr]
+        marks: List[int] = []
+        push = stack.append
+        pop = stack.pop
+        append = out.append
+        emit_table = self._emit_table
+        while stack:
+            item = pop()
+            t = type(item)
+            # 1.1 Leaves
+            if t is _Frag:
+                append(item)
+            elif t is Ref:
+                append(self.compile_ref(item, context))
+            elif t is Literal:
+                append(self.compile_literal(item))
+            elif t is Op:
+                op_name = item.op
+                args = item.args
+                shape = emit_table.get(op_name)
+                # 1.2 Wrapper operators
+                if shape is not None:
+                    open_, sep, close, arity = shape
+                    if arity is not None:
+                        if len(args) < arity:
+                            raise IndexError("list index out of range")
+                        args = args[:arity]
+                    push(close)
+                    for i in range(len(args) - 1, -1, -1):
+                        push(args[i])
+                        if i:
+                            push(sep)
+                    push(open_)
+                # 1.3 IN
+                elif op_name == "in":
+                    if not args:
+                        raise IndexError("list index out of range")
+                    push(_IN_CLOSE)
+                    for i in range(len(args) - 1, 0, -1):
+                        push(args[i])
+                        if i > 1:
+                            push(_COMMA)
+                    push(_IN_OPEN)
+                    push(args[0])
+                    push(_PAREN)
+                # 1.4 Handler/unknown operators
+                else:
+                    push(_Combine(item, op_name, len(args)))
+                    for a in reversed(args):
+                        push(a)
+                        push(_MARK)
+            elif item is _MARK:
+                marks.append(len(out))
+            elif t is _Combine:
+                # 1.5 Combine
+                n = item.n
+                compiled: List[str] = []
+                if n:
+                    starts = marks[-n:]
+                    del marks[-n:]
+                    ends = starts[1:] + [len(out)]
+                    compiled = ["".join(out[s:e]) for s, e in zip(starts, ends)]
+                    del out[starts[0]:]
+                handler = self._op_table.get(item.op_name)
+                if handler is not None:
+                    append(handler(compiled, item.op, context))
+                else:
+                    # Unknown operator - emit as function call
+                    append(f"{item.op_name.upper()}({', '.join(compiled)})")
+            else:
+                # Unknown expression type
+                append("NULL")
 
     def compile_guard(self, dsl: Any) -> str:
         """Compile a guard DSL to SQL WHERE clause.
@@ -408,41 +526,93 @@ class DSLCompiler:
           1.1 Parse DSL if needed
           1.2 Compile expression
         """
-        if isinstance(dsl, str):
-            parsed = parse_dsl(dsl)
-            expr = parsed.get("expr")
-        elif isinstance(dsl, dict):
-            if "expr" in dsl:
-                # Check if expr is already parsed or raw
-                raw_expr = dsl["expr"]
-                if isinstance(raw_expr, (Literal, Ref, Op)):
-                    expr = raw_expr
-                else:
-                    expr = parse_expr(raw_expr)
-            elif "op" in dsl or "ref" in dsl or "lit" in dsl:
-                # Direct expression dict
-                expr = parse_expr(dsl)
-            else:
-                parsed = parse_dsl(dsl)
-                expr = parsed.get("expr")
-        else:
-            expr = Literal(False, "boolean")
-
+        expr = guard_expr(dsl)
         if expr is None:
             return self.true_lit  # No guard = allow all
 
         return self.compile_expr(expr)
 
 
+def guard_expr(dsl: Any) -> Optional[Expr]:
+    """Extract the parsed guard expression from any accepted DSL input.
+
+    Returns None when the DSL has no expression (allow all).
+    """
+    if isinstance(dsl, str):
+        return parse_dsl(dsl).get("expr")
+    if isinstance(dsl, dict):
+        if "expr" in dsl:
+            # Check if expr is already parsed or raw
+            raw_expr = dsl["expr"]
+            if isinstance(raw_expr, (Literal, Ref, Op)):
+                return raw_expr
+            return parse_expr_cached(raw_expr)
+        if "op" in dsl or "ref" in dsl or "lit" in dsl:
+            # Direct expression dict
+            return parse_expr_cached(dsl)
+        return parse_dsl(dsl).get("expr")
+    return _FALSE
+
+
+_SQL_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_SQL_CACHE_SIZE = 4096
+
+
+def _expr_marker(obj: Any) -> Any:
+    """json.dumps hook: encode already-parsed Expr nodes structurally."""
+    if isinstance(obj, Literal):
+        return {"\x00lit": [obj.value, obj.type]}
+    if isinstance(obj, Ref):
+        return {"\x00ref": [obj.path, obj.cast]}
+    if isinstance(obj, Op):
+        return {"\x00op": [obj.op, obj.args]}
+    raise TypeError(type(obj).__name__)
+
+
+def _canonical(dsl: Any) -> Optional[str]:
+    """Canonical cache key for a DSL input, or None if it cannot be keyed."""
+    if isinstance(dsl, str):
+        return "s:" + dsl
+    try:
+        return "j:" + json.dumps(dsl, sort_keys=True, separators=(",", ":"), default=_expr_marker)
+    except (TypeError, ValueError):
+        return None
+
+
+_COMPILERS: Dict[str, DSLCompiler] = {}
+
+
+def compiler_for(target: str) -> DSLCompiler:
+    """Shared compiler for a target; dialect setup runs once per target.
+
+    Compilers hold no per-call state, so one instance serves every caller.
+    """
+    compiler = _COMPILERS.get(target)
+    if compiler is None:
+        compiler = _COMPILERS[target] = DSLCompiler(target)
+    return compiler
+
+
 def compile_dsl(dsl: Any, target: str = "tsql") -> str:
     """Compile DSL expression to SQL.
 
     Steps:
-      1.1 Create compiler
-      1.2 Compile guard
+      1.1 Look up (target, canonical DSL) in the compiled-SQL cache
+      1.2 On a miss, compile the guard with the target's shared compiler
     """
-    compiler = DSLCompiler(target)
-    return compiler.compile_guard(dsl)
+    key = _canonical(dsl)
+    if key is None:
+        return compiler_for(target).compile_guard(dsl)
+    cache_key = (target, key)
+    sql = _SQL_CACHE.get(cache_key)
+    if sql is not None:
+        _SQL_CACHE.move_to_end(cache_key)
+        return sql
+    sql = compiler_for(target).compile_guard(dsl)
+    _SQL_CACHE[cache_key] = sql
+    if len(_SQL_CACHE) > _SQL_CACHE_SIZE:
+        _SQL_CACHE.popitem(last=False)
+    return sql
 
 
 def compile_guard_to_sql(guard_dsl: Any, target: str = "tsql") -> str:
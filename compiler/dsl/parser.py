@@ -8,11 +8,14 @@ Steps:
 """
 
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Hashable, List, Optional, Union
 
 
-@dataclass
+# Parsed trees may be shared through the parse cache, so nodes are frozen;
+# slots keep nodes compact and attribute reads fast.
+@dataclass(frozen=True, slots=True)
 class Literal:
     """A literal value."""
     value: Any
@@ -22,7 +25,7 @@ class Literal:
         return f"Literal({self.value!r})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Ref:
     """A reference to a field or context value."""
     path: str
@@ -32,19 +35,34 @@ class Ref:
         return f"Ref({self.path!r})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Op:
     """An operation with arguments."""
     op: str
     args: List[Expr]
 
+    def __post_init__(self) -> None:
+        # Operator names are case-insensitive; canonicalize once at build time
+        if isinstance(self.op, str):
+            object.__setattr__(self, "op", self.op.lower())
+
     def __repr__(self) -> str:
         return f"Op({self.op}, {self.args})"
 
+    def __hash__(self) -> int:
+        return hash((self.op, tuple(self.args)))
+
 
 # Expression type
 Expr = Union[Literal, Ref, Op]
 
+# Interned nodes for the most common guard values; shared, never mutated.
+_TRUE = Literal(True, "boolean")
+_FALSE = Literal(False, "boolean")
+_NULL = Literal(None, "null")
+_TENANT_GUARD = Op("eq", [Ref("_TenantID"), Ref("context.tenantId")])
+_SMALL_INTS = {n: Literal(n, "number") for n in range(-1, 16)}
+
 
 def parse_expr(node: Any) -> Expr:
     """Parse an expression node from DSL JSON.
@@ -56,22 +74,26 @@ def parse_expr(node: Any) -> Expr:
       1.4 Return parsed expression
     """
     if node is None:
-        return Literal(None, "null")
+        return _NULL
 
     if isinstance(node, bool):
-        return Literal(node, "boolean")
+        return _TRUE if node else _FALSE
 
     if isinstance(node, (int, float)):
+        if type(node) is int:
+            lit = _SMALL_INTS.get(node)
+            if lit is not None:
+                return lit
         return Literal(node, "number")
 
     if isinstance(node, str):
         # Simple string - check for shorthand
         if node in ("allow", "true", "1=1"):
-            return Literal(True, "boolean")
+            return _TRUE
         if node in ("deny", "false", "1=0"):
-            return Literal(False, "boolean")
+            return _FALSE
         if node == "tenant":
-            return Op("eq", [Ref("_TenantID"), Ref("context.tenantId")])
+            return _TENANT_GUARD
         return Literal(node, "string")
 
     if not isinstance(node, dict):
@@ -95,6 +117,44 @@ def parse_expr(node: Any) -> Expr:
     return Literal(node, "object")
 
 
+_PARSE_CACHE: "OrderedDict[Hashable, Expr]" = OrderedDict()
+_PARSE_CACHE_SIZE = 4096
+
+
+def _freeze(node: Any) -> Hashable:
+    """Hashable, type-preserving key for a DSL JSON node."""
+    if isinstance(node, dict):
+        return ("d", tuple(sorted((k, _freeze(v)) for k, v in node.items())))
+    if isinstance(node, list):
+        return ("l", tuple(_freeze(v) for v in node))
+    if isinstance(node, tuple):
+        return ("t", tuple(_freeze(v) for v in node))
+    hash(node)
+    return (type(node).__name__, node)
+
+
+def parse_expr_cached(node: Any) -> Expr:
+    """parse_expr with memoization on the node's structure.
+
+    The returned tree is shared between callers and must not be mutated.
+    """
+    if not isinstance(node, dict):
+        return parse_expr(node)
+    try:
+        key = _freeze(node)
+    except TypeError:
+        return parse_expr(node)
+    expr = _PARSE_CACHE.get(key)
+    if expr is not None:
+        _PARSE_CACHE.move_to_end(key)
+        return expr
+    expr = parse_expr(node)
+    _PARSE_CACHE[key] = expr
+    if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return expr
+
+
 def parse_dsl(dsl: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Parse a full DSL document.
 
@@ -110,23 +170,19 @@ def parse_dsl(dsl: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     if isinstance(dsl, str):
         # Handle shorthand strings
         if dsl in ("allow", "true", "1=1"):
-            return {"kind": "Guard", "version": 1, "expr": Literal(True, "boolean")}
+            return {"kind": "Guard", "version": 1, "expr": _TRUE}
         if dsl in ("deny", "false", "1=0"):
-            return {"kind": "Guard", "version": 1, "expr": Literal(False, "boolean")}
+            return {"kind": "Guard", "version": 1, "expr": _FALSE}
         if dsl == "tenant":
-            return {
-                "kind": "Guard",
-                "version": 1,
-                "expr": Op("eq", [Ref("_TenantID"), Ref("context.tenantId")])
-            }
+            return {"kind": "Guard", "version": 1, "expr": _TENANT_GUARD}
         try:
             dsl = json.loads(dsl)
         except json.JSONDecodeError:
             # Treat as unknown string literal
-            return {"kind": "Guard", "version": 1, "expr": Literal(False, "boolean")}
+            return {"kind": "Guard", "version": 1, "expr": _FALSE}
 
     if not isinstance(dsl, dict):
-        return {"kind": "Guard", "version": 1, "expr": Literal(False, "boolean")}
+        return {"kind": "Guard", "version": 1, "expr": _FALSE}
 
     result = {
         "kind": dsl.get("kind", "Guard"),
@@ -137,7 +193,7 @@ def parse_dsl(dsl: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
 
     # 1.3 Parse expression if present
     if "expr" in dsl:
-        result["expr"] = parse_expr(dsl["expr"])
+        result["expr"] = parse_expr_cached(dsl["expr"])
 
     # 1.4 Parse actions if present
     if "actions" in dsl:
@@ -0,0 +1,388 @@
+"""Python target - compiles guard expression trees to native Python callables.
+
+Steps:
+  1.1 Walk the expression tree and emit Python source
+  1.2 Compile the source once into a code object
+  1.3 Cache the resulting callable by structural DSL key
+
+A compiled guard is called as guard(row, ctx): row maps column names to values,
+ctx holds context values (tenantId, userId, now) and a "user" mapping.
+Missing values are SQL NULL: operators follow three-valued logic (None is
+UNKNOWN), and the guard only passes when the result is true, mirroring a SQL
+WHERE clause.
+"""
+
+from __future__ import annotations
+import math
+import operator
+import re
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+from .compiler import _canonical, guard_expr
+from .parser import Expr, Literal, Ref, Op
+
+
+_EMPTY: Dict[str, Any] = {}
+
+
+def _null_safe(fn: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    def wrapped(a: Any, b: Any) -> Any:
+        if a is None or b is None:
+            return None
+        return fn(a, b)
+    return wrapped
+
+
+def _not(a: Any) -> Optional[bool]:
+    return None if a is None else not a
+
+
+def _and(*args: Any) -> Optional[bool]:
+    """SQL AND: false if any arg is false, else unknown if any is unknown."""
+    result: Optional[bool] = True
+    for a in args:
+        if a is None:
+            result = None
+        elif not a:
+            return False
+    return result
+
+
+def _or(*args: Any) -> Optional[bool]:
+    """SQL OR: true if any arg is true, else unknown if any is unknown."""
+    result: Optional[bool] = False
+    for a in args:
+        if a is None:
+            result = None
+        elif a:
+            return True
+    return result
+
+
+def _in(f: Any, *candidates: Any) -> Optional[bool]:
+    """SQL IN: unknown when f is NULL, or when nothing matches and a candidate is NULL."""
+    if f is None:
+        return None
+    result: Optional[bool] = False
+    for c in candidates:
+        if c is None:
+            result = None
+        elif f == c:
+            return True
+    return result
+
+
+def _contains(f: Any, v: Any) -> Optional[bool]:
+    return None if f is None or v is None else str(v) in str(f)
+
+
+def _startswith(f: Any, v: Any) -> Optional[bool]:
+    return None if f is None or v is None else str(f).startswith(str(v))
+
+
+def _endswith(f: Any, v: Any) -> Optional[bool]:
+    return None if f is None or v is None else str(f).endswith(str(v))
+
+
+def _regex(f: Any, p: Any) -> Optional[bool]:
+    return None if f is None or p is None else re.search(str(p), str(f)) is not None
+
+
+def _concat(*args: Any) -> Optional[str]:
+    if any(a is None for a in args):
+        return None
+    return "".join(str(a) for a in args)
+
+
+def _coalesce(*args: Any) -> Any:
+    for a in args:
+        if a is not None:
+            return a
+    return None
+
+
+_DATE_UNITS = {
+    "SECOND": "seconds", "SECONDS": "seconds",
+    "MINUTE": "minutes", "MINUTES": "minutes",
+    "HOUR": "hours", "HOURS": "hours",
+    "DAY": "days", "DAYS": "days",
+    "WEEK": "weeks", "WEEKS": "weeks",
+}
+
+
+def _dateadd(unit: Any, amount: Any, date: Any) -> Optional[datetime]:
+    if amount is None or date is None:
+        return None
+    key = _DATE_UNITS.get(str(unit).upper())
+    if key is None:
+        raise ValueError(f"Unsupported dateadd unit for python target: {unit}")
+    return date + timedelta(**{key: amount})
+
+
+def _datediff_minutes(a: Any, b: Any) -> Optional[float]:
+    if a is None or b is None:
+        return None
+    return (b - a).total_seconds() / 60
+
+
+def _now(ctx: Dict[str, Any]) -> datetime:
+    now = ctx.get("now")
+    return now if now is not None else datetime.now(timezone.utc)
+
+
+def _cast(value: Any, cast_type: str) -> Any:
+    if value is None:
+        return None
+    conv = _CASTS.get(cast_type.lower())
+    return conv(value) if conv else value
+
+
+_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "int": int,
+    "integer": int,
+    "number": float,
+    "string": str,
+    "boolean": bool,
+    "datetime": lambda v: v if isinstance(v, datetime) else datetime.fromisoformat(str(v)),
+}
+
+# Names visible to generated guard code
+_RUNTIME: Dict[str, Any] = {
+    "__builtins__": {},
+    "float": float,
+    "_EMPTY": _EMPTY,
+    "_eq": _null_safe(operator.eq),
+    "_ne": _null_safe(operator.ne),
+    "_not": _not,
+    "_and": _and,
+    "_or": _or,
+    "_in": _in,
+    "_gt": _null_safe(operator.gt),
+    "_gte": _null_safe(operator.ge),
+    "_lt": _null_safe(operator.lt),
+    "_lte": _null_safe(operator.le),
+    "_add": _null_safe(operator.add),
+    "_sub": _null_safe(operator.sub),
+    "_mul": _null_safe(operator.mul),
+    "_div": _null_safe(operator.truediv),
+    "_contains": _contains,
+    "_startswith": _startswith,
+    "_endswith": _endswith,
+    "_regex": _regex,
+    "_concat": _concat,
+    "_coalesce": _coalesce,
+    "_dateadd": _dateadd,
+    "_datediff_minutes": _datediff_minutes,
+    "_now": _now,
+    "_cast": _cast,
+}
+
+# Operators emitted as runtime helper calls: name -> (helper, arity; None = variadic)
+_CALL_OPS = {
+    "and": ("_and", None), "or": ("_or", None), "not": ("_not", 1),
+    "eq": ("_eq", 2), "ne": ("_ne", 2),
+    "gt": ("_gt", 2), "gte": ("_gte", 2), "lt": ("_lt", 2), "lte": ("_lte", 2),
+    "add": ("_add", 2), "sub": ("_sub", 2), "mul": ("_mul", 2), "div": ("_div", 2),
+    "contains": ("_contains", 2), "startswith": ("_startswith", 2),
+    "endswith": ("_endswith", 2), "regex": ("_regex", 2),
+    "datediffminutes": ("_datediff_minutes", 2),
+    "concat": ("_concat", None), "coalesce": ("_coalesce", None),
+}
+
+# Operators emitted inline: name -> (open, separator, close, arity; None = variadic).
+# Only NULL checks qualify: every other operator must propagate None as UNKNOWN.
+_INLINE_OPS = {
+    "isnull": ("(", "", " is None)", 1),
+    "isnotnull": ("(", "", " is not None)", 1),
+}
+
+
+class CompiledGuard:
+    """A guard compiled to a Python predicate; call as guard(row, ctx)."""
+
+    __slots__ = ("source", "fn")
+
+    def __init__(self, source: str, fn: Callable[[Dict[str, Any], Dict[str, Any]], Any]):
+        self.source = source
+        self.fn = fn
+
+    def __call__(self, row: Dict[str, Any], ctx: Optional[Dict[str, Any]] = None) -> bool:
+        return bool(self.fn(row, _EMPTY if ctx is None else ctx))
+
+    def __repr__(self) -> str:
+        return f"CompiledGuard({self.source!r})"
+
+
+class PythonEmitter:
+    """Emits Python source for an expression tree."""
+
+    def compile_expr(self, expr: Expr) -> str:
+        """Compile any expression to a Python expression string."""
+        out: List[str] = []
+        self._emit(expr, out)
+        return "".join(out)
+
+    def compile_lambda(self, expr: Optional[Expr]) -> str:
+        """Wrap an expression as lambda source over (row, ctx)."""
+        body = "True" if expr is None else self.compile_expr(expr)
+        return f"lambda row, ctx: {body}"
+
+    def _emit(self, expr: Expr, out: List[str]) -> None:
+        if isinstance(expr, Op):
+            self._emit_op(expr, out)
+        elif isinstance(expr, Ref):
+            self._emit_ref(expr, out)
+        elif isinstance(expr, Literal):
+            out.append(self._literal(expr.value))
+        else:
+            # Unknown expression type
+            out.append("None")
+
+    def _literal(self, value: Any) -> str:
+        """Compile a literal value to Python source.
+
+        Steps:
+          1.1 None, booleans, strings and finite numbers via repr
+          1.2 Non-finite floats via float()
+          1.3 Complex objects as their string form (same as the SQL targets)
+        """
+        if value is None or isinstance(value, (bool, int, str)):
+            return repr(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else f"float({str(value)!r})"
+        return repr(str(value))
+
+    def _emit_ref(self, ref: Ref, out: List[str]) -> None:
+        """Compile a reference to a row/context lookup.
+
+        Steps:
+          1.1 context.now - supplied value or current UTC time
+          1.2 context.* - ctx lookup
+          1.3 user.* - lookup in ctx["user"]
+          1.4 Column reference - row lookup, optionally cast
+        """
+        path = ref.path
+        if path == "context.now":
+            out.append("_now(ctx)")
+            return
+        if path.startswith("context."):
+            out.append(f"ctx.get({path[8:]!r})")
+            return
+        if path.startswith("user."):
+            out.append(f"ctx.get('user', _EMPTY).get({path[5:]!r})")
+            return
+        if ref.cast:
+            out.append(f"_cast(row.get({path!r}), {ref.cast!r})")
+        else:
+            out.append(f"row.get({path!r})")
+
+    def _emit_args(self, args: List[Expr], out: List[str], sep: str) -> None:
+        for i, a in enumerate(args):
+            if i:
+                out.append(sep)
+            self._emit(a, out)
+
+    def _emit_op(self, op: Op, out: List[str]) -> None:
+        """Append the Python source of an operation to out.
+
+        Steps:
+          1.1 Inline operators
+          1.2 Runtime helper calls
+          1.3 IN, CASE and DATEADD
+          1.4 Unsupported operator - refuse to compile
+        """
+        op_name = op.op
+        args = op.args
+
+        # 1.1 Inline operators
+        shape = _INLINE_OPS.get(op_name)
+        if shape is not None:
+            open_, sep, close, arity = shape
+            if arity is not None:
+                if len(args) < arity:
+                    raise IndexError("list index out of range")
+                args = args[:arity]
+            out.append(open_)
+            self._emit_args(args, out, sep)
+            out.append(close)
+            return
+
+        # 1.2 Runtime helper calls
+        call = _CALL_OPS.get(op_name)
+        if call is not None:
+            helper, arity = call
+            if arity is not None:
+                if len(args) < arity:
+                    raise IndexError("list index out of range")
+                args = args[:arity]
+            out.append(helper + "(")
+            self._emit_args(args, out, ", ")
+            out.append(")")
+            return
+
+        # 1.3 IN, CASE and DATEADD
+        if op_name == "in":
+            if not args:
+                raise IndexError("list index out of range")
+            out.append("_in(")
+            self._emit_args(args, out, ", ")
+            out.append(")")
+            return
+        if op_name == "case":
+            # [condition1, result1, condition2, result2, ..., else_result]
+            pairs = len(args) // 2
+            for i in range(pairs):
+                out.append("(")
+                self._emit(args[2 * i + 1], out)
+                out.append(" if ")
+                self._emit(args[2 * i], out)
+                out.append(" else ")
+            if len(args) % 2:
+                self._emit(args[-1], out)
+            else:
+                out.append("None")
+            out.append(")" * pairs)
+            return
+        if op_name == "dateadd":
+            if len(args) < 3:
+                out.append("None")
+                return
+            out.append("_dateadd(")
+            self._emit_args(args[:3], out, ", ")
+            out.append(")")
+            return
+
+        # 1.4 Unsupported operator
+        raise ValueError(f"Unsupported operator for python target: {op.op}")
+
+
+_GUARD_CACHE: "OrderedDict[str, CompiledGuard]" = OrderedDict()
+_GUARD_CACHE_SIZE = 4096
+
+
+def _build_guard(dsl: Any) -> CompiledGuard:
+    source = PythonEmitter().compile_lambda(guard_expr(dsl))
+    fn = eval(compile(source, "<guard>", "eval"), dict(_RUNTIME))
+    return CompiledGuard(source, fn)
+
+
+def compile_guard_to_python(guard_dsl: Any) -> CompiledGuard:
+    """Compile guard DSL to a Python predicate.
+
+    Steps:
+      1.1 Look up the canonical DSL in the compiled-guard cache
+      1.2 On a miss, emit, compile and cache the callable
+    """
+    key = _canonical(guard_dsl)
+    if key is None:
+        return _build_guard(guard_dsl)
+    guard = _GUARD_CACHE.get(key)
+    if guard is not None:
+        _GUARD_CACHE.move_to_end(key)
+        return guard
+    guard = _build_guard(guard_dsl)
+    _GUARD_CACHE[key] = guard
+    if len(_GUARD_CACHE) > _GUARD_CACHE_SIZE:
+        _GUARD_CACHE.popitem(last=False)
+    return guard
@@ -0,0 +1,84 @@
+"""Table-streaming emitter protocol and the fused multi-dialect emitter.
+
+Steps:
+  1.1 begin() writes the file header and returns per-emit state
+  1.2 table() writes one table's DDL from its precomputed column view
+  1.3 end() writes the footer
+  2.1 MultiDialectEmitter drives several emitters in one pass over the IR
+  2.2 On free-threaded interpreters, dialects run concurrently instead
+"""
+
+from __future__ import annotations
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+from ..ir import ColumnView, ProjectIR, TableIR, column_views
+
+Write = Callable[[str], Any]
+
+# Emitting is pure-Python CPU work, so threads only pay off without the GIL
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class TableStreamEmitter:
+    """Base for emitters that write one output file table by table."""
+    name = ""
+    path = ""
+
+    def begin(self, ir: ProjectIR, options: Dict[str, Any], w: Write) -> Any:
+        return None
+
+    def table(self, state: Any, tb: TableIR, view: List[ColumnView], w: Write) -> None:
+        raise NotImplementedError
+
+    def end(self, state: Any, w: Write) -> None:
+        pass
+
+    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
+        buf = io.StringIO()
+        w = buf.write
+        state = self.begin(ir, options, w)
+        table = self.table
+        for tb, view in zip(ir.tables, column_views(ir)):
+            table(state, tb, view, w)
+        self.end(state, w)
+        return {self.path: buf.getvalue()}
+
+
+class MultiDialectEmitter:
+    """Emits several dialects while walking ir.tables once."""
+    name = "multi"
+
+    def __init__(self, emitters: Iterable[TableStreamEmitter]):
+        self.emitters = list(emitters)
+
+    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
+        """Emit every dialect's files.
+
+        Steps:
+          1.1 Open one buffer per dialect and write headers
+          1.2 Walk the tables once, writing each into every dialect
+          1.3 Write footers and return the merged file map
+          2.1 Without a GIL, run each dialect's emit() on its own thread
+        """
+        if not _GIL_ENABLED and len(self.emitters) > 1:
+            return self._emit_threaded(ir, options)
+        bufs = [io.StringIO() for _ in self.emitters]
+        steps = [(e.table, e.begin(ir, options, b.write), b.write) for e, b in zip(self.emitters, bufs)]
+        for tb, view in zip(ir.tables, column_views(ir)):
+            for table, state, w in steps:
+                table(state, tb, view, w)
+        files: Dict[str, str] = {}
+        for e, (_, state, w), b in zip(self.emitters, steps, bufs):
+            e.end(state, w)
+            files[e.path] = b.getvalue()
+        return files
+
+    def _emit_threaded(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
+        column_views(ir)  # fill the shared memo before the IR is read concurrently
+        files: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=len(self.emitters)) as ex:
+            for result in ex.map(lambda e: e.emit(ir, options), self.emitters):
+                files.update(result)
+        return files
@@ -1,21 +1,27 @@
 from __future__ import annotations
-from typing import Dict, Any
-from ..ir import ProjectIR
+from functools import lru_cache
+from typing import Dict, Any, List
+from ..ir import ColumnView, ProjectIR, TableIR
+from .base import TableStreamEmitter, Write
 
 BQ_TYPE_MAP={"uuidv7":"STRING","datetime2":"TIMESTAMP"}
+@lru_cache(maxsize=256)
 def map_type(t: str) -> str:
     return BQ_TYPE_MAP.get(t, "STRING" if "nvarchar" in t else t.upper())
 
-class BigQueryEmitter:
+class BigQueryEmitter(TableStreamEmitter):
     name="bigquery"
-    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
+    path="sql/10-data-plane.bigquery.sql"
+    def begin(self, ir: ProjectIR, options: Dict[str, Any], w: Write) -> str:
         dataset=options.get("dataset","dp")
-        lines=[f"-- BigQuery DDL (starter) dataset={dataset}"]
-        for tb in ir.tables:
-            table=f"`{dataset}.{tb.code}`"
-            cols=[]
-            for f in tb.fields:
-                cols.append(f"  {f.code} {map_type(f.type)}" + (" NOT NULL" if not f.nullable else ""))
-            lines.append(f"CREATE TABLE IF NOT EXISTS {table} (\n" + ",\n".join(cols) + "\n);\n")
-        lines.append("-- Security: emit Row Access Policies / Authorized Views (future)")
-        return {"sql/10-data-plane.bigquery.sql":"\n".join(lines)}
+        w(f"-- BigQuery DDL (starter) dataset={dataset}")
+        return f"\nCREATE TABLE IF NOT EXISTS `{dataset}."
+    def table(self, prefix: str, tb: TableIR, view: List[ColumnView], w: Write) -> None:
+        # Fragments are written flat; separators are explicit.
+        w(prefix); w(tb.code); w("` (\n")
+        for i, (code, ftype, null_clause, _) in enumerate(view):
+            if i: w(",\n")
+            w("  "); w(code); w(" "); w(map_type(ftype)); w(null_clause)
+        w("\n);\n")
+    def end(self, state: Any, w: Write) -> None:
+        w("\n-- Security: emit Row Access Policies / Authorized Views (future)")
@@ -1,23 +1,25 @@
 from __future__ import annotations
-from typing import Dict, Any
-from ..ir import ProjectIR
+from functools import lru_cache
+from typing import Dict, Any, List
+from ..ir import ColumnView, ProjectIR, TableIR
+from .base import TableStreamEmitter, Write
 
 PG_TYPE_MAP={"uuidv7":"uuid","datetime2":"timestamptz"}
+@lru_cache(maxsize=256)
 def map_type(t: str) -> str:
     return PG_TYPE_MAP.get(t, t.replace("nvarchar","varchar"))
 
-class PostgresEmitter:
+class PostgresEmitter(TableStreamEmitter):
     name="postgres"
-    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
-        lines=["-- Generated Postgres DDL (starter)"]
-        for tb in ir.tables:
-            lines.append(f'CREATE SCHEMA IF NOT EXISTS "{tb.schema}";')
-            cols=[]
-            for f in tb.fields:
-                cols.append(f'"{f.code}" {map_type(f.type)} {"NOT NULL" if not f.nullable else ""}'.strip())
-            pk = next((f for f in tb.fields if f.code.endswith("_ID")), None)
-            if pk:
-                cols.append(f'CONSTRAINT pk_{tb.code.lower()} PRIMARY KEY ("{pk.code}")')
-            lines.append(f'CREATE TABLE IF NOT EXISTS "{tb.schema}"."{tb.code}" (\n  ' + ",\n  ".join(cols) + "\n);\n")
-        lines.append("-- RLS: enable row level security and add policies using _TenantID")
-        return {"sql/10-data-plane.postgres.sql":"\n".join(lines)}
+    path="sql/10-data-plane.postgres.sql"
+    def begin(self, ir: ProjectIR, options: Dict[str, Any], w: Write) -> None:
+        w("-- Generated Postgres DDL (starter)\n")
+    def table(self, state: Any, tb: TableIR, view: List[ColumnView], w: Write) -> None:
+        w(f'CREATE SCHEMA IF NOT EXISTS "{tb.schema}";\n')
+        cols=[f'"{code}" {map_type(ftype)}{null_clause}'.rstrip() for code, ftype, null_clause, _ in view]
+        pk = next((f.code for f in tb.fields if f.is_pk_candidate), None)
+        if pk:
+            cols.append(f'CONSTRAINT pk_{tb.code.lower()} PRIMARY KEY ("{pk}")')
+        w(f'CREATE TABLE IF NOT EXISTS "{tb.schema}"."{tb.code}" (\n  ' + ",\n  ".join(cols) + "\n);\n\n")
+    def end(self, state: Any, w: Write) -> None:
+        w("-- RLS: enable row level security and add policies using _TenantID")
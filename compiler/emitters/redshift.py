@@ -1,20 +1,25 @@
 from __future__ import annotations
-from typing import Dict, Any
-from ..ir import ProjectIR
+from functools import lru_cache
+from typing import Dict, Any, List
+from ..ir import ColumnView, ProjectIR, TableIR
+from .base import TableStreamEmitter, Write
 
 RS_TYPE_MAP={"uuidv7":"VARCHAR(36)","datetime2":"TIMESTAMP"}
+@lru_cache(maxsize=256)
 def map_type(t: str) -> str:
     return RS_TYPE_MAP.get(t, "VARCHAR(256)" if "nvarchar" in t else t.upper())
 
-class RedshiftEmitter:
+# prefix, table code, column block: one write per table
+_TABLE_TMPL="%s%s (\n%s\n);\n\n"
+
+class RedshiftEmitter(TableStreamEmitter):
     name="redshift"
-    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
+    path="sql/10-data-plane.redshift.sql"
+    def begin(self, ir: ProjectIR, options: Dict[str, Any], w: Write) -> str:
         schema=options.get("schema","dp")
-        lines=[f"-- Redshift DDL (starter) schema={schema}", f"CREATE SCHEMA IF NOT EXISTS {schema};\n"]
-        for tb in ir.tables:
-            cols=[]
-            for f in tb.fields:
-                cols.append(f"  {f.code} {map_type(f.type)}" + (" NOT NULL" if not f.nullable else ""))
-            lines.append(f"CREATE TABLE IF NOT EXISTS {schema}.{tb.code} (\n" + ",\n".join(cols) + "\n);\n")
-        lines.append("-- Security: views-first + GRANTs (future)")
-        return {"sql/10-data-plane.redshift.sql":"\n".join(lines)}
+        w(f"-- Redshift DDL (starter) schema={schema}\nCREATE SCHEMA IF NOT EXISTS {schema};\n\n")
+        return f"CREATE TABLE IF NOT EXISTS {schema}."
+    def table(self, prefix: str, tb: TableIR, view: List[ColumnView], w: Write) -> None:
+        w(_TABLE_TMPL % (prefix, tb.code, ",\n".join([f"  {code} {map_type(ftype)}{null_clause}" for code, ftype, null_clause, _ in view])))
+    def end(self, state: Any, w: Write) -> None:
+        w("-- Security: views-first + GRANTs (future)")
@@ -9,8 +9,10 @@ Steps:
 """
 
 from __future__ import annotations
-from typing import Dict, Any
-from ..ir import ProjectIR
+from functools import lru_cache
+from typing import Dict, Any, List
+from ..ir import ColumnView, ProjectIR, TableIR
+from .base import TableStreamEmitter, Write
 
 
 # Type mapping: OZMetaDB type -> Snowflake type
@@ -33,94 +35,95 @@ SNOWFLAKE_TYPE_MAP = {
 }
 
 
+# Parameterized types, keyed by the name before "(": (type, lowered) -> Snowflake type
+_PARAM_TYPES = {
+    "nvarchar": lambda t, t_lower: t.upper().replace("NVARCHAR", "VARCHAR"),
+    "varchar": lambda t, t_lower: t.upper(),
+}
+
+
+@lru_cache(maxsize=256)
 def map_type(t: str) -> str:
     """Map OZMetaDB type to Snowflake type."""
     t_lower = t.lower()
-    if t_lower in SNOWFLAKE_TYPE_MAP:
-        return SNOWFLAKE_TYPE_MAP[t_lower]
-    # Handle nvarchar(N) -> VARCHAR(N)
-    if t_lower.startswith("nvarchar"):
-        return t.upper().replace("NVARCHAR", "VARCHAR")
-    if t_lower.startswith("varchar"):
-        return t.upper()
-    return "VARCHAR(1000)"
-
-
-class SnowflakeEmitter:
-    """Snowflake DDL emitter."""
+    mapped = SNOWFLAKE_TYPE_MAP.get(t_lower)
+    if mapped is not None:
+        return mapped
+    # Handle nvarchar(N) -> VARCHAR(N), varchar(N) as-is
+    param = _PARAM_TYPES.get(t_lower.partition("(")[0].rstrip())
+    return param(t, t_lower) if param else "VARCHAR(1000)"
+
+
+# Statement templates (%-formatted in the tables loop)
+_SCHEMA_TMPL = 'CREATE SCHEMA IF NOT EXISTS "%s";\n'
+_FQN = '"%s"."%s"'
+_TABLE_HEAD = 'CREATE TABLE IF NOT EXISTS %s (\n'
+_COL_TMPL = '    "%s" %s%s,\n'
+_CLUSTER_BY = 'ALTER TABLE %s CLUSTER BY ("_CreateDate");\n\n'
+
+# Audit/soft-delete columns appended to every table (no trailing separator)
+_SOFT_DELETE_COLUMNS = ",\n".join([
+    '    "_CreateDate" TIMESTAMP_NTZ NOT NULL DEFAULT CURRENT_TIMESTAMP()',
+    '    "_CreatedBy" VARCHAR(128)',
+    '    "_UpdateDate" TIMESTAMP_NTZ',
+    '    "_UpdatedBy" VARCHAR(128)',
+    '    "_DeleteDate" TIMESTAMP_NTZ',
+    '    "_DeletedBy" VARCHAR(128)',
+])
+
+
+class SnowflakeEmitter(TableStreamEmitter):
+    """Snowflake DDL emitter.
+
+    Steps:
+      1.1 Collect unique schemas
+      1.2 Generate schema DDL
+      2.1 Generate table DDL with columns
+      2.2 Add soft-delete columns
+      3.1 Add row access policy notes
+    """
     name = "snowflake"
-
-    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
-        """Emit Snowflake DDL files.
-
-        Steps:
-          1.1 Collect unique schemas
-          1.2 Generate schema DDL
-          2.1 Generate table DDL with columns
-          2.2 Add soft-delete columns
-          3.1 Return file map
-        """
-        lines = [
-            "-- Generated Snowflake DDL",
-            "-- OZMetaDB Compiler",
-            "",
-            "-- Note: Run with appropriate role and warehouse",
-            "-- USE ROLE SYSADMIN;",
-            "-- USE WAREHOUSE COMPUTE_WH;",
-            "",
-        ]
-
-        # 1.1 Collect unique schemas
-        schemas = set()
-        for tb in ir.tables:
-            schemas.add(tb.schema)
+    path = "sql/10-data-plane.snowflake.sql"
+
+    def begin(self, ir: ProjectIR, options: Dict[str, Any], w: Write) -> None:
+        w(
+            "-- Generated Snowflake DDL\n"
+            "-- OZMetaDB Compiler\n"
+            "\n"
+            "-- Note: Run with appropriate role and warehouse\n"
+            "-- USE ROLE SYSADMIN;\n"
+            "-- USE WAREHOUSE COMPUTE_WH;\n"
+            "\n"
+        )
+
+        # 1.1 Collect unique schemas (with their upper-cased names)
+        schemas = {tb.schema: tb.schema_upper for tb in ir.tables}
 
         # 1.2 Generate schema DDL
         for schema in sorted(schemas):
-            lines.append(f'CREATE SCHEMA IF NOT EXISTS "{schema.upper()}";')
-        lines.append("")
+            w(_SCHEMA_TMPL % schemas[schema])
+        w("\n")
 
+    def table(self, state: Any, tb: TableIR, view: List[ColumnView], w: Write) -> None:
         # 2.1 Generate table DDL
-        for tb in ir.tables:
-            schema_upper = tb.schema.upper()
-            table_upper = tb.code.upper()
-
-            cols = []
-            pk_col = None
-
-            for f in tb.fields:
-                col_type = map_type(f.type)
-                null_clause = "" if f.nullable else " NOT NULL"
-                cols.append(f'    "{f.code}" {col_type}{null_clause}')
-                if f.code.endswith("_ID") and pk_col is None:
-                    pk_col = f.code
-
-            # 2.2 Add soft-delete columns
-            cols.extend([
-                '    "_CreateDate" TIMESTAMP_NTZ NOT NULL DEFAULT CURRENT_TIMESTAMP()',
-                '    "_CreatedBy" VARCHAR(128)',
-                '    "_UpdateDate" TIMESTAMP_NTZ',
-                '    "_UpdatedBy" VARCHAR(128)',
-                '    "_DeleteDate" TIMESTAMP_NTZ',
-                '    "_DeletedBy" VARCHAR(128)',
-            ])
-
-            lines.append(f'CREATE TABLE IF NOT EXISTS "{schema_upper}"."{table_upper}" (')
-            lines.append(",\n".join(cols))
-            lines.append(");")
-            lines.append("")
-
-            # Add clustering key on _CreateDate for time-series queries
-            lines.append(f'ALTER TABLE "{schema_upper}"."{table_upper}" CLUSTER BY ("_CreateDate");')
-            lines.append("")
-
-        # Add comment about row access policies
-        lines.extend([
-            "-- Row Access Policies (RLS)",
-            "-- Create row access policy for multi-tenant filtering:",
-            "-- CREATE OR REPLACE ROW ACCESS POLICY tenant_filter AS (tenant_id VARCHAR)",
-            "--   RETURNS BOOLEAN -> tenant_id = CURRENT_SESSION()::VARIANT:tenant_id;",
-            "",
-        ])
-
-        return {"sql/10-data-plane.snowflake.sql": "\n".join(lines)}
+        fqn = _FQN % (tb.schema_upper, tb.code_upper)
+
+        w(_TABLE_HEAD % fqn)
+        # One write per table: the column block is rendered in a single comprehension
+        w("".join([_COL_TMPL % (code, map_type(ftype), null_clause) for code, ftype, null_clause, _ in view]))
+
+        # 2.2 Add soft-delete columns
+        w(_SOFT_DELETE_COLUMNS)
+        w("\n);\n\n")
+
+        # Add clustering key on _CreateDate for time-series queries
+        w(_CLUSTER_BY % fqn)
+
+    def end(self, state: Any, w: Write) -> None:
+        # 3.1 Add comment about row access policies
+        w(
+            "-- Row Access Policies (RLS)\n"
+            "-- Create row access policy for multi-tenant filtering:\n"
+            "-- CREATE OR REPLACE ROW ACCESS POLICY tenant_filter AS (tenant_id VARCHAR)\n"
+            "--   RETURNS BOOLEAN -> tenant_id = CURRENT_SESSION()::VARIANT:tenant_id;\n"
+        )
@@ -9,8 +9,10 @@ Steps:
 """
 
 from __future__ import annotations
-from typing import Dict, Any
-from ..ir import ProjectIR
+from functools import lru_cache
+from typing import Dict, Any, List
+from ..ir import ColumnView, ProjectIR, TableIR
+from .base import TableStreamEmitter, Write
 
 
 # Type mapping: OZMetaDB type -> Spark SQL type
@@ -33,118 +35,112 @@ SPARK_TYPE_MAP = {
 }
 
 
+@lru_cache(maxsize=256)
 def map_type(t: str) -> str:
     """Map OZMetaDB type to Spark SQL type."""
-    t_lower = t.lower()
-    if t_lower in SPARK_TYPE_MAP:
-        return SPARK_TYPE_MAP[t_lower]
-    # Handle nvarchar(N) -> STRING
-    if t_lower.startswith("nvarchar") or t_lower.startswith("varchar"):
-        return "STRING"
-    return "STRING"
-
-
-class SparkEmitter:
-    """Spark SQL / Databricks DDL emitter."""
+    # nvarchar(N)/varchar(N) and anything unmapped -> STRING
+    return SPARK_TYPE_MAP.get(t.lower(), "STRING")
+
+
+# Statement templates (%-formatted in the tables loop)
+_SCHEMA_TMPL = "CREATE SCHEMA IF NOT EXISTS %s;\n"
+_TABLE_HEAD = "CREATE TABLE IF NOT EXISTS %s (\n"
+_COL_TMPL = "    %s %s%s%s,\n"
+_FK_COMMENT = " COMMENT 'FK to %s'"
+_ZORDER_HINT = "-- OPTIMIZE %s ZORDER BY (%s, _CreateDate);\n\n"
+
+# Audit/soft-delete columns appended to every table (no trailing separator)
+_SOFT_DELETE_COLUMNS = ",\n".join([
+    "    _CreateDate TIMESTAMP NOT NULL",
+    "    _CreatedBy STRING",
+    "    _UpdateDate TIMESTAMP",
+    "    _UpdatedBy STRING",
+    "    _DeleteDate TIMESTAMP",
+    "    _DeletedBy STRING",
+])
+
+_TBLPROPERTIES = (
+    "TBLPROPERTIES (\n"
+    "    'delta.autoOptimize.optimizeWrite' = 'true',\n"
+    "    'delta.autoOptimize.autoCompact' = 'true',\n"
+    "    'delta.deletedFileRetentionDuration' = 'interval 30 days',\n"
+    "    'delta.logRetentionDuration' = 'interval 90 days'\n"
+    ");\n"
+    "\n"
+)
+
+
+class SparkEmitter(TableStreamEmitter):
+    """Spark SQL / Databricks DDL emitter.
+
+    Steps:
+      1.1 Collect unique schemas
+      1.2 Generate schema DDL
+      2.1 Generate table DDL with columns
+      2.2 Add soft-delete columns
+      2.3 Configure Delta Lake properties
+      3.1 Add row-level security notes
+    """
     name = "spark"
+    path = "sql/10-data-plane.spark.sql"
 
-    def emit(self, ir: ProjectIR, options: Dict[str, Any]) -> Dict[str, str]:
-        """Emit Spark SQL DDL files.
-
-        Steps:
-          1.1 Collect unique schemas
-          1.2 Generate schema DDL
-          2.1 Generate table DDL with columns
-          2.2 Add soft-delete columns
-          2.3 Configure Delta Lake properties
-          3.1 Return file map
-        """
+    def begin(self, ir: ProjectIR, options: Dict[str, Any], w: Write) -> None:
         catalog = options.get("catalog", "main")
         use_unity_catalog = options.get("unity_catalog", True)
 
-        lines = [
-            "-- Generated Spark SQL / Databricks DDL",
-            "-- OZMetaDB Compiler",
-            "",
-            f"-- Catalog: {catalog}",
-            f"-- Unity Catalog: {use_unity_catalog}",
-            "",
-        ]
+        w(
+            "-- Generated Spark SQL / Databricks DDL\n"
+            "-- OZMetaDB Compiler\n"
+            "\n"
+            f"-- Catalog: {catalog}\n"
+            f"-- Unity Catalog: {use_unity_catalog}\n"
+            "\n"
+        )
 
         if use_unity_catalog:
-            lines.append(f"USE CATALOG {catalog};")
-            lines.append("")
+            w(f"USE CATALOG {catalog};\n\n")
 
         # 1.1 Collect unique schemas
-        schemas = set()
-        for tb in ir.tables:
-            schemas.add(tb.schema)
-
         # 1.2 Generate schema DDL
-        for schema in sorted(schemas):
-            lines.append(f"CREATE SCHEMA IF NOT EXISTS {schema};")
-        lines.append("")
+        for schema in sorted({tb.schema for tb in ir.tables}):
+            w(_SCHEMA_TMPL % schema)
+        w("\n")
 
+    def table(self, state: Any, tb: TableIR, view: List[ColumnView], w: Write) -> None:
         # 2.1 Generate table DDL
-        for tb in ir.tables:
-            cols = []
-            pk_col = None
-            has_tenant = False
-
-            for f in tb.fields:
-                col_type = map_type(f.type)
-                null_clause = " NOT NULL" if not f.nullable else ""
-                comment = ""
-                if f.ref:
-                    comment = f" COMMENT 'FK to {f.ref}'"
-                cols.append(f"    {f.code} {col_type}{null_clause}{comment}")
-                if f.code.endswith("_ID") and pk_col is None:
-                    pk_col = f.code
-                if f.code.lower() == "_tenantid":
-                    has_tenant = True
-
-            # 2.2 Add soft-delete columns
-            cols.extend([
-                "    _CreateDate TIMESTAMP NOT NULL",
-                "    _CreatedBy STRING",
-                "    _UpdateDate TIMESTAMP",
-                "    _UpdatedBy STRING",
-                "    _DeleteDate TIMESTAMP",
-                "    _DeletedBy STRING",
-            ])
-
-            lines.append(f"CREATE TABLE IF NOT EXISTS {tb.schema}.{tb.code} (")
-            lines.append(",\n".join(cols))
-            lines.append(")")
-            lines.append("USING DELTA")
-
-            # 2.3 Configure Delta Lake properties
-            if has_tenant:
-                lines.append("PARTITIONED BY (_TenantID)")
-
-            lines.append("TBLPROPERTIES (")
-            lines.append("    'delta.autoOptimize.optimizeWrite' = 'true',")
-            lines.append("    'delta.autoOptimize.autoCompact' = 'true',")
-            lines.append("    'delta.deletedFileRetentionDuration' = 'interval 30 days',")
-            lines.append("    'delta.logRetentionDuration' = 'interval 90 days'")
-            lines.append(");")
-            lines.append("")
-
-            # Add Z-ORDER optimization hint
-            if pk_col:
-                lines.append(f"-- OPTIMIZE {tb.schema}.{tb.code} ZORDER BY ({pk_col}, _CreateDate);")
-                lines.append("")
-
-        # Add row-level security note
-        lines.extend([
-            "-- Row-Level Security (Unity Catalog)",
-            "-- Use row filters for multi-tenant access:",
-            "-- ALTER TABLE schema.table SET ROW FILTER tenant_filter ON (_TenantID);",
-            "",
-            "-- CREATE FUNCTION tenant_filter(tenant_id STRING)",
-            "--   RETURNS BOOLEAN",
-            "--   RETURN tenant_id = current_user_tenant();",
-            "",
-        ])
-
-        return {"sql/10-data-plane.spark.sql": "\n".join(lines)}
+        # First PK candidate wins; both lookups stop at the first match
+        fields = tb.fields
+        pk_col = next((f.code for f in fields if f.is_pk_candidate), None)
+        has_tenant = any(f.is_tenant for f in fields)
+
+        fqn = "%s.%s" % (tb.schema, tb.code)
+
+        w(_TABLE_HEAD % fqn)
+        # One write per table: the column block is rendered in a single comprehension
+        w("".join([_COL_TMPL % (code, map_type(ftype), null_clause, _FK_COMMENT % ref if ref else "")
+                   for code, ftype, null_clause, ref in view]))
+
+        # 2.2 Add soft-delete columns
+        w(_SOFT_DELETE_COLUMNS)
+        w("\n)\nUSING DELTA\n")
+
+        # 2.3 Configure Delta Lake properties
+        if has_tenant:
+            w("PARTITIONED BY (_TenantID)\n")
+        w(_TBLPROPERTIES)
+
+        # Add Z-ORDER optimization hint
+        if pk_col:
+            w(_ZORDER_HINT % (fqn, pk_col))
+
+    def end(self, state: Any, w: Write) -> None:
+        # 3.1 Add row-level security note
+        w(
+            "-- Row-Level Security (Unity Catalog)\n"
+            "-- Use row filters for multi-tenant access:\n"
+            "-- ALTER TABLE schema.table SET ROW FILTER tenant_filter ON (_TenantID);\n"
+            "\n"
+            "-- CREATE FUNCTION tenant_filter(tenant_id STRING)\n"
+            "--   RETURNS BOOLEAN\n"
+            "--   RETURN tenant_id = current_user_tenant();\n"
+        )
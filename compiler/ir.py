@@ -1,28 +1,93 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-@dataclass
+# IR nodes are built once per compile and only read afterwards. They stay slotted
+# dataclasses rather than NamedTuples: slot reads are ~3x faster than tuple
+# field getters on the emitter read path, and the derived flags need __post_init__.
+@dataclass(slots=True, frozen=True)
 class FieldIR:
     code: str
     type: str
     nullable: bool = True
     ref: Optional[str] = None
+    # Name-derived flags read by emitters, computed once per IR
+    is_pk_candidate: bool = field(init=False, repr=False, compare=False)
+    is_tenant: bool = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        code = self.code if isinstance(self.code, str) else ""
+        object.__setattr__(self, "is_pk_candidate", code.endswith("_ID"))
+        object.__setattr__(self, "is_tenant", code.lower() == "_tenantid")
+
+@dataclass(slots=True, frozen=True)
 class TableIR:
     schema: str
     code: str
     fields: List[FieldIR] = field(default_factory=list)
+    # Upper-cased names for dialects that fold identifiers, computed once per IR
+    schema_upper: str = field(init=False, repr=False, compare=False)
+    code_upper: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Snapshots are not guaranteed to carry a code; only str names are folded
+        for name in ("schema", "code"):
+            value = getattr(self, name)
+            object.__setattr__(self, name + "_upper", value.upper() if isinstance(value, str) else value)
+
+# (code, type, null clause, ref) for one field; emitters unpack these instead of
+# reading FieldIR attributes per column
+ColumnView = Tuple[str, str, str, Optional[str]]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectIR:
     tables: List[TableIR] = field(default_factory=list)
+    _column_views: Optional[List[List[ColumnView]]] = field(default=None, init=False, repr=False, compare=False)
+
+# Null clause indexed by "not nullable"
+_NULL_CLAUSES = ("", " NOT NULL")
+
+def precompute_column_views(tables: Iterable[TableIR]) -> List[List[ColumnView]]:
+    null_clauses = _NULL_CLAUSES
+    return [[(f.code, f.type, null_clauses[not f.nullable], f.ref) for f in tb.fields] for tb in tables]
+
+def column_views(ir: ProjectIR) -> List[List[ColumnView]]:
+    """Per-table column views, built once per IR and shared by every emitter."""
+    views = ir._column_views
+    if views is None:
+        views = precompute_column_views(ir.tables)
+        object.__setattr__(ir, "_column_views", views)  # memo slot on a frozen IR
+    return views
+
+_EMPTY: Tuple[Any, ...] = ()
 
 def build_ir(snapshot: Dict[str, Any]) -> ProjectIR:
-    tables = snapshot.get("objects", {}).get("model", {}).get("tables", [])
+    try:
+        tables = snapshot["objects"]["model"]["tables"]
+    except KeyError:
+        return ProjectIR()
+    return build_ir_from_tables(tables)
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+def build_ir_from_tables(tables: Iterable[Dict[str, Any]]) -> ProjectIR:
+    """Build IR from objects.model.tables (any iterable, e.g. a streaming parser).
+
+    Type and schema names repeat across thousands of fields, so they are interned:
+    equal names share one str and type-map caches hit on identity.
+    """
     out=[]
+    intern=sys.intern
     for t in tables:
-        flds=[FieldIR(code=f.get("code"), type=f.get("type"), nullable=bool(f.get("nullable", True)), ref=f.get("ref")) for f in t.get("fields", [])]
-        out.append(TableIR(schema=t.get("schema","dp"), code=t.get("code"), fields=flds))
-    return ProjectIR(tables=out)
+        flds=[]
+        append=flds.append
+        for f in t.get("fields") or _EMPTY:
+            ftype=f.get("type"); nullable=f.get("nullable", True)
+            append(FieldIR(f.get("code"),
+                           intern(ftype) if type(ftype) is str else ftype,
+                           nullable if type(nullable) is bool else bool(nullable),
+                           f.get("ref")))
+        out.append(TableIR(_intern(t.get("schema","dp")), t.get("code"), flds))
+    return ProjectIR(out)
@@ -16,19 +16,8 @@ Supports:
   - Fabric Pipelines (JSON)
 """
 
-from .compiler import (
-    JobCompiler,
-    compile_job,
-    compile_pipeline,
-    SCHEDULER_AIRFLOW,
-    SCHEDULER_PREFECT,
-    SCHEDULER_DAGSTER,
-    SCHEDULER_CRON,
-    SCHEDULER_ADF,
-    SCHEDULER_DATABRICKS,
-    SCHEDULER_STEP_FUNCTIONS,
-    SCHEDULER_FABRIC,
-)
+import importlib
+from typing import Any
 
 __all__ = [
     "JobCompiler",
@@ -43,3 +32,20 @@ __all__ = [
     "SCHEDULER_STEP_FUNCTIONS",
     "SCHEDULER_FABRIC",
 ]
+
+
+# PEP 562 lazy exports: the scheduler backends live in .compiler, which is only
+# imported when one of these names is first used.
+_LAZY = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(".compiler", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
@@ -7,11 +7,62 @@ Steps:
 """
 
 from __future__ import annotations
+import io
 import json
+import math
+import os
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_floats_match(obj: Any) -> bool:
+    """False if obj holds a float orjson writes differently from json.
+
+    orjson writes NaN/Infinity as null and drops the exponent form json uses
+    (1e-05 -> 0.00001); every other float is written the same by both.
+    """
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        if isinstance(o, float):
+            if not math.isfinite(o) or "e" in repr(o):
+                return False
+        elif isinstance(o, dict):
+            extend(o.values())
+        elif isinstance(o, (list, tuple)):
+            extend(o)
+    return True
+
+
+def _json_dumps_indent(obj: Any) -> str:
+    """json.dumps(obj, indent=2), serialized by orjson when installed.
+
+    orjson writes non-ASCII as UTF-8 where json escapes it, and writes some
+    floats differently (see _orjson_floats_match), so those documents (and
+    anything orjson rejects) go through json to keep the output identical.
+    """
+    if ORJSON_AVAILABLE and _orjson_floats_match(obj):
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+        else:
+            if out.isascii():
+                return out
+    return json.dumps(obj, indent=2)
 
 # Scheduler constants
 SCHEDULER_AIRFLOW = "airflow"
@@ -36,7 +87,11 @@ class StepType(str, Enum):
     STORED_PROC = "stored_proc"
 
 
-@dataclass
+# Step type value -> member; unknown types fall back to SQL without raising
+_STEP_TYPES = {t.value: t for t in StepType}
+
+
+@dataclass(slots=True)
 class JobStep:
     """A step in a job/pipeline."""
     code: str
@@ -51,9 +106,14 @@ class JobStep:
     retryDelay: int = 60  # seconds
     condition: Optional[str] = None  # Skip condition
     onFailure: Optional[str] = None  # Step to run on failure
+    # Identifier-safe code ("-" -> "_") shared by the Python scheduler targets
+    taskId: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.taskId = self.code.replace("-", "_") if isinstance(self.code, str) else self.code
 
-@dataclass
+
+@dataclass(slots=True)
 class Job:
     """A job/pipeline definition."""
     code: str
@@ -71,97 +131,402 @@ class Job:
     alertEmail: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompiledJob:
-    """Result of compiling a job."""
+    """Result of compiling a job (shared between identical compiles, so read-only)."""
     jobCode: str
     scheduler: str
     code: str  # Generated code/config
     fileExtension: str
-    dependencies: List[str] = field(default_factory=list)
+    dependencies: Tuple[str, ...] = ()
     notes: Optional[str] = None
 
 
+def _intern(value: Any) -> Any:
+    # Step codes are set members, dict keys and dependency targets; interned codes
+    # compare by identity in those lookups
+    return sys.intern(value) if type(value) is str else value
+
+
+def _first(src: Dict[str, Any], key: str, legacy_key: str, default: Any = None) -> Any:
+    """Value of key, or of legacy_key when key is missing or None."""
+    value = src.get(key)
+    return value if value is not None else src.get(legacy_key, default)
+
+
 def parse_job(job_def: Dict[str, Any]) -> Job:
     """Parse a job definition from snapshot.
 
     Steps:
       1.1 Parse job metadata
       1.2 Parse steps
-      1.3 Validate DAG
+      1.3 DAG validation (cycles) happens when the job is compiled
     """
-    code = job_def.get("code") or job_def.get("JB_Code", "unknown_job")
-    name = job_def.get("name") or job_def.get("JB_Name", code)
+    code = _first(job_def, "code", "JB_Code", "unknown_job")
+    name = _first(job_def, "name", "JB_Name", code)
 
     steps = []
     for step_def in job_def.get("steps", []):
-        step_type_str = step_def.get("type") or step_def.get("JS_Type", "sql")
-        try:
-            step_type = StepType(step_type_str.lower())
-        except ValueError:
-            step_type = StepType.SQL
+        step_type_str = _first(step_def, "type", "JS_Type", "sql")
+        step_type = _STEP_TYPES.get(step_type_str.lower(), StepType.SQL)
 
         step = JobStep(
-            code=step_def.get("code") or step_def.get("JS_Code", "step"),
-            name=step_def.get("name") or step_def.get("JS_Name", "Step"),
+            code=_intern(_first(step_def, "code", "JS_Code", "step")),
+            name=_first(step_def, "name", "JS_Name", "Step"),
             stepType=step_type,
-            command=step_def.get("command") or step_def.get("JS_Command"),
-            script=step_def.get("script") or step_def.get("JS_Script"),
-            parameters=step_def.get("parameters") or step_def.get("JS_Parameters", {}),
-            dependsOn=step_def.get("dependsOn") or step_def.get("JS_DependsOn", []),
-            timeout=step_def.get("timeout") or step_def.get("JS_TimeoutSec"),
-            retries=step_def.get("retries") or step_def.get("JS_Retries", 0),
-            retryDelay=step_def.get("retryDelay") or step_def.get("JS_RetryDelaySec", 60),
-            condition=step_def.get("condition") or step_def.get("JS_Condition"),
-            onFailure=step_def.get("onFailure") or step_def.get("JS_OnFailure"),
+            command=_first(step_def, "command", "JS_Command"),
+            script=_first(step_def, "script", "JS_Script"),
+            parameters=_first(step_def, "parameters", "JS_Parameters", {}),
+            dependsOn=[_intern(d) for d in _first(step_def, "dependsOn", "JS_DependsOn", [])],
+            timeout=_first(step_def, "timeout", "JS_TimeoutSec"),
+            retries=_first(step_def, "retries", "JS_Retries", 0),
+            retryDelay=_first(step_def, "retryDelay", "JS_RetryDelaySec", 60),
+            condition=_first(step_def, "condition", "JS_Condition"),
+            onFailure=_first(step_def, "onFailure", "JS_OnFailure"),
         )
         steps.append(step)
 
     return Job(
         code=code,
         name=name,
-        description=job_def.get("description") or job_def.get("JB_Description"),
-        schedule=job_def.get("schedule") or job_def.get("JB_Schedule"),
+        description=_first(job_def, "description", "JB_Description"),
+        schedule=_first(job_def, "schedule", "JB_Schedule"),
         steps=steps,
-        parameters=job_def.get("parameters") or job_def.get("JB_Parameters", {}),
-        tags=job_def.get("tags") or job_def.get("JB_Tags", []),
-        owner=job_def.get("owner") or job_def.get("JB_Owner"),
-        timeout=job_def.get("timeout") or job_def.get("JB_TimeoutSec"),
-        maxConcurrency=job_def.get("maxConcurrency") or job_def.get("JB_MaxConcurrency", 1),
-        retries=job_def.get("retries") or job_def.get("JB_Retries", 0),
+        parameters=_first(job_def, "parameters", "JB_Parameters", {}),
+        tags=_first(job_def, "tags", "JB_Tags", []),
+        owner=_first(job_def, "owner", "JB_Owner"),
+        timeout=_first(job_def, "timeout", "JB_TimeoutSec"),
+        maxConcurrency=_first(job_def, "maxConcurrency", "JB_MaxConcurrency", 1),
+        retries=_first(job_def, "retries", "JB_Retries", 0),
         alertOnFailure=job_def.get("alertOnFailure", True),
-        alertEmail=job_def.get("alertEmail") or job_def.get("JB_AlertEmail"),
+        alertEmail=_first(job_def, "alertEmail", "JB_AlertEmail"),
     )
 
 
+def _cycle_path(stack: List[Tuple[JobStep, Any]], dep: str) -> List[str]:
+    """Step codes around the cycle closed by dep, from the DFS stack."""
+    codes = [step.code for step, _ in stack]
+    return codes[codes.index(dep):] + [dep]
+
+
 def _topological_sort(steps: List[JobStep]) -> List[JobStep]:
-    """Sort steps topologically based on dependencies."""
+    """Sort steps topologically based on dependencies.
+
+    Steps:
+      1.1 No dependencies - keep the declared order
+      1.2 Iterative DFS post-order (dependencies first, declared order otherwise)
+      1.3 Raise ValueError on a dependency cycle; unknown dependencies are skipped
+    """
     step_map = {s.code: s for s in steps}
+
+    # 1.1 Common case: independent steps with unique codes
+    if len(step_map) == len(steps) and not any(s.dependsOn for s in steps):
+        return list(steps)
+
+    # 1.2 Explicit stack of (step, remaining dependencies)
+    valid = step_map.keys()
     visited: Set[str] = set()
+    active: Set[str] = set()  # steps on the current DFS path
     result: List[JobStep] = []
-
-    def visit(code: str) -> None:
+    mark, enter, leave, append = visited.add, active.add, active.discard, result.append
+    for root in steps:
+        code = root.code
         if code in visited:
-            return
-        visited.add(code)
-        step = step_map.get(code)
-        if step:
-            for dep in step.dependsOn:
-                visit(dep)
-            result.append(step)
-
-    for step in steps:
-        visit(step.code)
+            continue
+        mark(code)
+        enter(code)
+        step = step_map[code]
+        stack = [(step, iter(step.dependsOn))]
+        push, top = stack.append, stack.pop
+        while stack:
+            step, deps = stack[-1]
+            for dep in deps:
+                if dep not in valid:
+                    continue
+                if dep in visited:
+                    # 1.3 A dependency still on the path closes a cycle
+                    if dep in active:
+                        raise ValueError(f"Cycle detected involving steps: {_cycle_path(stack, dep)}")
+                    continue
+                mark(dep)
+                enter(dep)
+                child = step_map[dep]
+                push((child, iter(child.dependsOn)))
+                break
+            else:
+                top()
+                leave(step.code)
+                append(step)
 
     return result
 
 
+# Airflow "Generated" stamp: one per process, or per compile with OZ_JOBS_TIMESTAMP_PER_COMPILE=1
+_PER_COMPILE_TIMESTAMP = os.environ.get("OZ_JOBS_TIMESTAMP_PER_COMPILE") == "1"
+_PROCESS_UTC_ISO = datetime.utcnow().isoformat()
+
+# Airflow DAG templates (%-formatted per job / per step)
+_AIRFLOW_HEADER_TMPL = (
+    '"""Auto-generated Airflow DAG from OZMetaDB."""\n'
+    "\n"
+    "from datetime import datetime, timedelta\n"
+    "from airflow import DAG\n"
+    "from airflow.operators.python import PythonOperator\n"
+    "from airflow.operators.bash import BashOperator\n"
+    "from airflow.providers.common.sql.operators.sql import SQLExecuteQueryOperator\n"
+    "from airflow.providers.http.operators.http import SimpleHttpOperator\n"
+    "\n"
+    "# Job: %(name)s\n"
+    "# Generated: %(generated)sZ\n"
+    "\n"
+    "default_args = {\n"
+    "    'owner': '%(owner)s',\n"
+    "    'retries': %(retries)s,\n"
+    "    'retry_delay': timedelta(minutes=5),\n"
+    "}\n"
+    "\n"
+)
+_AIRFLOW_DAG_TMPL = (
+    "with DAG(\n"
+    "    dag_id='%(dag_id)s',\n"
+    "    description='%(description)s',\n"
+    "    schedule=%(schedule)s,\n"
+    "    start_date=datetime(2024, 1, 1),\n"
+    "    catchup=False,\n"
+    "    default_args=default_args,\n"
+    "    tags=%(tags)s,\n"
+    "    max_active_runs=%(max_active_runs)s,\n"
+    ") as dag:\n"
+    "\n"
+)
+_AIRFLOW_SQL_OP_TMPL = (
+    "    %(task_id)s = SQLExecuteQueryOperator(\n"
+    "        task_id='%(task_id)s',\n"
+    '        sql="""%(body)s""",\n'
+    "        conn_id='default_db',\n"
+    "    )\n"
+    "\n"
+)
+_AIRFLOW_PY_OP_TMPL = (
+    "    def _%(task_id)s_fn(**kwargs):\n"
+    "        # %(name)s\n"
+    "        %(body)s\n"
+    "\n"
+    "    %(task_id)s = PythonOperator(\n"
+    "        task_id='%(task_id)s',\n"
+    "        python_callable=_%(task_id)s_fn,\n"
+    "    )\n"
+    "\n"
+)
+_AIRFLOW_BASH_OP_TMPL = (
+    "    %(task_id)s = BashOperator(\n"
+    "        task_id='%(task_id)s',\n"
+    "        bash_command='%(body)s',\n"
+    "    )\n"
+    "\n"
+)
+_AIRFLOW_HTTP_OP_TMPL = (
+    "    %(task_id)s = SimpleHttpOperator(\n"
+    "        task_id='%(task_id)s',\n"
+    "        http_conn_id='http_default',\n"
+    "        endpoint='%(body)s',\n"
+    "        method='POST',\n"
+    "    )\n"
+    "\n"
+)
+_AIRFLOW_DEFAULT_OP_TMPL = (
+    "    %(task_id)s = PythonOperator(\n"
+    "        task_id='%(task_id)s',\n"
+    "        python_callable=lambda: print('%(name)s'),\n"
+    "    )\n"
+    "\n"
+)
+
+def _airflow_op(tmpl: str, body: Callable[[JobStep], str]) -> Callable[[JobStep], str]:
+    """Step -> operator block for one Airflow operator template."""
+    return lambda step: tmpl % {"task_id": step.taskId, "name": step.name, "body": body(step)}
+
+
+# Step type -> operator block emitter
+_AIRFLOW_STEP_EMITTERS: Dict[StepType, Callable[[JobStep], str]] = {
+    StepType.SQL: _airflow_op(_AIRFLOW_SQL_OP_TMPL, lambda s: s.command or s.script or ""),
+    StepType.PYTHON: _airflow_op(_AIRFLOW_PY_OP_TMPL, lambda s: s.script or "pass"),
+    StepType.SHELL: _airflow_op(_AIRFLOW_BASH_OP_TMPL, lambda s: s.command or s.script or "echo done"),
+    StepType.HTTP: _airflow_op(_AIRFLOW_HTTP_OP_TMPL, lambda s: s.command or "/"),
+}
+_AIRFLOW_DEFAULT_EMITTER = _airflow_op(_AIRFLOW_DEFAULT_OP_TMPL, lambda s: "")
+
+_PRINT_BODY_TMPL = "    print('Executing %s')\n"
+_SHELL_BODY_TMPL = "    import subprocess\n    subprocess.run('%s', shell=True, check=True)\n"
+
+
+def _print_body(step: JobStep) -> str:
+    return _PRINT_BODY_TMPL % step.name
+
+
+def _script_body(step: JobStep) -> str:
+    return "    %s\n" % step.script if step.script else _print_body(step)
+
+
+def _shell_body(step: JobStep) -> str:
+    return _SHELL_BODY_TMPL % step.command if step.command else _print_body(step)
+
+
+# Prefect/Dagster task bodies by step type (default: _print_body)
+_PREFECT_TASK_BODIES: Dict[StepType, Callable[[JobStep], str]] = {
+    StepType.PYTHON: _script_body,
+    StepType.SHELL: _shell_body,
+}
+_DAGSTER_OP_BODIES: Dict[StepType, Callable[[JobStep], str]] = {
+    StepType.PYTHON: _script_body,
+}
+
+
+# Step type -> ADF / Fabric activity type
+_ADF_ACTIVITY_TYPES = MappingProxyType({
+    StepType.SQL: "SqlServerStoredProcedure",
+    StepType.COPY: "Copy",
+    StepType.NOTEBOOK: "DatabricksNotebook",
+    StepType.PYTHON: "AzureFunctionActivity",
+    StepType.HTTP: "WebActivity",
+    StepType.SPARK: "DatabricksSparkPython",
+})
+_FABRIC_ACTIVITY_TYPES = MappingProxyType({
+    StepType.NOTEBOOK: "TridentNotebook",
+    StepType.SQL: "Script",
+    StepType.SPARK: "SparkJob",
+    StepType.COPY: "Copy",
+    StepType.HTTP: "WebActivity",
+})
+
+
+# Step Functions task resources
+_SFN_LAMBDA_ARN = "arn:aws:lambda:${region}:${account}:function:%s"
+_SFN_ATHENA = "arn:aws:states:::athena:startQueryExecution.sync"
+_SFN_LAMBDA_INVOKE = "arn:aws:states:::lambda:invoke"
+
+
+def _sfn_state(step: JobStep, next_code: Optional[str]) -> Dict[str, Any]:
+    """Step Functions Task state for one step; next_code is None for the last step."""
+    state: Dict[str, Any] = {
+        "Type": "Task",
+        "Comment": step.name,
+    }
+
+    if step.stepType == StepType.PYTHON:
+        state["Resource"] = _SFN_LAMBDA_ARN % step.code
+    elif step.stepType == StepType.SQL:
+        state["Resource"] = _SFN_ATHENA
+        state["Parameters"] = {
+            "QueryString": step.command or step.script,
+            "WorkGroup": "primary",
+        }
+    else:
+        state["Resource"] = _SFN_LAMBDA_INVOKE
+        state["Parameters"] = {
+            "FunctionName": step.code,
+            "Payload.$": "$",
+        }
+
+    if next_code:
+        state["Next"] = next_code
+    else:
+        state["End"] = True
+
+    if step.retries:
+        state["Retry"] = [{
+            "ErrorEquals": ["States.ALL"],
+            "MaxAttempts": step.retries,
+            "IntervalSeconds": step.retryDelay,
+        }]
+
+    if step.timeout:
+        state["TimeoutSeconds"] = step.timeout
+
+    return state
+
+
+@lru_cache(maxsize=256)
+def _cron_to_quartz(cron: str) -> str:
+    """Convert standard cron to Quartz cron format (schedules repeat across jobs)."""
+    parts = cron.split()
+    if len(parts) == 5:
+        # Standard cron: min hour day month dow
+        # Quartz: sec min hour day month dow year
+        return f"0 {parts[0]} {parts[1]} {parts[2]} {parts[3]} {parts[4]}"
+    return cron
+
+
+# Databricks type-specific task settings: step type -> step -> {task kind: settings}
+def _databricks_default_task(step: JobStep) -> Dict[str, Any]:
+    return {"notebook_task": {"notebook_path": f"/Workspace/jobs/{step.code}"}}
+
+
+_DATABRICKS_TASK_BUILDERS: Dict[StepType, Callable[[JobStep], Dict[str, Any]]] = {
+    StepType.NOTEBOOK: lambda step: {"notebook_task": {
+        "notebook_path": step.script or f"/Workspace/jobs/{step.code}",
+        "base_parameters": step.parameters,
+    }},
+    StepType.SQL: lambda step: {"sql_task": {
+        "query": {"value": step.command or step.script or "SELECT 1"},
+        "warehouse_id": "{{warehouse_id}}",
+    }},
+    StepType.PYTHON: lambda step: {"python_wheel_task": {
+        "package_name": "ozmetadb_jobs",
+        "entry_point": step.taskId,
+    }},
+    StepType.SPARK: lambda step: {"spark_python_task": {
+        "python_file": step.script or f"dbfs:/jobs/{step.code}.py",
+    }},
+}
+
+
+def _task_id_map(steps: List[JobStep]) -> Dict[str, str]:
+    """Step code -> task id, for resolving dependency references."""
+    return {s.code: s.taskId for s in steps}
+
+
+def _dep_task_id(task_ids: Dict[str, str], dep: str) -> str:
+    # Dependencies on codes outside the job are sanitized on the fly
+    return task_ids.get(dep) or dep.replace("-", "_")
+
+
+class _CodeBuf:
+    """Line-oriented string builder; getvalue() equals the lines joined by newlines."""
+
+    __slots__ = ("_io", "write", "writelines")
+
+    def __init__(self) -> None:
+        self._io = io.StringIO()
+        self.write = self._io.write
+        self.writelines = self._io.writelines
+
+    def line(self, s: str = "") -> None:
+        self.write(s + "\n")
+
+    def getvalue(self) -> str:
+        # Every line ends in a newline; drop the last one, as join would
+        return self._io.getvalue()[:-1]
+
+
 class JobCompiler:
     """Compiles jobs to scheduler-specific formats."""
 
     def __init__(self, scheduler: str = SCHEDULER_AIRFLOW):
         """Initialize compiler with target scheduler."""
-        self.scheduler = scheduler.lower()
+        self.scheduler = sys.intern(scheduler.lower())
+        self._dispatch = {
+            SCHEDULER_AIRFLOW: self._compile_airflow,
+            SCHEDULER_PREFECT: self._compile_prefect,
+            SCHEDULER_DAGSTER: self._compile_dagster,
+            SCHEDULER_CRON: self._compile_cron,
+            SCHEDULER_ADF: self._compile_adf,
+            SCHEDULER_DATABRICKS: self._compile_databricks,
+            SCHEDULER_STEP_FUNCTIONS: self._compile_step_functions,
+            SCHEDULER_FABRIC: self._compile_fabric,
+        }
+        # Unknown schedulers fall back to Airflow too
+        self.emits_airflow = self.scheduler == SCHEDULER_AIRFLOW or self.scheduler not in self._dispatch
 
     def compile(self, job: Job) -> CompiledJob:
         """Compile a job to target scheduler format.
@@ -172,24 +537,8 @@ class JobCompiler:
         """
         sorted_steps = _topological_sort(job.steps)
 
-        if self.scheduler == SCHEDULER_AIRFLOW:
-            code, ext = self._compile_airflow(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_PREFECT:
-            code, ext = self._compile_prefect(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_DAGSTER:
-            code, ext = self._compile_dagster(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_CRON:
-            code, ext = self._compile_cron(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_ADF:
-            code, ext = self._compile_adf(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_DATABRICKS:
-            code, ext = self._compile_databricks(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_STEP_FUNCTIONS:
-            code, ext = self._compile_step_functions(job, sorted_steps)
-        elif self.scheduler == SCHEDULER_FABRIC:
-            code, ext = self._compile_fabric(job, sorted_steps)
-        else:
-            code, ext = self._compile_airflow(job, sorted_steps)  # Default
+        compiler_fn = self._dispatch.get(self.scheduler, self._compile_airflow)  # Default: Airflow
+        code, ext = compiler_fn(job, sorted_steps)
 
         return CompiledJob(
             jobCode=job.code,
@@ -200,257 +549,173 @@ class JobCompiler:
 
     def _compile_airflow(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to Apache Airflow DAG."""
-        lines = [
-            '"""Auto-generated Airflow DAG from OZMetaDB."""',
-            "",
-            "from datetime import datetime, timedelta",
-            "from airflow import DAG",
-            "from airflow.operators.python import PythonOperator",
-            "from airflow.operators.bash import BashOperator",
-            "from airflow.providers.common.sql.operators.sql import SQLExecuteQueryOperator",
-            "from airflow.providers.http.operators.http import SimpleHttpOperator",
-            "",
-            f"# Job: {job.name}",
-            f"# Generated: {datetime.utcnow().isoformat()}Z",
-            "",
-            "default_args = {",
-            f"    'owner': '{job.owner or 'airflow'}',",
-            f"    'retries': {job.retries},",
-            "    'retry_delay': timedelta(minutes=5),",
-            "}",
-            "",
-        ]
+        buf = _CodeBuf()
+        write = buf.write
+        write(_AIRFLOW_HEADER_TMPL % {
+            "name": job.name,
+            "generated": datetime.utcnow().isoformat() if _PER_COMPILE_TIMESTAMP else _PROCESS_UTC_ISO,
+            "owner": job.owner or "airflow",
+            "retries": job.retries,
+        })
 
         # DAG definition
-        schedule = f"'{job.schedule}'" if job.schedule else "None"
-        lines.extend([
-            f"with DAG(",
-            f"    dag_id='{job.code}',",
-            f"    description='{job.description or ''}',",
-            f"    schedule={schedule},",
-            f"    start_date=datetime(2024, 1, 1),",
-            f"    catchup=False,",
-            f"    default_args=default_args,",
-            f"    tags={job.tags},",
-            f"    max_active_runs={job.maxConcurrency},",
-            f") as dag:",
-            "",
-        ])
+        write(_AIRFLOW_DAG_TMPL % {
+            "dag_id": job.code,
+            "description": job.description or "",
+            "schedule": f"'{job.schedule}'" if job.schedule else "None",
+            "tags": job.tags,
+            "max_active_runs": job.maxConcurrency,
+        })
 
         # Generate tasks
-        task_ids = []
+        emitter_for = _AIRFLOW_STEP_EMITTERS.get
         for step in steps:
-            task_id = step.code.replace("-", "_")
-            task_ids.append((task_id, step.dependsOn))
-
-            if step.stepType == StepType.SQL:
-                lines.extend([
-                    f"    {task_id} = SQLExecuteQueryOperator(",
-                    f"        task_id='{task_id}',",
-                    f"        sql=\"\"\"{step.command or step.script or ''}\"\"\",",
-                    f"        conn_id='default_db',",
-                    "    )",
-                    "",
-                ])
-            elif step.stepType == StepType.PYTHON:
-                lines.extend([
-                    f"    def _{task_id}_fn(**kwargs):",
-                    f"        # {step.name}",
-                    f"        {step.script or 'pass'}",
-                    "",
-                    f"    {task_id} = PythonOperator(",
-                    f"        task_id='{task_id}',",
-                    f"        python_callable=_{task_id}_fn,",
-                    "    )",
-                    "",
-                ])
-            elif step.stepType == StepType.SHELL:
-                lines.extend([
-                    f"    {task_id} = BashOperator(",
-                    f"        task_id='{task_id}',",
-                    f"        bash_command='{step.command or step.script or 'echo done'}',",
-                    "    )",
-                    "",
-                ])
-            elif step.stepType == StepType.HTTP:
-                lines.extend([
-                    f"    {task_id} = SimpleHttpOperator(",
-                    f"        task_id='{task_id}',",
-                    f"        http_conn_id='http_default',",
-                    f"        endpoint='{step.command or '/'}',",
-                    f"        method='POST',",
-                    "    )",
-                    "",
-                ])
-            else:
-                lines.extend([
-                    f"    {task_id} = PythonOperator(",
-                    f"        task_id='{task_id}',",
-                    f"        python_callable=lambda: print('{step.name}'),",
-                    "    )",
-                    "",
-                ])
+            write(emitter_for(step.stepType, _AIRFLOW_DEFAULT_EMITTER)(step))
 
         # Add dependencies
-        lines.append("    # Dependencies")
-        for task_id, deps in task_ids:
-            for dep in deps:
-                dep_id = dep.replace("-", "_")
-                lines.append(f"    {dep_id} >> {task_id}")
+        write("    # Dependencies\n")
+        code_to_tid = _task_id_map(steps)
+        buf.writelines(
+            f"    {_dep_task_id(code_to_tid, dep)} >> {step.taskId}\n"
+            for step in steps for dep in step.dependsOn
+        )
 
-        return "\n".join(lines), ".py"
+        return buf.getvalue(), ".py"
 
     def _compile_prefect(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to Prefect Flow."""
-        lines = [
-            '"""Auto-generated Prefect Flow from OZMetaDB."""',
-            "",
-            "from prefect import flow, task",
-            "from prefect.tasks import task_input_hash",
-            "from datetime import timedelta",
-            "",
-            f"# Job: {job.name}",
-            "",
-        ]
+        buf = _CodeBuf()
+        line = buf.line
+        buf.write(
+            '"""Auto-generated Prefect Flow from OZMetaDB."""\n'
+            "\n"
+            "from prefect import flow, task\n"
+            "from prefect.tasks import task_input_hash\n"
+            "from datetime import timedelta\n"
+            "\n"
+        )
+        line(f"# Job: {job.name}")
+        line()
 
         # Generate tasks
+        body_for = _PREFECT_TASK_BODIES.get
         for step in steps:
-            task_name = step.code.replace("-", "_")
+            task_name = step.taskId
             retry_str = f"retries={step.retries}, retry_delay_seconds={step.retryDelay}" if step.retries else ""
 
-            lines.extend([
-                f"@task(name='{step.name}'{', ' + retry_str if retry_str else ''})",
-                f"def {task_name}():",
-                f"    \"\"\"{step.name}\"\"\"",
-            ])
-
-            if step.stepType == StepType.PYTHON and step.script:
-                lines.append(f"    {step.script}")
-            elif step.stepType == StepType.SHELL and step.command:
-                lines.extend([
-                    "    import subprocess",
-                    f"    subprocess.run('{step.command}', shell=True, check=True)",
-                ])
-            else:
-                lines.append(f"    print('Executing {step.name}')")
-
-            lines.extend(["", ""])
+            line(f"@task(name='{step.name}'{', ' + retry_str if retry_str else ''})")
+            line(f"def {task_name}():")
+            line(f"    \"\"\"{step.name}\"\"\"")
+            buf.write(body_for(step.stepType, _print_body)(step))
+            buf.write("\n\n")
 
         # Generate flow
-        lines.extend([
-            f"@flow(name='{job.name}')",
-            f"def {job.code.replace('-', '_')}_flow():",
-            f'    """{job.description or job.name}"""',
-        ])
+        flow_name = job.code.replace("-", "_")
+        line(f"@flow(name='{job.name}')")
+        line(f"def {flow_name}_flow():")
+        line(f'    """{job.description or job.name}"""')
 
         # Call tasks in order
         for step in steps:
-            task_name = step.code.replace("-", "_")
+            task_name = step.taskId
             deps_wait = ""
             if step.dependsOn:
                 deps_wait = f"  # depends on: {', '.join(step.dependsOn)}"
-            lines.append(f"    {task_name}(){deps_wait}")
+            line(f"    {task_name}(){deps_wait}")
 
-        lines.extend([
-            "",
-            "",
-            "if __name__ == '__main__':",
-            f"    {job.code.replace('-', '_')}_flow()",
-        ])
+        buf.write(
+            "\n"
+            "\n"
+            "if __name__ == '__main__':\n"
+        )
+        line(f"    {flow_name}_flow()")
 
-        return "\n".join(lines), ".py"
+        return buf.getvalue(), ".py"
 
     def _compile_dagster(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to Dagster Job."""
-        lines = [
-            '"""Auto-generated Dagster Job from OZMetaDB."""',
-            "",
-            "from dagster import job, op, In, Out, Nothing",
-            "",
-            f"# Job: {job.name}",
-            "",
-        ]
+        buf = _CodeBuf()
+        line = buf.line
+        buf.write(
+            '"""Auto-generated Dagster Job from OZMetaDB."""\n'
+            "\n"
+            "from dagster import job, op, In, Out, Nothing\n"
+            "\n"
+        )
+        line(f"# Job: {job.name}")
+        line()
 
         # Generate ops
+        code_to_tid = _task_id_map(steps)
+        body_for = _DAGSTER_OP_BODIES.get
         for step in steps:
-            op_name = step.code.replace("-", "_")
+            op_name = step.taskId
 
             # Determine inputs
             if step.dependsOn:
-                ins = ", ".join(f'"{d.replace("-", "_")}": In(Nothing)' for d in step.dependsOn)
+                ins = ", ".join(f'"{_dep_task_id(code_to_tid, d)}": In(Nothing)' for d in step.dependsOn)
                 ins_arg = f"ins={{{ins}}}"
             else:
                 ins_arg = ""
 
-            lines.extend([
-                f"@op({ins_arg})",
-                f"def {op_name}():",
-                f'    """{step.name}"""',
-            ])
-
-            if step.stepType == StepType.PYTHON and step.script:
-                lines.append(f"    {step.script}")
-            else:
-                lines.append(f"    print('Executing {step.name}')")
-
-            lines.extend(["", ""])
+            line(f"@op({ins_arg})")
+            line(f"def {op_name}():")
+            line(f'    """{step.name}"""')
+            buf.write(body_for(step.stepType, _print_body)(step))
+            buf.write("\n\n")
 
         # Generate job
-        lines.extend([
-            f"@job(description='{job.description or job.name}')",
-            f"def {job.code.replace('-', '_')}_job():",
-        ])
+        line(f"@job(description='{job.description or job.name}')")
+        line(f"def {job.code.replace('-', '_')}_job():")
 
         # Call ops - handle dependencies via results
         for step in steps:
-            op_name = step.code.replace("-", "_")
+            op_name = step.taskId
             if step.dependsOn:
-                deps = ", ".join(d.replace("-", "_") + "()" for d in step.dependsOn)
-                lines.append(f"    {op_name}({deps})")
+                deps = ", ".join(_dep_task_id(code_to_tid, d) + "()" for d in step.dependsOn)
+                line(f"    {op_name}({deps})")
             else:
-                lines.append(f"    {op_name}()")
+                line(f"    {op_name}()")
 
-        return "\n".join(lines), ".py"
+        return buf.getvalue(), ".py"
 
     def _compile_cron(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to crontab format with shell script."""
-        lines = [
-            f"# Job: {job.name}",
-            f"# Generated from OZMetaDB",
-            "",
-        ]
+        buf = _CodeBuf()
+        line = buf.line
+        line(f"# Job: {job.name}")
+        buf.write("# Generated from OZMetaDB\n\n")
 
         if job.schedule:
             # Add crontab entry
             script_name = f"/opt/jobs/{job.code}.sh"
-            lines.append(f"{job.schedule} {script_name}")
+            line(f"{job.schedule} {script_name}")
         else:
-            lines.append(f"# No schedule defined - run manually")
+            line("# No schedule defined - run manually")
 
-        lines.extend([
-            "",
-            "# ======== Shell Script ========",
-            "#!/bin/bash",
-            f"# {job.name}",
-            "set -e",
-            "",
-        ])
+        buf.write(
+            "\n"
+            "# ======== Shell Script ========\n"
+            "#!/bin/bash\n"
+        )
+        line(f"# {job.name}")
+        buf.write("set -e\n\n")
 
         for step in steps:
-            lines.append(f"# Step: {step.name}")
+            line(f"# Step: {step.name}")
             if step.stepType == StepType.SHELL and step.command:
-                lines.append(step.command)
+                line(step.command)
             elif step.stepType == StepType.SQL and step.command:
-                lines.append(f'sqlcmd -Q "{step.command}"')
+                line(f'sqlcmd -Q "{step.command}"')
             elif step.stepType == StepType.PYTHON and step.script:
-                lines.append(f'python3 -c "{step.script}"')
+                line(f'python3 -c "{step.script}"')
             else:
-                lines.append(f'echo "Executing {step.name}"')
-            lines.append("")
+                line(f'echo "Executing {step.name}"')
+            line()
 
-        lines.append('echo "Job completed successfully"')
+        line('echo "Job completed successfully"')
 
-        return "\n".join(lines), ".cron"
+        return buf.getvalue(), ".cron"
 
     def _compile_adf(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to Azure Data Factory pipeline JSON."""
@@ -498,24 +763,17 @@ class JobCompiler:
             },
         }
 
-        return json.dumps(pipeline, indent=2), ".json"
+        return _json_dumps_indent(pipeline), ".json"
 
     def _adf_activity_type(self, step_type: StepType) -> str:
         """Map step type to ADF activity type."""
-        mapping = {
-            StepType.SQL: "SqlServerStoredProcedure",
-            StepType.COPY: "Copy",
-            StepType.NOTEBOOK: "DatabricksNotebook",
-            StepType.PYTHON: "AzureFunctionActivity",
-            StepType.HTTP: "WebActivity",
-            StepType.SPARK: "DatabricksSparkPython",
-        }
-        return mapping.get(step_type, "ExecutePipeline")
+        return _ADF_ACTIVITY_TYPES.get(step_type, "ExecutePipeline")
 
     def _compile_databricks(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to Databricks Workflow JSON."""
         tasks = []
 
+        task_for = _DATABRICKS_TASK_BUILDERS.get
         for step in steps:
             task = {
                 "task_key": step.code,
@@ -523,29 +781,7 @@ class JobCompiler:
                 "depends_on": [{"task_key": dep} for dep in step.dependsOn],
             }
 
-            if step.stepType == StepType.NOTEBOOK:
-                task["notebook_task"] = {
-                    "notebook_path": step.script or f"/Workspace/jobs/{step.code}",
-                    "base_parameters": step.parameters,
-                }
-            elif step.stepType == StepType.SQL:
-                task["sql_task"] = {
-                    "query": {"value": step.command or step.script or "SELECT 1"},
-                    "warehouse_id": "{{warehouse_id}}",
-                }
-            elif step.stepType == StepType.PYTHON:
-                task["python_wheel_task"] = {
-                    "package_name": "ozmetadb_jobs",
-                    "entry_point": step.code.replace("-", "_"),
-                }
-            elif step.stepType == StepType.SPARK:
-                task["spark_python_task"] = {
-                    "python_file": step.script or f"dbfs:/jobs/{step.code}.py",
-                }
-            else:
-                task["notebook_task"] = {
-                    "notebook_path": f"/Workspace/jobs/{step.code}",
-                }
+            task.update(task_for(step.stepType, _databricks_default_task)(step))
 
             if step.timeout:
                 task["timeout_seconds"] = step.timeout
@@ -575,52 +811,14 @@ class JobCompiler:
                 "on_failure": [job.alertEmail],
             }
 
-        return json.dumps(workflow, indent=2), ".json"
+        return _json_dumps_indent(workflow), ".json"
 
     def _compile_step_functions(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to AWS Step Functions state machine."""
-        states = {}
         first_step = steps[0].code if steps else "End"
-
-        for i, step in enumerate(steps):
-            next_step = steps[i + 1].code if i + 1 < len(steps) else None
-
-            state = {
-                "Type": "Task",
-                "Comment": step.name,
-            }
-
-            if step.stepType == StepType.PYTHON:
-                state["Resource"] = f"arn:aws:lambda:${{region}}:${{account}}:function:{step.code}"
-            elif step.stepType == StepType.SQL:
-                state["Resource"] = "arn:aws:states:::athena:startQueryExecution.sync"
-                state["Parameters"] = {
-                    "QueryString": step.command or step.script,
-                    "WorkGroup": "primary",
-                }
-            else:
-                state["Resource"] = f"arn:aws:states:::lambda:invoke"
-                state["Parameters"] = {
-                    "FunctionName": step.code,
-                    "Payload.$": "$",
-                }
-
-            if next_step:
-                state["Next"] = next_step
-            else:
-                state["End"] = True
-
-            if step.retries:
-                state["Retry"] = [{
-                    "ErrorEquals": ["States.ALL"],
-                    "MaxAttempts": step.retries,
-                    "IntervalSeconds": step.retryDelay,
-                }]
-
-            if step.timeout:
-                state["TimeoutSeconds"] = step.timeout
-
-            states[step.code] = state
+        next_codes = [s.code for s in steps[1:]]
+        next_codes.append(None)
+        states = {step.code: _sfn_state(step, next_code) for step, next_code in zip(steps, next_codes)}
 
         state_machine = {
             "Comment": job.description or job.name,
@@ -628,7 +826,7 @@ class JobCompiler:
             "States": states,
         }
 
-        return json.dumps(state_machine, indent=2), ".asl.json"
+        return _json_dumps_indent(state_machine), ".asl.json"
 
     def _compile_fabric(self, job: Job, steps: List[JobStep]) -> Tuple[str, str]:
         """Compile to Microsoft Fabric pipeline JSON."""
@@ -680,27 +878,37 @@ class JobCompiler:
             },
         }
 
-        return json.dumps(pipeline, indent=2), ".json"
+        return _json_dumps_indent(pipeline), ".json"
 
     def _fabric_activity_type(self, step_type: StepType) -> str:
         """Map step type to Fabric activity type."""
-        mapping = {
-            StepType.NOTEBOOK: "TridentNotebook",
-            StepType.SQL: "Script",
-            StepType.SPARK: "SparkJob",
-            StepType.COPY: "Copy",
-            StepType.HTTP: "WebActivity",
-        }
-        return mapping.get(step_type, "TridentNotebook")
+        return _FABRIC_ACTIVITY_TYPES.get(step_type, "TridentNotebook")
 
     def _cron_to_quartz(self, cron: str) -> str:
         """Convert standard cron to Quartz cron format."""
-        parts = cron.split()
-        if len(parts) == 5:
-            # Standard cron: min hour day month dow
-            # Quartz: sec min hour day month dow year
-            return f"0 {parts[0]} {parts[1]} {parts[2]} {parts[3]} {parts[4]}"
-        return cron
+        return _cron_to_quartz(cron)
+
+
+# (job fingerprint, scheduler) -> CompiledJob. A repeated compile returns the first
+# result, including the Airflow "Generated" timestamp; with per-compile timestamps
+# Airflow output bypasses the cache so every compile gets a fresh stamp.
+_COMPILED_JOBS: "OrderedDict[Tuple[str, str], CompiledJob]" = OrderedDict()
+_COMPILED_JOBS_SIZE = 512
+
+
+@lru_cache(maxsize=16)
+def _get_compiler(scheduler: str) -> JobCompiler:
+    """Shared compiler per scheduler; JobCompiler keeps no per-job state."""
+    return JobCompiler(scheduler)
+
+
+def _job_fingerprint(job: Job) -> str:
+    """Structural key for a parsed job.
+
+    The dataclass repr covers every field the emitters read, in order, including
+    parameter dicts (whose insertion order also shows up in the JSON output).
+    """
+    return repr(job)
 
 
 def compile_job(
@@ -717,8 +925,19 @@ def compile_job(
         CompiledJob with generated code
     """
     job = parse_job(job_def)
-    compiler = JobCompiler(scheduler)
-    return compiler.compile(job)
+    compiler = _get_compiler(scheduler)
+    if _PER_COMPILE_TIMESTAMP and compiler.emits_airflow:
+        return compiler.compile(job)
+    key = (_job_fingerprint(job), scheduler)
+    compiled = _COMPILED_JOBS.get(key)
+    if compiled is not None:
+        _COMPILED_JOBS.move_to_end(key)
+        return compiled
+    compiled = compiler.compile(job)
+    _COMPILED_JOBS[key] = compiled
+    if len(_COMPILED_JOBS) > _COMPILED_JOBS_SIZE:
+        _COMPILED_JOBS.popitem(last=False)
+    return compiled
 
 
 def compile_pipeline(
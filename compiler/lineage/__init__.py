@@ -11,28 +11,8 @@ Steps:
 The FIRST successful field-level lineage implementation.
 """
 
-from .graph import (
-    LineageGraph,
-    LineageNode,
-    LineageEdge,
-    NodeType,
-    EdgeType,
-    build_lineage_graph,
-)
-from .query import (
-    get_upstream,
-    get_downstream,
-    get_impact_analysis,
-    get_root_sources,
-    get_terminal_sinks,
-    find_path,
-)
-from .visualize import (
-    to_mermaid,
-    to_dot,
-    to_json,
-    to_d3_graph,
-)
+import importlib
+from typing import Any
 
 __all__ = [
     # Graph
@@ -55,3 +35,36 @@ __all__ = [
     "to_json",
     "to_d3_graph",
 ]
+
+# PEP 562 lazy exports: each name's submodule is imported on first use
+_LAZY = {
+    "LineageGraph": ".graph",
+    "LineageNode": ".graph",
+    "LineageEdge": ".graph",
+    "NodeType": ".graph",
+    "EdgeType": ".graph",
+    "build_lineage_graph": ".graph",
+    "get_upstream": ".query",
+    "get_downstream": ".query",
+    "get_impact_analysis": ".query",
+    "get_root_sources": ".query",
+    "get_terminal_sinks": ".query",
+    "find_path": ".query",
+    "to_mermaid": ".visualize",
+    "to_dot": ".visualize",
+    "to_json": ".visualize",
+    "to_d3_graph": ".visualize",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
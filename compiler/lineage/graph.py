@@ -3,14 +3,24 @@
 Steps:
   1.1 Parse nodes (sources, objects, fields)
   1.2 Parse edges (mappings, transformations)
-  1.3 Build adjacency lists for traversal
+  1.3 Build adjacency lists for traversal (integer node indices)
+  1.4 Pack adjacency into CSR arrays for the compiled BFS (numba, optional)
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field as dataclass_field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from array import array
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from enum import Enum
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from itertools import chain
+
+try:
+    import numpy as np  # type: ignore
+    from numba import njit  # type: ignore
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 class NodeType(str, Enum):
@@ -39,7 +49,11 @@ class EdgeType(str, Enum):
     UNION = "union"             # Union of multiple sources
 
 
-@dataclass
+# Lowercase value -> EdgeType, so parsing never pays for a failed EdgeType(...) call
+_EDGE_TYPES: Dict[str, EdgeType] = {t.value: t for t in EdgeType}
+
+
+@dataclass(slots=True)
 class LineageNode:
     """A node in the lineage graph."""
     id: str
@@ -66,12 +80,14 @@ class LineageNode:
         return hash(self.id)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, LineageNode):
             return self.id == other.id
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class LineageEdge:
     """An edge in the lineage graph."""
     id: str
@@ -86,6 +102,62 @@ class LineageEdge:
         return hash(self.id)
 
 
+def _bfs(adjacency: List["array[int]"], start: int, max_depth: int) -> Set[int]:
+    """Indices reachable from start within max_depth hops, excluding start."""
+    visited: Set[int] = {start}
+    queue = deque([(start, 0)])
+
+    while queue:
+        current, depth = queue.popleft()
+        if depth >= max_depth:
+            continue
+
+        # Mark on enqueue so each node is queued once
+        for next_idx in adjacency[current]:
+            if next_idx not in visited:
+                visited.add(next_idx)
+                queue.append((next_idx, depth + 1))
+
+    visited.discard(start)  # Don't include start node
+    return visited
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _bfs_csr(indptr, indices, start, max_depth):
+        """_bfs over CSR arrays; returns reached indices (excluding start) in BFS order."""
+        n = indptr.shape[0] - 1
+        seen = np.zeros(n, dtype=np.uint8)
+        queue = np.empty(n, dtype=np.int32)
+        depth = np.empty(n, dtype=np.int32)
+        seen[start] = 1
+        queue[0] = start
+        depth[0] = 0
+        head, tail = 0, 1
+        while head < tail:
+            current = queue[head]
+            d = depth[head]
+            head += 1
+            if d >= max_depth:
+                continue
+            for k in range(indptr[current], indptr[current + 1]):
+                next_idx = indices[k]
+                if seen[next_idx] == 0:
+                    seen[next_idx] = 1
+                    queue[tail] = next_idx
+                    depth[tail] = d + 1
+                    tail += 1
+        return queue[1:tail]
+
+
+def _pack_csr(adjacency: List["array[int]"]) -> Tuple[Any, Any]:
+    """(indptr, indices) int32 arrays for per-index neighbour arrays."""
+    indptr = np.zeros(len(adjacency) + 1, dtype=np.int32)
+    np.cumsum(np.fromiter(map(len, adjacency), dtype=np.int32, count=len(adjacency)), out=indptr[1:])
+    indices = np.fromiter(chain.from_iterable(adjacency), dtype=np.int32, count=int(indptr[-1]))
+    return indptr, indices
+
+
 @dataclass
 class LineageGraph:
     """A complete lineage graph with nodes and edges.
@@ -99,21 +171,123 @@ class LineageGraph:
     nodes: Dict[str, LineageNode] = dataclass_field(default_factory=dict)
     edges: List[LineageEdge] = dataclass_field(default_factory=list)
 
-    # Adjacency lists for fast traversal
-    _forward: Dict[str, List[str]] = dataclass_field(default_factory=lambda: defaultdict(list))
-    _backward: Dict[str, List[str]] = dataclass_field(default_factory=lambda: defaultdict(list))
+    # Node id <-> index; every id seen on a node or an edge gets one
+    _id_to_idx: Dict[str, int] = dataclass_field(default_factory=dict)
+    _idx_to_id: List[str] = dataclass_field(default_factory=list)
+
+    # Adjacency for fast traversal: per-index arrays of neighbour indices
+    _forward: List["array[int]"] = dataclass_field(default_factory=list)
+    _backward: List["array[int]"] = dataclass_field(default_factory=list)
     _edge_map: Dict[Tuple[str, str], LineageEdge] = dataclass_field(default_factory=dict)
+    # Source id -> positions of its edges in self.edges (edges are append-only)
+    _out_edges: Dict[str, List[int]] = dataclass_field(default_factory=lambda: defaultdict(list))
+
+    # Nodes with no incoming / outgoing edges, kept in node order (dicts as ordered sets)
+    _roots: Dict[str, None] = dataclass_field(default_factory=dict)
+    _sinks: Dict[str, None] = dataclass_field(default_factory=dict)
+
+    # Traversal memo: (node_id, max_depth) -> reachable ids; cleared on every change
+    _down_cache: Dict[Tuple[str, int], FrozenSet[str]] = dataclass_field(default_factory=dict, repr=False, compare=False)
+    _up_cache: Dict[Tuple[str, int], FrozenSet[str]] = dataclass_field(default_factory=dict, repr=False, compare=False)
+
+    # CSR form of _forward/_backward, packed by finalize(); dropped on every change
+    _csr_fwd: Optional[Tuple[Any, Any]] = dataclass_field(default=None, repr=False, compare=False)
+    _csr_bwd: Optional[Tuple[Any, Any]] = dataclass_field(default=None, repr=False, compare=False)
 
     def add_node(self, node: LineageNode) -> None:
         """Add a node to the graph."""
-        self.nodes[node.id] = node
+        self.add_nodes((node,))
 
     def add_edge(self, edge: LineageEdge) -> None:
         """Add an edge to the graph."""
-        self.edges.append(edge)
-        self._forward[edge.sourceId].append(edge.targetId)
-        self._backward[edge.targetId].append(edge.sourceId)
-        self._edge_map[(edge.sourceId, edge.targetId)] = edge
+        self.add_edges((edge,))
+
+    def add_nodes(self, nodes: Iterable[LineageNode]) -> None:
+        """Add nodes in bulk (same result as add_node for each)."""
+        self._invalidate()
+        by_id = self.nodes
+        to_idx = self._id_to_idx
+        intern_id = self._intern_id
+        forward = self._forward
+        backward = self._backward
+        for node in nodes:
+            node_id = node.id
+            by_id[node_id] = node
+            idx = to_idx.get(node_id)
+            if idx is None:
+                idx = intern_id(node_id)
+            # An id may already have edges from before it became a node
+            if not backward[idx]:
+                self._roots[node_id] = None
+            if not forward[idx]:
+                self._sinks[node_id] = None
+
+    def add_edges(self, edges: Iterable[LineageEdge]) -> None:
+        """Add edges in bulk (same result as add_edge for each).
+
+        Steps:
+          1.1 Invalidate traversal caches once for the whole batch
+          1.2 Resolve endpoint indices, interning unseen ids
+          1.3 Append to the edge list, adjacency arrays and edge indexes
+          1.4 The target is no longer a root, the source no longer a sink
+        """
+        self._invalidate()
+        append_edge = self.edges.append
+        pos = len(self.edges)
+        to_idx = self._id_to_idx
+        intern_id = self._intern_id
+        forward = self._forward
+        backward = self._backward
+        edge_map = self._edge_map
+        out_edges = self._out_edges
+        drop_root = self._roots.pop
+        drop_sink = self._sinks.pop
+        for edge in edges:
+            source_id = edge.sourceId
+            target_id = edge.targetId
+            src = to_idx.get(source_id)
+            if src is None:
+                src = intern_id(source_id)
+            tgt = to_idx.get(target_id)
+            if tgt is None:
+                tgt = intern_id(target_id)
+            append_edge(edge)
+            forward[src].append(tgt)
+            backward[tgt].append(src)
+            edge_map[(source_id, target_id)] = edge
+            out_edges[source_id].append(pos)
+            pos += 1
+            drop_root(target_id, None)
+            drop_sink(source_id, None)
+
+    def _intern_id(self, node_id: str) -> int:
+        idx = self._id_to_idx.get(node_id)
+        if idx is None:
+            idx = self._id_to_idx[node_id] = len(self._idx_to_id)
+            self._idx_to_id.append(node_id)
+            self._forward.append(array("i"))
+            self._backward.append(array("i"))
+        return idx
+
+    def _ids(self, indices: Any) -> List[str]:
+        names = self._idx_to_id
+        return [names[i] for i in indices]
+
+    def finalize(self) -> None:
+        """Pack adjacency into CSR arrays so traversals run compiled.
+
+        No-op without numba; adding nodes or edges afterwards drops the packing.
+        """
+        if NUMBA_AVAILABLE and self._csr_fwd is None:
+            self._csr_fwd = _pack_csr(self._forward)
+            self._csr_bwd = _pack_csr(self._backward)
+
+    def _invalidate(self) -> None:
+        self._csr_fwd = self._csr_bwd = None
+        if self._down_cache:
+            self._down_cache.clear()
+        if self._up_cache:
+            self._up_cache.clear()
 
     def get_node(self, node_id: str) -> Optional[LineageNode]:
         """Get a node by ID."""
@@ -125,59 +299,55 @@ class LineageGraph:
 
     def get_downstream(self, node_id: str) -> List[str]:
         """Get immediate downstream node IDs."""
-        return self._forward.get(node_id, [])
+        idx = self._id_to_idx.get(node_id)
+        return [] if idx is None else self._ids(self._forward[idx])
 
     def get_upstream(self, node_id: str) -> List[str]:
         """Get immediate upstream node IDs."""
-        return self._backward.get(node_id, [])
+        idx = self._id_to_idx.get(node_id)
+        return [] if idx is None else self._ids(self._backward[idx])
 
-    def traverse_downstream(self, node_id: str, max_depth: int = 100) -> Set[str]:
+    def traverse_downstream(self, node_id: str, max_depth: int = 100) -> FrozenSet[str]:
         """Traverse all downstream nodes (BFS).
 
         Steps:
-          1.1 Initialize with starting node
+          1.1 Return the memoized result for (node_id, max_depth)
           1.2 BFS through forward edges
           1.3 Track visited to avoid cycles
         """
-        visited: Set[str] = set()
-        queue = [(node_id, 0)]
-
-        while queue:
-            current, depth = queue.pop(0)
-            if current in visited or depth > max_depth:
-                continue
-            visited.add(current)
-
-            for next_id in self._forward.get(current, []):
-                if next_id not in visited:
-                    queue.append((next_id, depth + 1))
-
-        visited.discard(node_id)  # Don't include start node
-        return visited
+        key = (node_id, max_depth)
+        result = self._down_cache.get(key)
+        if result is None:
+            result = self._down_cache[key] = self._traverse(self._forward, self._csr_fwd, node_id, max_depth)
+        return result
 
-    def traverse_upstream(self, node_id: str, max_depth: int = 100) -> Set[str]:
+    def traverse_upstream(self, node_id: str, max_depth: int = 100) -> FrozenSet[str]:
         """Traverse all upstream nodes (BFS).
 
         Steps:
-          1.1 Initialize with starting node
+          1.1 Return the memoized result for (node_id, max_depth)
           1.2 BFS through backward edges
           1.3 Track visited to avoid cycles
         """
-        visited: Set[str] = set()
-        queue = [(node_id, 0)]
-
-        while queue:
-            current, depth = queue.pop(0)
-            if current in visited or depth > max_depth:
-                continue
-            visited.add(current)
-
-            for prev_id in self._backward.get(current, []):
-                if prev_id not in visited:
-                    queue.append((prev_id, depth + 1))
-
-        visited.discard(node_id)  # Don't include start node
-        return visited
+        key = (node_id, max_depth)
+        result = self._up_cache.get(key)
+        if result is None:
+            result = self._up_cache[key] = self._traverse(self._backward, self._csr_bwd, node_id, max_depth)
+        return result
+
+    def _traverse(
+        self,
+        adjacency: List["array[int]"],
+        csr: Optional[Tuple[Any, Any]],
+        node_id: str,
+        max_depth: int,
+    ) -> FrozenSet[str]:
+        idx = self._id_to_idx.get(node_id)
+        if idx is None or max_depth < 0:
+            return frozenset()
+        if csr is not None:
+            return frozenset(self._ids(_bfs_csr(csr[0], csr[1], idx, max_depth).tolist()))
+        return frozenset(self._ids(_bfs(adjacency, idx, max_depth)))
 
     def find_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
         """Find a path between two nodes (BFS).
@@ -190,44 +360,42 @@ class LineageGraph:
         if source_id == target_id:
             return [source_id]
 
-        visited: Set[str] = set()
-        parent: Dict[str, str] = {}
-        queue = [source_id]
+        source = self._id_to_idx.get(source_id)
+        target = self._id_to_idx.get(target_id)
+        if source is None or target is None:
+            return None
+
+        forward = self._forward
+        visited: Set[int] = {source}
+        parent: Dict[int, int] = {}
+        queue = deque([source])
 
         while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
+            current = queue.popleft()
 
-            for next_id in self._forward.get(current, []):
-                if next_id not in visited:
-                    parent[next_id] = current
-                    if next_id == target_id:
+            for next_idx in forward[current]:
+                if next_idx not in visited:
+                    visited.add(next_idx)
+                    parent[next_idx] = current
+                    if next_idx == target:
                         # Reconstruct path
-                        path = [target_id]
-                        node = target_id
+                        path = [target]
+                        node = target
                         while node in parent:
                             node = parent[node]
                             path.append(node)
-                        return list(reversed(path))
-                    queue.append(next_id)
+                        return self._ids(reversed(path))
+                    queue.append(next_idx)
 
         return None  # No path found
 
     def get_root_nodes(self) -> List[str]:
         """Get nodes with no incoming edges (sources)."""
-        return [
-            node_id for node_id in self.nodes
-            if not self._backward.get(node_id)
-        ]
+        return list(self._roots)
 
     def get_terminal_nodes(self) -> List[str]:
         """Get nodes with no outgoing edges (sinks)."""
-        return [
-            node_id for node_id in self.nodes
-            if not self._forward.get(node_id)
-        ]
+        return list(self._sinks)
 
     def subgraph(self, node_ids: Set[str]) -> 'LineageGraph':
         """Extract a subgraph containing only specified nodes."""
@@ -248,17 +416,14 @@ class LineageGraph:
         return {
             "nodeCount": len(self.nodes),
             "edgeCount": len(self.edges),
-            "rootNodes": len(self.get_root_nodes()),
-            "terminalNodes": len(self.get_terminal_nodes()),
+            "rootNodes": len(self._roots),
+            "terminalNodes": len(self._sinks),
             "nodesByType": self._count_by_type(),
         }
 
     def _count_by_type(self) -> Dict[str, int]:
         """Count nodes by type."""
-        counts: Dict[str, int] = defaultdict(int)
-        for node in self.nodes.values():
-            counts[node.nodeType.value] += 1
-        return dict(counts)
+        return dict(Counter(node.nodeType.value for node in self.nodes.values()))
 
 
 def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
@@ -270,8 +435,13 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
       1.3 Parse canonical tables and fields
       1.4 Parse mapping edges
       1.5 Parse physical deployment edges
+      1.6 Load nodes and edges in bulk and finalize adjacency
     """
     graph = LineageGraph()
+    nodes: List[LineageNode] = []
+    edges: List[LineageEdge] = []
+    add_node = nodes.append
+    add_edge = edges.append
     objs = snapshot.get("objects", {})
 
     # 1.1 Parse source systems
@@ -287,7 +457,7 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
     for src in sources:
         src_id = src.get("id") or src.get("SS_ID")
         src_code = src.get("code") or src.get("SS_Code", "Unknown")
-        graph.add_node(LineageNode(
+        add_node(LineageNode(
             id=f"src:{src_id}",
             name=src_code,
             nodeType=NodeType.SOURCE_SYSTEM,
@@ -301,8 +471,9 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
         src_id = obj.get("sourceSystemId") or obj.get("SS_ID")
         schema = obj.get("schema") or obj.get("SO_Schema")
 
-        graph.add_node(LineageNode(
-            id=f"src_obj:{obj_id}",
+        node_id = f"src_obj:{obj_id}"
+        add_node(LineageNode(
+            id=node_id,
             name=obj_name,
             nodeType=NodeType.SOURCE_OBJECT,
             schema=schema,
@@ -312,10 +483,11 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
 
         # Edge from source system to source object
         if src_id:
-            graph.add_edge(LineageEdge(
-                id=f"e:src:{src_id}->src_obj:{obj_id}",
-                sourceId=f"src:{src_id}",
-                targetId=f"src_obj:{obj_id}",
+            parent_id = f"src:{src_id}"
+            add_edge(LineageEdge(
+                id=f"e:{parent_id}->{node_id}",
+                sourceId=parent_id,
+                targetId=node_id,
                 edgeType=EdgeType.DIRECT,
             ))
 
@@ -325,8 +497,9 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
         fld_name = fld.get("name") or fld.get("SF_Name", "Unknown")
         obj_id = fld.get("sourceObjectId") or fld.get("SO_ID")
 
-        graph.add_node(LineageNode(
-            id=f"src_fld:{fld_id}",
+        node_id = f"src_fld:{fld_id}"
+        add_node(LineageNode(
+            id=node_id,
             name=fld_name,
             nodeType=NodeType.SOURCE_FIELD,
             field=fld_name,
@@ -335,10 +508,11 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
 
         # Edge from source object to source field
         if obj_id:
-            graph.add_edge(LineageEdge(
-                id=f"e:src_obj:{obj_id}->src_fld:{fld_id}",
-                sourceId=f"src_obj:{obj_id}",
-                targetId=f"src_fld:{fld_id}",
+            parent_id = f"src_obj:{obj_id}"
+            add_edge(LineageEdge(
+                id=f"e:{parent_id}->{node_id}",
+                sourceId=parent_id,
+                targetId=node_id,
                 edgeType=EdgeType.DIRECT,
             ))
 
@@ -351,8 +525,9 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
         tbl_code = tbl.get("code") or tbl.get("TB_Code", "Unknown")
         schema = tbl.get("schema") or tbl.get("TB_Schema", "dbo")
 
-        graph.add_node(LineageNode(
-            id=f"tbl:{tbl_id}",
+        tbl_node_id = f"tbl:{tbl_id}"
+        add_node(LineageNode(
+            id=tbl_node_id,
             name=tbl_code,
             nodeType=NodeType.CANONICAL_TABLE,
             schema=schema,
@@ -365,8 +540,9 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
             fld_id = fld.get("id") or fld.get("FD_ID")
             fld_code = fld.get("code") or fld.get("FD_Code", "Unknown")
 
-            graph.add_node(LineageNode(
-                id=f"fld:{fld_id}",
+            node_id = f"fld:{fld_id}"
+            add_node(LineageNode(
+                id=node_id,
                 name=fld_code,
                 nodeType=NodeType.CANONICAL_FIELD,
                 schema=schema,
@@ -376,10 +552,10 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
             ))
 
             # Edge from table to field
-            graph.add_edge(LineageEdge(
-                id=f"e:tbl:{tbl_id}->fld:{fld_id}",
-                sourceId=f"tbl:{tbl_id}",
-                targetId=f"fld:{fld_id}",
+            add_edge(LineageEdge(
+                id=f"e:{tbl_node_id}->{node_id}",
+                sourceId=tbl_node_id,
+                targetId=node_id,
                 edgeType=EdgeType.DIRECT,
             ))
 
@@ -392,7 +568,7 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
         edge_type = EdgeType.TRANSFORM if transform else EdgeType.DIRECT
 
         if src_fld_id and tgt_fld_id:
-            graph.add_edge(LineageEdge(
+            add_edge(LineageEdge(
                 id=f"e:map:{mf_id}",
                 sourceId=f"src_fld:{src_fld_id}",
                 targetId=f"fld:{tgt_fld_id}",
@@ -407,12 +583,9 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
         tgt_id = le.get("targetNodeId") or le.get("LE_TargetID")
         edge_type_str = le.get("edgeType") or le.get("LE_EdgeType", "direct")
 
-        try:
-            edge_type = EdgeType(edge_type_str.lower())
-        except ValueError:
-            edge_type = EdgeType.DIRECT
+        edge_type = _EDGE_TYPES.get(edge_type_str.lower(), EdgeType.DIRECT)
 
-        graph.add_edge(LineageEdge(
+        add_edge(LineageEdge(
             id=f"e:le:{le_id}",
             sourceId=src_id,
             targetId=tgt_id,
@@ -436,8 +609,9 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
         base_tbl = m.get("baseTableId") or m.get("TB_ID")
         base_fld = m.get("baseFieldId") or m.get("FD_ID")
 
-        graph.add_node(LineageNode(
-            id=f"metric:{m_id}",
+        node_id = f"metric:{m_id}"
+        add_node(LineageNode(
+            id=node_id,
             name=m_code,
             nodeType=NodeType.METRIC,
             metadata=m,
@@ -445,18 +619,24 @@ def build_lineage_graph(snapshot: Dict[str, Any]) -> LineageGraph:
 
         # Edge from base table/field to metric
         if base_fld:
-            graph.add_edge(LineageEdge(
-                id=f"e:fld:{base_fld}->metric:{m_id}",
-                sourceId=f"fld:{base_fld}",
-                targetId=f"metric:{m_id}",
+            parent_id = f"fld:{base_fld}"
+            add_edge(LineageEdge(
+                id=f"e:{parent_id}->{node_id}",
+                sourceId=parent_id,
+                targetId=node_id,
                 edgeType=EdgeType.AGGREGATE,
             ))
         elif base_tbl:
-            graph.add_edge(LineageEdge(
-                id=f"e:tbl:{base_tbl}->metric:{m_id}",
-                sourceId=f"tbl:{base_tbl}",
-                targetId=f"metric:{m_id}",
+            parent_id = f"tbl:{base_tbl}"
+            add_edge(LineageEdge(
+                id=f"e:{parent_id}->{node_id}",
+                sourceId=parent_id,
+                targetId=node_id,
                 edgeType=EdgeType.AGGREGATE,
             ))
 
+    # 1.6 Load nodes and edges in bulk and finalize adjacency
+    graph.add_nodes(nodes)
+    graph.add_edges(edges)
+    graph.finalize()
     return graph
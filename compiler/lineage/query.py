@@ -8,6 +8,7 @@ Steps:
 """
 
 from __future__ import annotations
+from collections import Counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from .graph import LineageGraph, LineageNode, LineageEdge, NodeType, EdgeType
@@ -52,20 +53,10 @@ def get_upstream(
     """
     upstream_ids = graph.traverse_upstream(node_id, max_depth)
 
-    # Filter by type if specified
-    if node_types:
-        upstream_ids = {
-            nid for nid in upstream_ids
-            if graph.get_node(nid) and graph.get_node(nid).nodeType in node_types
-        }
-
-    # Collect nodes and edges
-    nodes = [graph.get_node(nid) for nid in upstream_ids if graph.get_node(nid)]
-    edges = [
-        e for e in graph.edges
-        if e.targetId in upstream_ids or e.targetId == node_id
-        if e.sourceId in upstream_ids or e.sourceId == node_id
-    ]
+    # Filter by type if specified, then collect nodes and edges
+    nodes, kept_ids = _collect_nodes(graph, upstream_ids, node_types)
+    # Unfiltered, edges may end at ids that are not registered nodes
+    edges = _edges_within(graph, (kept_ids if node_types else upstream_ids) | {node_id})
 
     return LineageQueryResult(
         queryType="upstream",
@@ -95,20 +86,10 @@ def get_downstream(
     """
     downstream_ids = graph.traverse_downstream(node_id, max_depth)
 
-    # Filter by type if specified
-    if node_types:
-        downstream_ids = {
-            nid for nid in downstream_ids
-            if graph.get_node(nid) and graph.get_node(nid).nodeType in node_types
-        }
-
-    # Collect nodes and edges
-    nodes = [graph.get_node(nid) for nid in downstream_ids if graph.get_node(nid)]
-    edges = [
-        e for e in graph.edges
-        if e.sourceId in downstream_ids or e.sourceId == node_id
-        if e.targetId in downstream_ids or e.targetId == node_id
-    ]
+    # Filter by type if specified, then collect nodes and edges
+    nodes, kept_ids = _collect_nodes(graph, downstream_ids, node_types)
+    # Unfiltered, edges may end at ids that are not registered nodes
+    edges = _edges_within(graph, (kept_ids if node_types else downstream_ids) | {node_id})
 
     return LineageQueryResult(
         queryType="downstream",
@@ -153,7 +134,6 @@ def get_impact_analysis(
 
     # Collect impacted nodes with details
     impacted: List[Dict[str, Any]] = []
-    by_type: Dict[str, int] = {}
 
     for nid in downstream:
         n = graph.get_node(nid)
@@ -164,13 +144,13 @@ def get_impact_analysis(
                 "type": n.nodeType.value,
                 "path": n.full_path,
             })
-            by_type[n.nodeType.value] = by_type.get(n.nodeType.value, 0) + 1
+    by_type = dict(Counter(i["type"] for i in impacted))
 
     # Find critical path (longest path from node)
     critical_path = _find_longest_path(graph, node_id, downstream)
 
     # Generate recommendations
-    recommendations = _generate_recommendations(node, impacted, change_type)
+    recommendations = _generate_recommendations(node, impacted, by_type, change_type)
 
     return ImpactAnalysis(
         nodeId=node_id,
@@ -184,35 +164,98 @@ def get_impact_analysis(
     )
 
 
+def _collect_nodes(
+    graph: LineageGraph,
+    node_ids: Set[str],
+    node_types: Optional[List[NodeType]]
+) -> Tuple[List[LineageNode], Set[str]]:
+    """Nodes for node_ids (missing ids skipped, optionally filtered by type) and their ids."""
+    wanted = set(node_types) if node_types else None
+    get = graph.nodes.get
+    nodes: List[LineageNode] = []
+    kept_ids: Set[str] = set()
+    for nid in node_ids:
+        node = get(nid)
+        if node is None or (wanted is not None and node.nodeType not in wanted):
+            continue
+        nodes.append(node)
+        kept_ids.add(nid)
+    return nodes, kept_ids
+
+
+def _edges_within(graph: LineageGraph, node_ids: Set[str]) -> List[LineageEdge]:
+    """Edges with both ends in node_ids, read from the per-source edge index.
+
+    The index holds edge positions, so sorting them returns the edges in
+    insertion order whatever the set's iteration order.
+    """
+    edges = graph.edges
+    out_edges = graph._out_edges
+    return [edges[i] for i in sorted(
+        i for src in node_ids for i in out_edges.get(src, ())
+        if edges[i].targetId in node_ids
+    )]
+
+
 def _find_longest_path(
     graph: LineageGraph,
     start_id: str,
     downstream: Set[str]
 ) -> List[str]:
-    """Find the longest path from start through downstream nodes."""
+    """Find the longest path from start through downstream nodes.
+
+    Steps:
+      1.1 Order the downstream nodes children-first (iterative DFS post-order;
+          edges back onto the DFS path are ignored, so cycles cannot loop)
+      1.2 Longest path length from each node; the first successor wins ties
+      1.3 Follow the best successors from start
+    """
     if not downstream:
         return [start_id]
 
-    longest: List[str] = [start_id]
-
-    def dfs(current: str, path: List[str]) -> None:
-        nonlocal longest
-        if len(path) > len(longest):
-            longest = path.copy()
-
-        for next_id in graph.get_downstream(current):
-            if next_id in downstream and next_id not in path:
-                path.append(next_id)
-                dfs(next_id, path)
-                path.pop()
-
-    dfs(start_id, [start_id])
-    return longest
+    # Work on node indices; downstream ids all come from the graph's traversal
+    to_idx = graph._id_to_idx
+    forward = graph._forward
+    start = to_idx[start_id]
+    cone = {to_idx[nid] for nid in downstream}
+    length: Dict[int, int] = {}
+    best_next: Dict[int, int] = {}
+    on_path = {start}
+    stack = [(start, iter(forward[start]))]
+
+    while stack:
+        node, successors = stack[-1]
+        for next_idx in successors:
+            if next_idx in cone and next_idx not in on_path and next_idx not in length:
+                on_path.add(next_idx)
+                stack.append((next_idx, iter(forward[next_idx])))
+                break
+        else:
+            # 1.2 Every successor in the cone is finished (or a back edge)
+            stack.pop()
+            on_path.discard(node)
+            node_len, node_next = 1, None
+            for next_idx in forward[node]:
+                next_len = length.get(next_idx)
+                if next_len is not None and next_idx in cone and next_len >= node_len:
+                    node_len, node_next = next_len + 1, next_idx
+            length[node] = node_len
+            if node_next is not None:
+                best_next[node] = node_next
+
+    # 1.3 Reconstruct
+    path = [start]
+    node = start
+    while node in best_next:
+        node = best_next[node]
+        path.append(node)
+    return graph._ids(path)
 
 
 def _generate_recommendations(
     node: LineageNode,
     impacted: List[Dict[str, Any]],
+    by_type: Dict[str, int],
     change_type: str
 ) -> List[str]:
     """Generate recommendations based on impact analysis."""
@@ -223,9 +266,9 @@ def _generate_recommendations(
         return recs
 
     # Count by type
-    metrics = sum(1 for i in impacted if i["type"] == "metric")
-    reports = sum(1 for i in impacted if i["type"] == "report")
-    tables = sum(1 for i in impacted if "table" in i["type"])
+    metrics = by_type.get("metric", 0)
+    reports = by_type.get("report", 0)
+    tables = sum(count for t, count in by_type.items() if "table" in t)
 
     if metrics > 0:
         recs.append(f"⚠️  {metrics} metric(s) depend on this field. Verify formula compatibility.")
@@ -264,17 +307,18 @@ def get_root_sources(
       1.2 Filter to source types only
     """
     upstream = graph.traverse_upstream(node_id)
+    graph_roots = graph._roots
     roots = []
 
     for nid in upstream:
-        node = graph.get_node(nid)
-        if node and node.nodeType in (
-            NodeType.SOURCE_SYSTEM,
-            NodeType.SOURCE_OBJECT,
-            NodeType.SOURCE_FIELD,
-        ):
-            # Check if this is a true root (no upstream)
-            if not graph.get_upstream(nid):
+        # A true root: a node with no upstream
+        if nid in graph_roots:
+            node = graph.nodes[nid]
+            if node.nodeType in (
+                NodeType.SOURCE_SYSTEM,
+                NodeType.SOURCE_OBJECT,
+                NodeType.SOURCE_FIELD,
+            ):
                 roots.append(node)
 
     return roots
@@ -291,12 +335,12 @@ def get_terminal_sinks(
       1.2 Filter to consumer types only
     """
     downstream = graph.traverse_downstream(node_id)
+    graph_sinks = graph._sinks
     terminals = []
 
     for nid in downstream:
-        node = graph.get_node(nid)
-        if node and not graph.get_downstream(nid):
-            terminals.append(node)
+        if nid in graph_sinks:
+            terminals.append(graph.nodes[nid])
 
     return terminals
 
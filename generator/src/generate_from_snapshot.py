@@ -97,6 +97,21 @@ def sql_type(field: Dict[str, Any]) -> str:
     return "nvarchar(200)"
 
 
+# Audit columns and block terminator shared by every generated data-plane table
+_DATA_PLANE_TABLE_TAIL = (
+    "    _CreateDate datetime2(3) NOT NULL DEFAULT (sysutcdatetime()),",
+    "    _CreatedBy nvarchar(128) NULL,",
+    "    _UpdateDate datetime2(3) NULL,",
+    "    _UpdatedBy nvarchar(128) NULL,",
+    "    _DeleteDate datetime2(3) NULL,",
+    "    _DeletedBy nvarchar(128) NULL",
+    "  );",
+    "END",
+    "GO",
+    "",
+)
+
+
 def emit_data_plane_sql(tables: List[Table]) -> str:
     lines: List[str] = [
         "/* Generated Data Plane DDL (starter) */",
@@ -135,18 +150,7 @@ def emit_data_plane_sql(tables: List[Table]) -> str:
                 name = f.get("code", "Field")
                 nullable = bool(f.get("nullable", True))
                 lines.append(f"    [{name}] {sql_type(f)} {'NULL' if nullable else 'NOT NULL'},")
-        lines += [
-            "    _CreateDate datetime2(3) NOT NULL DEFAULT (sysutcdatetime()),",
-            "    _CreatedBy nvarchar(128) NULL,",
-            "    _UpdateDate datetime2(3) NULL,",
-            "    _UpdatedBy nvarchar(128) NULL,",
-            "    _DeleteDate datetime2(3) NULL,",
-            "    _DeletedBy nvarchar(128) NULL",
-            "  );",
-            "END",
-            "GO",
-            "",
-        ]
+        lines += _DATA_PLANE_TABLE_TAIL
     return "\n".join(lines)
 
 
@@ -214,6 +218,17 @@ END
 GO
 """
 
+# Fixed columns of every generated enum lookup table
+_ENUM_TABLE_COLS = (
+    "    SortOrder int NOT NULL CONSTRAINT df_Sort DEFAULT (0),",
+    "    IsDefault bit NOT NULL CONSTRAINT df_IsDefault DEFAULT (0),",
+    "    _CreateDate datetime2(3) NOT NULL DEFAULT (sysutcdatetime()),",
+    "    _CreatedBy nvarchar(128) NULL,",
+    "    _DeleteDate datetime2(3) NULL,",
+    "    _DeletedBy nvarchar(128) NULL,",
+)
+
+
 def emit_enums_sql(snapshot: Dict[str, Any]) -> str:
     enums = snapshot.get("objects", {}).get("enums", {})
     if isinstance(enums, list):
@@ -233,12 +248,7 @@ def emit_enums_sql(snapshot: Dict[str, Any]) -> str:
             "BEGIN",
             f"  CREATE TABLE {table} (",
             f"    {code}_Code nvarchar(80) NOT NULL,",
-            "    SortOrder int NOT NULL CONSTRAINT df_Sort DEFAULT (0),",
-            "    IsDefault bit NOT NULL CONSTRAINT df_IsDefault DEFAULT (0),",
-            "    _CreateDate datetime2(3) NOT NULL DEFAULT (sysutcdatetime()),",
-            "    _CreatedBy nvarchar(128) NULL,",
-            "    _DeleteDate datetime2(3) NULL,",
-            "    _DeletedBy nvarchar(128) NULL,",
+            *_ENUM_TABLE_COLS,
             f"    CONSTRAINT pk_{code} PRIMARY KEY ({code}_Code)",
             "  );",
             "END",
@@ -0,0 +1,65 @@
+/* Generated Workflow Definitions (seed tables) */
+CREATE SCHEMA wfd;
+GO
+
+IF OBJECT_ID('wfd.Workflow','U') IS NULL
+BEGIN
+  CREATE TABLE wfd.Workflow(
+    WF_ID uniqueidentifier NOT NULL CONSTRAINT pk_wfd_WF PRIMARY KEY,
+    WF_Code nvarchar(120) NOT NULL,
+    WF_ConfigJSON nvarchar(max) NULL,
+    _CreateDate datetime2(3) NOT NULL DEFAULT (sysutcdatetime()),
+    _CreatedBy nvarchar(128) NULL,
+    _DeleteDate datetime2(3) NULL,
+    _DeletedBy nvarchar(128) NULL
+  );
+  CREATE UNIQUE INDEX ix_wfd_WF_Code ON wfd.Workflow(WF_Code) WHERE _DeleteDate IS NULL;
+END
+GO
+
+IF OBJECT_ID('wfd.State','U') IS NULL
+BEGIN
+  CREATE TABLE wfd.State(
+    ST_ID uniqueidentifier NOT NULL CONSTRAINT pk_wfd_ST PRIMARY KEY,
+    WF_ID uniqueidentifier NOT NULL,
+    ST_Code nvarchar(120) NOT NULL,
+    ST_IsInitial bit NOT NULL DEFAULT (0),
+    ST_IsTerminal bit NOT NULL DEFAULT (0),
+    ST_SlaMinutes int NULL,
+    ST_ConfigJSON nvarchar(max) NULL,
+    CONSTRAINT fk_wfd_ST_WF FOREIGN KEY (WF_ID) REFERENCES wfd.Workflow(WF_ID)
+  );
+  CREATE INDEX ix_wfd_ST_WF ON wfd.State(WF_ID, ST_Code);
+END
+GO
+
+IF OBJECT_ID('wfd.Transition','U') IS NULL
+BEGIN
+  CREATE TABLE wfd.Transition(
+    TRN_ID uniqueidentifier NOT NULL CONSTRAINT pk_wfd_TRN PRIMARY KEY,
+    WF_ID uniqueidentifier NOT NULL,
+    TRN_Code nvarchar(120) NOT NULL,
+    FromST_ID uniqueidentifier NULL,
+    ToST_ID uniqueidentifier NOT NULL,
+    TRN_GuardDSL nvarchar(max) NULL,
+    TRN_ActionDSL nvarchar(max) NULL,
+    TRN_ApprovalPolicyID uniqueidentifier NULL,
+    TRN_ConfigJSON nvarchar(max) NULL,
+    CONSTRAINT fk_wfd_TRN_WF FOREIGN KEY (WF_ID) REFERENCES wfd.Workflow(WF_ID),
+    CONSTRAINT fk_wfd_TRN_From FOREIGN KEY (FromST_ID) REFERENCES wfd.State(ST_ID),
+    CONSTRAINT fk_wfd_TRN_To FOREIGN KEY (ToST_ID) REFERENCES wfd.State(ST_ID)
+  );
+  CREATE INDEX ix_wfd_TRN_WF ON wfd.Transition(WF_ID);
+END
+GO
+
+-- Seed workflows/states/transitions from snapshot
+IF NOT EXISTS (SELECT 1 FROM wfd.Workflow WHERE WF_ID = '00000000-0000-0000-0000-000000000701') INSERT INTO wfd.Workflow(WF_ID, WF_Code, WF_ConfigJSON) VALUES ('00000000-0000-0000-0000-000000000701', 'CaseLifecycle', '{}');
+GO
+IF NOT EXISTS (SELECT 1 FROM wfd.State WHERE ST_ID = '00000000-0000-0000-0000-000000000711') INSERT INTO wfd.State(ST_ID, WF_ID, ST_Code, ST_IsInitial, ST_IsTerminal, ST_SlaMinutes, ST_ConfigJSON) VALUES ('00000000-0000-0000-0000-000000000711', '00000000-0000-0000-0000-000000000701', 'NEW', 1, 0, 1440, '{}');
+IF NOT EXISTS (SELECT 1 FROM wfd.State WHERE ST_ID = '00000000-0000-0000-0000-000000000712') INSERT INTO wfd.State(ST_ID, WF_ID, ST_Code, ST_IsInitial, ST_IsTerminal, ST_SlaMinutes, ST_ConfigJSON) VALUES ('00000000-0000-0000-0000-000000000712', '00000000-0000-0000-0000-000000000701', 'REVIEW', 0, 0, 2880, '{}');
+IF NOT EXISTS (SELECT 1 FROM wfd.State WHERE ST_ID = '00000000-0000-0000-0000-000000000713') INSERT INTO wfd.State(ST_ID, WF_ID, ST_Code, ST_IsInitial, ST_IsTerminal, ST_SlaMinutes, ST_ConfigJSON) VALUES ('00000000-0000-0000-0000-000000000713', '00000000-0000-0000-0000-000000000701', 'CLOSED', 0, 1, NULL, '{}');
+GO
+IF NOT EXISTS (SELECT 1 FROM wfd.Transition WHERE TRN_ID = '00000000-0000-0000-0000-000000000721') INSERT INTO wfd.Transition(TRN_ID, WF_ID, TRN_Code, FromST_ID, ToST_ID, TRN_GuardDSL, TRN_ActionDSL, TRN_ApprovalPolicyID, TRN_ConfigJSON) VALUES ('00000000-0000-0000-0000-000000000721', '00000000-0000-0000-0000-000000000701', 'Submit', '00000000-0000-0000-0000-000000000711', '00000000-0000-0000-0000-000000000712', 'allow', '', NULL, '{}');
+IF NOT EXISTS (SELECT 1 FROM wfd.Transition WHERE TRN_ID = '00000000-0000-0000-0000-000000000722') INSERT INTO wfd.Transition(TRN_ID, WF_ID, TRN_Code, FromST_ID, ToST_ID, TRN_GuardDSL, TRN_ActionDSL, TRN_ApprovalPolicyID, TRN_ConfigJSON) VALUES ('00000000-0000-0000-0000-000000000722', '00000000-0000-0000-0000-000000000701', 'Close', '00000000-0000-0000-0000-000000000712', '00000000-0000-0000-0000-000000000713', 'allow', '', NULL, '{}');
+GO
\ No newline at end of file
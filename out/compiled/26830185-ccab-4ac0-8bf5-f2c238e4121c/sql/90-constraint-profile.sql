@@ -0,0 +1 @@
+/* ConstraintProfile: pass-3 will compile naming/index/enforcement rules from Meta.ConstraintProfile */
@@ -0,0 +1,2 @@
+# No jobs defined in snapshot
+# Scheduler: airflow
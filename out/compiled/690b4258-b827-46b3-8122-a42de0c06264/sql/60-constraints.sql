@@ -0,0 +1,2 @@
+/* Generated Constraints (PK/FK) */
+/* Notes: extend to composite keys, deferrable FKs, check constraints */
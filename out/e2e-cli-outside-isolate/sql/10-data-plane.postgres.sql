@@ -0,0 +1,11 @@
+-- Generated Postgres DDL (starter)
+CREATE SCHEMA IF NOT EXISTS "dp";
+CREATE TABLE IF NOT EXISTS "dp"."Transaction" (
+  "TR_ID" uuid NOT NULL,
+  "TREM_ID" uuid NOT NULL,
+  "TREM_ApprovedBy" uuid,
+  "_TenantID" uuid NOT NULL,
+  CONSTRAINT pk_transaction PRIMARY KEY ("TR_ID")
+);
+
+-- RLS: enable row level security and add policies using _TenantID
\ No newline at end of file
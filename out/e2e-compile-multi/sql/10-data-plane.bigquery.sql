@@ -0,0 +1,9 @@
+-- BigQuery DDL (starter) dataset=dp
+CREATE TABLE IF NOT EXISTS `dp.Transaction` (
+  TR_ID STRING NOT NULL,
+  TREM_ID STRING NOT NULL,
+  TREM_ApprovedBy STRING,
+  _TenantID STRING NOT NULL
+);
+
+-- Security: emit Row Access Policies / Authorized Views (future)
\ No newline at end of file
@@ -0,0 +1,11 @@
+-- Redshift DDL (starter) schema=dp
+CREATE SCHEMA IF NOT EXISTS dp;
+
+CREATE TABLE IF NOT EXISTS dp.Transaction (
+  TR_ID VARCHAR(36) NOT NULL,
+  TREM_ID VARCHAR(36) NOT NULL,
+  TREM_ApprovedBy VARCHAR(36),
+  _TenantID VARCHAR(36) NOT NULL
+);
+
+-- Security: views-first + GRANTs (future)
\ No newline at end of file
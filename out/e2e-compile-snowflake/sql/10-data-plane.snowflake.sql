@@ -0,0 +1,28 @@
+-- Generated Snowflake DDL
+-- OZMetaDB Compiler
+
+-- Note: Run with appropriate role and warehouse
+-- USE ROLE SYSADMIN;
+-- USE WAREHOUSE COMPUTE_WH;
+
+CREATE SCHEMA IF NOT EXISTS "DP";
+
+CREATE TABLE IF NOT EXISTS "DP"."TRANSACTION" (
+    "TR_ID" VARCHAR(36) NOT NULL,
+    "TREM_ID" VARCHAR(36) NOT NULL,
+    "TREM_ApprovedBy" VARCHAR(36),
+    "_TenantID" VARCHAR(36) NOT NULL,
+    "_CreateDate" TIMESTAMP_NTZ NOT NULL DEFAULT CURRENT_TIMESTAMP(),
+    "_CreatedBy" VARCHAR(128),
+    "_UpdateDate" TIMESTAMP_NTZ,
+    "_UpdatedBy" VARCHAR(128),
+    "_DeleteDate" TIMESTAMP_NTZ,
+    "_DeletedBy" VARCHAR(128)
+);
+
+ALTER TABLE "DP"."TRANSACTION" CLUSTER BY ("_CreateDate");
+
+-- Row Access Policies (RLS)
+-- Create row access policy for multi-tenant filtering:
+-- CREATE OR REPLACE ROW ACCESS POLICY tenant_filter AS (tenant_id VARCHAR)
+--   RETURNS BOOLEAN -> tenant_id = CURRENT_SESSION()::VARIANT:tenant_id;
@@ -0,0 +1,40 @@
+-- Generated Spark SQL / Databricks DDL
+-- OZMetaDB Compiler
+
+-- Catalog: main
+-- Unity Catalog: True
+
+USE CATALOG main;
+
+CREATE SCHEMA IF NOT EXISTS dp;
+
+CREATE TABLE IF NOT EXISTS dp.Transaction (
+    TR_ID STRING NOT NULL,
+    TREM_ID STRING NOT NULL,
+    TREM_ApprovedBy STRING,
+    _TenantID STRING NOT NULL,
+    _CreateDate TIMESTAMP NOT NULL,
+    _CreatedBy STRING,
+    _UpdateDate TIMESTAMP,
+    _UpdatedBy STRING,
+    _DeleteDate TIMESTAMP,
+    _DeletedBy STRING
+)
+USING DELTA
+PARTITIONED BY (_TenantID)
+TBLPROPERTIES (
+    'delta.autoOptimize.optimizeWrite' = 'true',
+    'delta.autoOptimize.autoCompact' = 'true',
+    'delta.deletedFileRetentionDuration' = 'interval 30 days',
+    'delta.logRetentionDuration' = 'interval 90 days'
+);
+
+-- OPTIMIZE dp.Transaction ZORDER BY (TR_ID, _CreateDate);
+
+-- Row-Level Security (Unity Catalog)
+-- Use row filters for multi-tenant access:
+-- ALTER TABLE schema.table SET ROW FILTER tenant_filter ON (_TenantID);
+
+-- CREATE FUNCTION tenant_filter(tenant_id STRING)
+--   RETURNS BOOLEAN
+--   RETURN tenant_id = current_user_tenant();
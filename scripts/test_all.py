@@ -40,6 +40,96 @@ def test(name: str, cmd: list[str], expected_code: int = 0) -> bool:
             print(f"         {line}")
     return ok
 
+def test_partial_validation() -> bool:
+    """Test that partial (touched-sections) validation keeps the objects rules."""
+    try:
+        import copy
+        import json
+        sys.path.insert(0, str(ROOT / "api"))
+        from ozmetadb_api.config import settings
+        from ozmetadb_api.apply_engine import validate_snapshot
+
+        settings.schema_path = str(ROOT / "exports/spec/ozmeta.metadata.snapshot.schema.json")
+        sample = json.loads((ROOT / "exports/samples/sample.snapshot.json").read_text(encoding="utf-8"))
+        touched = {"model", "workflows"}
+        assert validate_snapshot(sample)[0], "Sample should pass full validation"
+        assert validate_snapshot(sample, touched)[0], "Sample should pass partial validation"
+
+        # Snapshots rejected in full must be rejected when only the CR's sections are checked
+        unknown = copy.deepcopy(sample)
+        unknown["objects"]["bogus"] = {}
+        missing = copy.deepcopy(sample)
+        del missing["objects"]["workflows"]
+        for name, snap in (("unknown objects key", unknown), ("missing touched section", missing)):
+            assert not validate_snapshot(snap)[0], f"{name}: should fail full validation"
+            assert not validate_snapshot(snap, touched)[0], f"{name}: should fail partial validation"
+
+        print("  [PASS] 1.3 Partial validation keeps objects rules")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] 1.3 Partial validation keeps objects rules")
+        print(f"         {e}")
+        return False
+
+
+def test_multi_target_parity(targets: list[str]) -> bool:
+    """Test that a comma-separated --target matches each single-target run byte for byte."""
+    try:
+        import shutil
+        out = ROOT / "out/e2e-compile-multi"
+        shutil.rmtree(out, ignore_errors=True)
+        code, output = run([sys.executable, "-m", "compiler.compile",
+                            "--snapshot", "exports/samples/sample.snapshot.json",
+                            "--target", ",".join(targets),
+                            "--out", str(out)])
+        assert code == 0, output.strip()
+
+        expected = {}
+        for target in targets:
+            single = ROOT / f"out/e2e-compile-{target}"
+            for f in single.rglob("*"):
+                if f.is_file():
+                    expected[f.relative_to(single).as_posix()] = f.read_bytes()
+        actual = {f.relative_to(out).as_posix(): f.read_bytes() for f in out.rglob("*") if f.is_file()}
+        assert actual.keys() == expected.keys(), f"File sets differ: {sorted(actual.keys() ^ expected.keys())}"
+        diff = sorted(k for k in expected if actual[k] != expected[k])
+        assert not diff, f"Output differs from single-target runs: {diff}"
+
+        print("  [PASS] 2.6 Multi-target output matches single targets")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] 2.6 Multi-target output matches single targets")
+        print(f"         {e}")
+        return False
+
+
+def test_cli_outside_repo() -> bool:
+    """Test that compile resolves relative paths the same in-process and with --isolate."""
+    try:
+        import shutil
+        import tempfile
+        outputs = {}
+        with tempfile.TemporaryDirectory() as cwd:
+            for mode, flags in (("in-process", []), ("isolate", ["--isolate"])):
+                out = f"out/e2e-cli-outside-{mode}"
+                shutil.rmtree(ROOT / out, ignore_errors=True)
+                code, output = run([sys.executable, str(ROOT / "cli/ozmeta.py"), *flags, "compile",
+                                    "--snapshot", "exports/samples/sample.snapshot.json",
+                                    "--target", "postgres", "--out", out], cwd=Path(cwd))
+                assert code == 0, f"{mode}: exit {code}: {output.strip()[-300:]}"
+                outputs[mode] = {f.relative_to(ROOT / out).as_posix(): f.read_bytes()
+                                 for f in (ROOT / out).rglob("*") if f.is_file()}
+        assert outputs["in-process"], "Should write output under the repo root"
+        assert outputs["in-process"] == outputs["isolate"], "Modes should write the same files"
+
+        print("  [PASS] 3.7 CLI compile from outside the repo")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] 3.7 CLI compile from outside the repo")
+        print(f"         {e}")
+        return False
+
+
 def test_dsl_compiler() -> bool:
     """Test DSL compiler functionality."""
     try:
@@ -87,6 +177,61 @@ def test_dsl_compiler() -> bool:
         return False
 
 
+def test_python_guard_parity() -> bool:
+    """Python guard target must filter exactly like the SQL target, NULLs included."""
+    try:
+        import sqlite3
+        sys.path.insert(0, str(ROOT))
+        from compiler.dsl import compile_guard_to_python, compiler_for
+        from compiler.dsl.compiler import guard_expr
+
+        def ref(path): return {"ref": path}
+        def lit(value): return {"lit": value}
+        def op(name, *args): return {"op": name, "args": list(args)}
+
+        gt_x = op("gt", ref("x"), lit(5))
+        guards = [
+            "tenant",
+            {"expr": op("not", gt_x)},
+            {"expr": op("eq", ref("x"), lit(None))},
+            {"expr": op("ne", ref("x"), lit(3))},
+            {"expr": op("not", op("and", gt_x, op("eq", ref("s"), lit("abc"))))},
+            {"expr": op("not", op("or", gt_x, op("isnull", ref("s"))))},
+            {"expr": op("or", op("eq", ref("_TenantID"), ref("context.tenantId")), op("isnull", ref("x")))},
+            {"expr": op("in", ref("x"), lit(3), lit(None))},
+            {"expr": op("not", op("in", ref("x"), lit(7), lit(None)))},
+            {"expr": op("not", op("contains", ref("s"), lit("b")))},
+            {"expr": op("not", op("startswith", ref("s"), lit("a")))},
+            {"expr": op("not", op("endswith", ref("s"), lit("z")))},
+            {"expr": op("isnotnull", ref("s"))},
+        ]
+        rows = [{}, {"x": None, "s": None}, {"x": 3, "s": "abc", "_TenantID": 1}, {"x": 7, "s": "zzz", "_TenantID": 2}]
+        contexts = [{}, {"tenantId": 1}]
+
+        db = sqlite3.connect(":memory:")
+        db.execute('CREATE TABLE t ("x" INTEGER, "s" TEXT, "_TenantID" INTEGER)')
+        sql_compiler = compiler_for("ansi")
+        for dsl in guards:
+            where = sql_compiler.compile_expr(guard_expr(dsl), {"context.tenantId": ":tenantId"})
+            guard = compile_guard_to_python(dsl)
+            for row in rows:
+                db.execute("DELETE FROM t")
+                db.execute('INSERT INTO t VALUES (?, ?, ?)', (row.get("x"), row.get("s"), row.get("_TenantID")))
+                for ctx in contexts:
+                    (sql_result,), = db.execute(
+                        f"SELECT CASE WHEN {where} THEN 1 ELSE 0 END FROM t", {"tenantId": ctx.get("tenantId")}
+                    )
+                    py_result = guard(row, ctx)
+                    assert py_result == bool(sql_result), f"{guard.source} on {row} {ctx}: python {py_result}, SQL {where} {bool(sql_result)}"
+
+        print("  [PASS] 4.2 Python guard target matches SQL on NULLs")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] 4.2 Python guard target matches SQL on NULLs")
+        print(f"         {e}")
+        return False
+
+
 def test_metrics_compiler() -> bool:
     """Test metrics compiler functionality."""
     try:
@@ -136,7 +281,7 @@ def test_job_compiler() -> bool:
     try:
         import sys
         sys.path.insert(0, str(ROOT))
-        from compiler.jobs import compile_job, SCHEDULER_AIRFLOW, SCHEDULER_DATABRICKS
+        from compiler.jobs import compile_job, SCHEDULER_AIRFLOW, SCHEDULER_DATABRICKS, SCHEDULER_FABRIC
 
         job = {
             'code': 'test-etl',
@@ -157,6 +302,11 @@ def test_job_compiler() -> bool:
         assert '"tasks"' in result.code, "Should have tasks array"
         assert result.fileExtension == '.json', "Should be JSON file"
 
+        # JSON targets write floats exactly as json.dumps does
+        params = dict(job, code='float-etl', parameters={'eps': 1e-05, 'missing': float('nan')})
+        result = compile_job(params, SCHEDULER_FABRIC)
+        assert '"eps": 1e-05' in result.code and '"missing": NaN' in result.code, "Floats should match json.dumps"
+
         print("  [PASS] 6.2 Job compiler")
         return True
     except Exception as e:
@@ -165,6 +315,95 @@ def test_job_compiler() -> bool:
         return False
 
 
+def test_job_compile_cache() -> bool:
+    """Test compile_job caching keyed on the job fingerprint."""
+    try:
+        import sys
+        sys.path.insert(0, str(ROOT))
+        from compiler.jobs import compile_job, SCHEDULER_AIRFLOW, SCHEDULER_CRON
+
+        job = {
+            'code': 'cache-etl',
+            'name': 'Cache ETL',
+            'steps': [
+                {'code': 'step1', 'name': 'Step 1', 'type': 'sql', 'command': 'SELECT 1'},
+                {'code': 'step2', 'name': 'Step 2', 'type': 'python', 'dependsOn': ['step1']},
+            ],
+        }
+
+        # Identical definitions (even separate dicts) share one result per scheduler
+        first = compile_job(job, SCHEDULER_CRON)
+        assert compile_job(dict(job), SCHEDULER_CRON) is first, "Same job should hit the cache"
+        assert compile_job(job, SCHEDULER_AIRFLOW) is not first, "Scheduler is part of the key"
+
+        # Any field change is a new fingerprint
+        changed = dict(job, steps=[dict(job['steps'][0], command='SELECT 2'), job['steps'][1]])
+        result = compile_job(changed, SCHEDULER_CRON)
+        assert result is not first and 'SELECT 2' in result.code, "Changed job should recompile"
+        assert 'SELECT 2' not in first.code, "Cached result should be untouched"
+
+        # Shared results are read-only
+        assert isinstance(first.dependencies, tuple), "dependencies should be immutable"
+        try:
+            first.code = ''
+            raise AssertionError("CompiledJob should be frozen")
+        except AttributeError:
+            pass
+
+        print("  [PASS] 6.3 Job compile cache")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] 6.3 Job compile cache")
+        print(f"         {e}")
+        return False
+
+
+def test_job_step_order() -> bool:
+    """Test job step ordering: cycles raise, unknown dependencies are skipped."""
+    try:
+        import sys
+        sys.path.insert(0, str(ROOT))
+        from compiler.jobs.compiler import parse_job, _topological_sort
+
+        def order(steps):
+            job = parse_job({'code': 'order-etl', 'name': 'Order ETL', 'steps': steps})
+            return [s.code for s in _topological_sort(job.steps)]
+
+        def cycle(steps):
+            try:
+                order(steps)
+            except ValueError as e:
+                return str(e)
+            raise AssertionError("Cycle should raise ValueError")
+
+        # Self-loop
+        msg = cycle([{'code': 'a', 'type': 'sql', 'dependsOn': ['a']}])
+        assert "['a', 'a']" in msg, f"Self-loop should be reported: {msg}"
+
+        # 3-node cycle, reported in dependency order around the loop
+        msg = cycle([
+            {'code': 'a', 'type': 'sql', 'dependsOn': ['c']},
+            {'code': 'b', 'type': 'sql', 'dependsOn': ['a']},
+            {'code': 'c', 'type': 'sql', 'dependsOn': ['b']},
+        ])
+        assert "['a', 'c', 'b', 'a']" in msg, f"Cycle path should be listed: {msg}"
+
+        # Unknown dependencies are skipped; known ones still order the steps
+        result = order([
+            {'code': 'b', 'type': 'sql', 'dependsOn': ['a', 'missing']},
+            {'code': 'a', 'type': 'sql', 'dependsOn': ['ghost']},
+            {'code': 'c', 'type': 'sql'},
+        ])
+        assert result == ['a', 'b', 'c'], f"Unexpected order: {result}"
+
+        print("  [PASS] 6.4 Job step ordering")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] 6.4 Job step ordering")
+        print(f"         {e}")
+        return False
+
+
 def test_lineage_compiler() -> bool:
     """Test lineage compiler functionality."""
     try:
@@ -172,7 +411,8 @@ def test_lineage_compiler() -> bool:
         sys.path.insert(0, str(ROOT))
         from compiler.lineage import (
             LineageGraph, LineageNode, LineageEdge, NodeType, EdgeType,
-            get_upstream, get_downstream, get_impact_analysis, to_mermaid, to_json
+            get_upstream, get_downstream, get_impact_analysis, to_mermaid, to_json,
+            build_lineage_graph,
         )
 
         # Build graph
@@ -186,9 +426,23 @@ def test_lineage_compiler() -> bool:
         # Test traversal
         upstream = get_upstream(graph, 'metric:1')
         assert len(upstream.nodes) == 2, "Should have 2 upstream nodes"
+        assert [e.id for e in upstream.edges] == ['e1', 'e2'], "Edges should keep insertion order"
 
         downstream = get_downstream(graph, 'src:1')
         assert len(downstream.nodes) == 2, "Should have 2 downstream nodes"
+        assert [e.id for e in downstream.edges] == ['e1', 'e2'], "Edges should keep insertion order"
+
+        # Explicit lineage edges may point at ids that are not nodes (reports, APIs)
+        snapshot = {'objects': {
+            'model': {'tables': [{'id': 1, 'code': 'Sales', 'fields': [{'id': 10, 'code': 'Amount'}]}]},
+            'lineage': {'lineageEdges': [{'id': 7, 'sourceNodeId': 'fld:10', 'targetNodeId': 'report:sales'}]},
+        }}
+        built = build_lineage_graph(snapshot)
+        downstream = get_downstream(built, 'tbl:1')
+        assert [e.id for e in downstream.edges] == ['e:tbl:1->fld:10', 'e:le:7'], "Should keep edges to non-node ids"
+        assert downstream.stats['edgeCount'] == 2, "edgeCount should include edges to non-node ids"
+        upstream = get_upstream(built, 'report:sales')
+        assert [e.id for e in upstream.edges] == ['e:tbl:1->fld:10', 'e:le:7'], "Should keep edges from a non-node start"
 
         # Test impact analysis
         impact = get_impact_analysis(graph, 'tgt:1', 'modify')
@@ -202,10 +456,10 @@ def test_lineage_compiler() -> bool:
         json_out = to_json(graph)
         assert '"nodes"' in json_out, "Should have nodes"
 
-        print("  [PASS] 6.3 Lineage compiler")
+        print("  [PASS] 6.5 Lineage compiler")
         return True
     except Exception as e:
-        print(f"  [FAIL] 6.3 Lineage compiler")
+        print(f"  [FAIL] 6.5 Lineage compiler")
         print(f"         {e}")
         return False
 
@@ -287,10 +541,12 @@ def main() -> int:
          "--golden", "tests/golden/sample",
          "--out", "out/e2e-golden"]
     ))
+    results.append(test_partial_validation())
 
     # 2.1-2.5 Compiler targets
     print("\n2. Compiler")
-    for target in ["postgres", "bigquery", "redshift", "snowflake", "spark"]:
+    targets = ["postgres", "bigquery", "redshift", "snowflake", "spark"]
+    for target in targets:
         results.append(test(
             f"2.x Compile to {target}",
             [sys.executable, "-m", "compiler.compile",
@@ -298,6 +554,7 @@ def main() -> int:
              "--target", target,
              "--out", f"out/e2e-compile-{target}"]
         ))
+    results.append(test_multi_target_parity(targets))
 
     # 3.1 CLI commands
     print("\n3. CLI")
@@ -335,10 +592,12 @@ def main() -> int:
          "--snapshot", "exports/samples/sample.snapshot.json",
          "--action", "stats"]
     ))
+    results.append(test_cli_outside_repo())
 
     # 4. DSL Compiler
     print("\n4. DSL Compiler")
     results.append(test_dsl_compiler())
+    results.append(test_python_guard_parity())
 
     # 5. Migration Runner
     print("\n5. Migration Runner")
@@ -348,6 +607,8 @@ def main() -> int:
     print("\n6. New Compilers")
     results.append(test_metrics_compiler())
     results.append(test_job_compiler())
+    results.append(test_job_compile_cache())
+    results.append(test_job_step_order())
     results.append(test_lineage_compiler())
 
     # 7. Summary